@@ -0,0 +1,301 @@
+import numpy as np
+import time
+
+from Acceleration.intersect import Intersection
+from settings import Settings
+
+class BVH:
+    # Matches `struct BVHNode` in Shaders/common.glsl (std430, 32 Bytes)
+    #   Interior Node: leftFirst = Left Child (Right Child = leftFirst + 1), count = 0
+    #   Leaf Node:     leftFirst = First Triangle,                           count = Triangles
+    NODE_DTYPE = np.dtype([
+        ("boundsMin", "<f4", 3),
+        ("leftFirst", "<i4"),
+        ("boundsMax", "<f4", 3),
+        ("count",     "<i4"),
+    ])
+
+    TRAVERSAL_COST    = 1.0
+    INTERSECTION_COST = 1.0
+
+    def __init__(
+            self,
+            vertices: np.ndarray,
+            indices:  np.ndarray,
+            bins:        int = Settings.BVH.BINS,
+            maxLeafSize: int = Settings.BVH.MAX_LEAF_SIZE
+        ) -> None:
+
+        self.bins        = bins
+        self.maxLeafSize = maxLeafSize
+
+        self.nodes = np.zeros(0, dtype=BVH.NODE_DTYPE)
+        self.order = np.zeros(0, dtype=np.int64)
+
+        self.buildTime = 0.0
+        self.maxDepth  = 0
+
+        self.build(vertices, indices)
+
+    @staticmethod
+    def fromBounds(
+            boundsMin: np.ndarray,
+            boundsMax: np.ndarray,
+            bins:        int = Settings.BVH.BINS,
+            maxLeafSize: int = Settings.BVH.MAX_LEAF_SIZE
+        ) -> "BVH":
+        # Tree over Arbitrary Boxes, e.g. Instance Bounds for a Top Level Structure
+        bvh = BVH.__new__(BVH)
+
+        bvh.bins        = bins
+        bvh.maxLeafSize = maxLeafSize
+
+        bvh.buildFromBounds(np.asarray(boundsMin, dtype=np.float32), np.asarray(boundsMax, dtype=np.float32))
+        return bvh
+
+    @staticmethod
+    def fromArrays(arrays: dict[str, np.ndarray]) -> "BVH":
+        # Rebuilds a Tree from toArrays(), e.g. Out of the Mesh Cache
+        bvh = BVH.__new__(BVH)
+
+        bvh.nodes = arrays["nodes"].view(BVH.NODE_DTYPE).reshape(-1)
+        bvh.order = arrays["order"]
+
+        bvh.bins, bvh.maxLeafSize, bvh.maxDepth = (int(value) for value in arrays["info"])
+        bvh.buildTime = 0.0
+
+        return bvh
+
+    def toArrays(self) -> dict[str, np.ndarray]:
+        return {
+            "nodes": self.nodes.view(np.uint8).reshape(len(self.nodes), BVH.NODE_DTYPE.itemsize),
+            "order": self.order,
+            "info":  np.array([self.bins, self.maxLeafSize, self.maxDepth], dtype=np.int64),
+        }
+
+    @property
+    def nodeCount(self) -> int:  return len(self.nodes)
+
+    @property
+    def leafCount(self) -> int:  return int(np.count_nonzero(self.nodes["count"]))
+
+    @property
+    def stats(self) -> dict:
+        leafSizes = self.nodes["count"][self.nodes["count"] > 0]
+
+        return {
+            "triangles":   len(self.order),
+            "nodes":       self.nodeCount,
+            "leaves":      len(leafSizes),
+            "maxDepth":    self.maxDepth,
+            "avgLeafSize": float(leafSizes.mean()) if len(leafSizes) else 0.0,
+            "maxLeafSize": int(leafSizes.max())    if len(leafSizes) else 0,
+            "bytes":       self.nodes.nbytes,
+            "buildTimeMs": self.buildTime * 1000.0,
+        }
+
+    def build(self, vertices: np.ndarray, indices: np.ndarray) -> None:
+        triangles = indices.reshape(-1, 3)
+        corners   = vertices[triangles][..., :3].astype(np.float32)  # (T, 3, 3)
+
+        self.buildFromBounds(corners.min(axis=1), corners.max(axis=1))
+
+    def buildFromBounds(self, triMin: np.ndarray, triMax: np.ndarray) -> None:
+        # Binned SAH, Built Breadth First so Every Node of a Level Is Split in One Vectorized Pass
+        startTime = time.perf_counter()
+
+        triangleCount = len(triMin)
+        centroids = (triMin + triMax) * 0.5
+
+        self.order = np.arange(triangleCount, dtype=np.int64)
+        self.nodes = np.zeros(max(1, 2 * triangleCount - 1), dtype=BVH.NODE_DTYPE)
+        self.maxDepth = 0
+
+        if triangleCount == 0:
+            # Empty Scene, Inverted Bounds Are Never Hit
+            self.nodes["boundsMin"] =  np.inf
+            self.nodes["boundsMax"] = -np.inf
+            self.buildTime = time.perf_counter() - startTime
+            return
+
+        nodesUsed = 1
+
+        # Active Segments of self.order, One per Node Still to Be Split
+        segNode  = np.zeros(1, dtype=np.int64)
+        segFirst = np.zeros(1, dtype=np.int64)
+        segCount = np.full(1, triangleCount, dtype=np.int64)
+
+        depth = 0
+        while len(segNode):
+            self.maxDepth = depth
+
+            # Flatten Every Segment into One Element List, Grouped by Segment
+            segStart = np.cumsum(segCount) - segCount
+            segOf    = np.repeat(np.arange(len(segNode)), segCount)
+            position = np.repeat(segFirst - segStart, segCount) + np.arange(segCount.sum())
+            tri      = self.order[position]
+
+            boundsMin   = np.minimum.reduceat(triMin[tri],    segStart, axis=0)
+            boundsMax   = np.maximum.reduceat(triMax[tri],    segStart, axis=0)
+            centroidMin = np.minimum.reduceat(centroids[tri], segStart, axis=0)
+            centroidMax = np.maximum.reduceat(centroids[tri], segStart, axis=0)
+
+            self.nodes["boundsMin"][segNode] = boundsMin
+            self.nodes["boundsMax"][segNode] = boundsMax
+
+            axis, threshold, split = self.findSplits(tri, segOf, segCount, triMin, triMax, centroids, boundsMin, boundsMax, centroidMin, centroidMax)
+
+            # Leaves Keep Their Range
+            leaves = ~split
+            self.nodes["leftFirst"][segNode[leaves]] = segFirst[leaves]
+            self.nodes["count"][segNode[leaves]]     = segCount[leaves]
+
+            if not np.any(split):  break
+
+            # Partition Elements of Split Segments by Their Centroid
+            elementSplit = split[segOf]
+            isLeft = centroids[tri, axis[segOf]] < threshold[segOf]
+
+            leftCount = np.bincount(segOf, weights=elementSplit & isLeft, minlength=len(segNode)).astype(np.int64)
+
+            # Degenerate Splits Fall Back to a Median Split Along the Axis
+            degenerate = split & ((leftCount == 0) | (leftCount == segCount))
+            if np.any(degenerate):
+                elements = np.flatnonzero(degenerate[segOf])
+                ranked   = elements[np.lexsort((centroids[tri[elements], axis[segOf[elements]]], segOf[elements]))]
+                rank     = np.arange(len(ranked)) - np.repeat(np.cumsum(segCount[degenerate]) - segCount[degenerate], segCount[degenerate])
+
+                isLeft[ranked] = rank < (segCount[segOf[ranked]] // 2)
+                leftCount[degenerate] = segCount[degenerate] // 2
+
+            # Stable Partition, Left Elements First Within Each Segment
+            partition = np.lexsort((~isLeft, segOf))
+            self.order[position] = tri[partition]
+
+            # Children Are Allocated in Adjacent Pairs
+            splitNodes = segNode[split]
+            children   = nodesUsed + 2 * np.arange(len(splitNodes))
+            nodesUsed += 2 * len(splitNodes)
+
+            self.nodes["leftFirst"][splitNodes] = children
+            self.nodes["count"][splitNodes]     = 0
+
+            splitFirst = segFirst[split]
+            splitLeft  = leftCount[split]
+
+            segNode  = np.concatenate((children,   children + 1))
+            segFirst = np.concatenate((splitFirst, splitFirst + splitLeft))
+            segCount = np.concatenate((splitLeft,  segCount[split] - splitLeft))
+            depth += 1
+
+        self.nodes = self.nodes[:nodesUsed].copy()
+        self.buildTime = time.perf_counter() - startTime
+
+    def findSplits(self, tri, segOf, segCount, triMin, triMax, centroids, boundsMin, boundsMax, centroidMin, centroidMax):
+        # Returns the Best (Axis, Threshold) per Segment and Whether It Beats Making a Leaf
+        segments = len(segCount)
+        bins     = self.bins
+
+        extent = centroidMax - centroidMin
+        scale  = np.where(extent > 0.0, bins / np.where(extent > 0.0, extent, 1.0), 0.0)
+        binIds = np.minimum(((centroids[tri] - centroidMin[segOf]) * scale[segOf]).astype(np.int64), bins - 1)
+
+        binMin   = np.full((segments * 3 * bins, 3),  np.inf, dtype=np.float32)
+        binMax   = np.full((segments * 3 * bins, 3), -np.inf, dtype=np.float32)
+        binCount = np.zeros(segments * 3 * bins, dtype=np.int64)
+
+        for axis in range(3):
+            key = (segOf * 3 + axis) * bins + binIds[:, axis]
+            np.minimum.at(binMin, key, triMin[tri])
+            np.maximum.at(binMax, key, triMax[tri])
+            binCount += np.bincount(key, minlength=len(binCount))
+
+        binMin   = binMin.reshape(segments, 3, bins, 3)
+        binMax   = binMax.reshape(segments, 3, bins, 3)
+        binCount = binCount.reshape(segments, 3, bins)
+
+        # Sweep Left to Right and Right to Left over the Bin Boundaries
+        leftMin   = np.minimum.accumulate(binMin, axis=2)[:, :, :-1]
+        leftMax   = np.maximum.accumulate(binMax, axis=2)[:, :, :-1]
+        rightMin  = np.minimum.accumulate(binMin[:, :, ::-1], axis=2)[:, :, ::-1][:, :, 1:]
+        rightMax  = np.maximum.accumulate(binMax[:, :, ::-1], axis=2)[:, :, ::-1][:, :, 1:]
+        leftCount = np.cumsum(binCount, axis=2)[:, :, :-1]
+
+        count = segCount[:, None, None]
+        cost  = leftCount * BVH.surfaceArea(leftMin, leftMax) + (count - leftCount) * BVH.surfaceArea(rightMin, rightMax)
+        cost  = np.where((leftCount > 0) & (leftCount < count), cost, np.inf).reshape(segments, -1)
+
+        best     = np.argmin(cost, axis=1)
+        bestCost = cost[np.arange(segments), best]
+        axis     = best // (bins - 1)
+        binIndex = best %  (bins - 1)
+
+        nodeArea  = np.maximum(BVH.surfaceArea(boundsMin, boundsMax), 1e-12)
+        splitCost = BVH.TRAVERSAL_COST + BVH.INTERSECTION_COST * bestCost / nodeArea
+        leafCost  = BVH.INTERSECTION_COST * segCount
+
+        # Unsplittable by Binning (All Centroids in One Bin), Split on the Longest Axis by Median
+        unbinned = ~np.isfinite(bestCost)
+        axis     = np.where(unbinned, np.argmax(boundsMax - boundsMin, axis=1), axis)
+
+        with np.errstate(divide="ignore"):
+            threshold = np.where(unbinned, np.inf, centroidMin[np.arange(segments), axis] + (binIndex + 1) / scale[np.arange(segments), axis])
+
+        split = (segCount > 1) & ((segCount > self.maxLeafSize) | (splitCost < leafCost))
+        return axis, threshold, split
+
+    @staticmethod
+    def surfaceArea(boundsMin, boundsMax) -> np.ndarray:
+        size = np.maximum(boundsMax - boundsMin, 0.0)
+        return 2.0 * (size[..., 0] * size[..., 1] + size[..., 1] * size[..., 2] + size[..., 2] * size[..., 0])
+
+    def reorder(self, indices: np.ndarray) -> np.ndarray:
+        # Triangles in Leaf Order, so Leaves Address a Contiguous Range of the Index Buffer
+        return np.ascontiguousarray(indices.reshape(-1, 3)[self.order].reshape(-1))
+
+    def intersect(self, origin, direction, v0, edge1, edge2, tMax=np.inf) -> tuple[float, int]:
+        # Stack Based Traversal Mirroring default.fsh, Triangle Arrays Must Be in BVH Order
+        origin    = np.asarray(origin,    dtype=np.float32)
+        direction = np.asarray(direction, dtype=np.float32)
+        invDirection = Intersection.safeInverse(direction)
+
+        closest  = tMax
+        triangle = -1
+
+        root  = self.nodes[0]
+        stack = [0] if np.isfinite(Intersection.rayAABB(origin, invDirection, root["boundsMin"], root["boundsMax"], closest)) else []
+        while stack:
+            node = self.nodes[stack.pop()]
+
+            if node["count"] > 0:
+                tris = slice(node["leftFirst"], node["leftFirst"] + node["count"])
+                t, _, _ = Intersection.rayTriangles(origin, direction, v0[tris], edge1[tris], edge2[tris])
+
+                best = int(np.argmin(t))
+                if t[best] < closest:
+                    closest  = float(t[best])
+                    triangle = node["leftFirst"] + best
+                continue
+
+            children = self.nodes[node["leftFirst"]:node["leftFirst"] + 2]
+            tNear = Intersection.rayAABB(origin, invDirection, children["boundsMin"], children["boundsMax"], closest)
+
+            # Push the Far Child First so the Near Child Is Visited First
+            for child in np.argsort(tNear)[::-1]:
+                if np.isfinite(tNear[child]):  stack.append(int(node["leftFirst"]) + int(child))
+
+        return closest, triangle
+
+    def verify(self, vertices: np.ndarray, indices: np.ndarray, origins: np.ndarray, directions: np.ndarray, tMax=np.inf) -> int:
+        # Compares Traversal Against the Brute Force Path, Returns the Number of Mismatched Rays
+        v0, edge1, edge2 = Intersection.triangleEdges(vertices, self.reorder(indices))
+        bruteT, bruteTriangle = Intersection.nearest(origins, directions, v0, edge1, edge2, tMax)
+
+        mismatches = 0
+        for i in range(len(origins)):
+            t, triangle = self.intersect(origins[i], directions[i], v0, edge1, edge2, tMax)
+
+            sameHit = triangle == bruteTriangle[i] or np.isclose(t, bruteT[i], rtol=1e-5, atol=1e-6)
+            if not sameHit:  mismatches += 1
+
+        return mismatches
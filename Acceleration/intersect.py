@@ -0,0 +1,88 @@
+import numpy as np
+
+# NumPy Mirror of Shaders/common.glsl, Kept Numerically Identical to the Shader
+class Intersection:
+    EPSILON = 0.0001
+
+    @staticmethod
+    def triangleEdges(vertices: np.ndarray, indices: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        triangles = indices.reshape(-1, 3)
+
+        v0 = vertices[triangles[:, 0], :3]
+        v1 = vertices[triangles[:, 1], :3]
+        v2 = vertices[triangles[:, 2], :3]
+
+        return v0, v1 - v0, v2 - v0
+
+    @staticmethod
+    def triangleNormals(edge1: np.ndarray, edge2: np.ndarray) -> np.ndarray:
+        # Unit Face Normals, Degenerate Triangles Come Out NaN and Are Never Hit
+        with np.errstate(invalid="ignore", divide="ignore"):
+            normals = np.cross(edge1, edge2)
+            return normals / np.linalg.norm(normals, axis=1, keepdims=True)
+
+    @staticmethod
+    def rayTriangles(origins, directions, v0, edge1, edge2) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Möller–Trumbore, Every Argument Broadcasts over Its Leading Axes
+        with np.errstate(divide="ignore", invalid="ignore"):
+            h = np.cross(directions, edge2)
+            a = np.sum(edge1 * h, axis=-1)
+
+            f = 1.0 / a
+            s = origins - v0
+            u = f * np.sum(s * h, axis=-1)
+
+            q = np.cross(s, edge1)
+            v = f * np.sum(directions * q, axis=-1)
+            t = f * np.sum(edge2 * q, axis=-1)
+
+            hit = (np.abs(a) >= Intersection.EPSILON) & (u >= 0.0) & (u <= 1.0) & (v >= 0.0) & (u + v <= 1.0) & (t > Intersection.EPSILON)
+
+        return np.where(hit, t, np.inf), u, v
+
+    @staticmethod
+    def rayAABB(origin, invDirection, boundsMin, boundsMax, tMax) -> np.ndarray:
+        # Slab Test, Returns the Entry Distance or inf on a Miss
+        with np.errstate(invalid="ignore"):
+            t0 = (boundsMin - origin) * invDirection
+            t1 = (boundsMax - origin) * invDirection
+
+            tNear = np.max(np.minimum(t0, t1), axis=-1)
+            tFar  = np.min(np.maximum(t0, t1), axis=-1)
+
+        hit = (tNear <= tFar) & (tFar >= 0.0) & (tNear < tMax)
+        return np.where(hit, np.maximum(tNear, 0.0), np.inf)
+
+    @staticmethod
+    def safeInverse(directions: np.ndarray) -> np.ndarray:
+        directions = np.where(np.abs(directions) < 1e-8, np.copysign(1e-8, directions), directions)
+        return 1.0 / directions
+
+    @staticmethod
+    def nearest(origins, directions, v0, edge1, edge2, tMax=np.inf, tileSize: int = 4096, tileBudget: int = 1 << 18) -> tuple[np.ndarray, np.ndarray]:
+        # Brute Force Nearest Hit over All Triangles, Tiled so Memory Stays Bounded
+        origins    = np.asarray(origins,    dtype=np.float32).reshape(-1, 3)
+        directions = np.asarray(directions, dtype=np.float32).reshape(-1, 3)
+
+        closest  = np.array(np.broadcast_to(np.asarray(tMax, dtype=np.float32), len(origins)))
+        triangle = np.full(len(origins), -1,   dtype=np.int64)
+
+        # At Most tileBudget Ray/Triangle Pairs Live at Once
+        rayTile = max(1, tileBudget // max(1, min(len(v0), tileSize)))
+        for rayStart in range(0, len(origins), rayTile):
+            rays = slice(rayStart, rayStart + rayTile)
+            o = origins[rays, None]
+            d = directions[rays, None]
+
+            for triStart in range(0, len(v0), tileSize):
+                tris = slice(triStart, triStart + tileSize)
+                t, _, _ = Intersection.rayTriangles(o, d, v0[tris], edge1[tris], edge2[tris])
+
+                best  = np.argmin(t, axis=1)
+                bestT = t[np.arange(len(t)), best]
+                
+                closer = bestT < closest[rays]
+                closest[rays]  = np.where(closer, bestT, closest[rays])
+                triangle[rays] = np.where(closer, best + triStart, triangle[rays])
+
+        return closest, triangle
@@ -0,0 +1,176 @@
+import numpy as np
+
+from Acceleration.intersect import Intersection
+from Acceleration.twolevel  import TwoLevelBVH
+from settings import Settings
+
+# One Row per Ray, Misses Keep an Infinite Distance and -1 Indices
+class RayHits:
+    def __init__(self, count: int) -> None:
+        self.distance     = np.full(count, np.inf, dtype=np.float32)
+        self.triangle     = np.full(count, -1,     dtype=np.int64)    # Within Its Mesh, in the Mesh's Own Index Order
+        self.mesh         = np.full(count, -1,     dtype=np.int64)    # Index into scene.meshes
+        self.instance     = np.full(count, -1,     dtype=np.int64)    # Index into accel.instances
+        self.barycentrics = np.zeros((count, 3),   dtype=np.float32)  # Weights of the Triangle's Three Corners
+        self.normal       = np.zeros((count, 3),   dtype=np.float32)  # World Space Face Normal, Unit Length
+
+    def __len__(self) -> int:  return len(self.distance)
+
+    @property
+    def hit(self) -> np.ndarray:  return self.triangle >= 0
+
+    def points(self, origins, directions) -> np.ndarray:
+        # World Space Hit Positions, Misses Come Out inf
+        return np.asarray(origins, dtype=np.float32) + self.distance[:, None] * np.asarray(directions, dtype=np.float32)
+
+# Ray Queries Against the Scene for Game Code, e.g. Picking or Line of Sight, Always at Full Detail
+#   Reads the Top Level as of the Last TwoLevelBVH.update(), Which GLRenderer.updateInstances() Runs Every Frame
+class RayQuery:
+    def __init__(self, accel: TwoLevelBVH) -> None:
+        self.accel = accel
+
+    def raycast(self, origins, directions, maxDist=np.inf) -> RayHits:
+        # N x 3 Origins and Directions, or One Origin for Every Direction, Distances in Units of the Direction's Length
+        origins    = np.asarray(origins,    dtype=np.float32).reshape(-1, 3)
+        directions = np.asarray(directions, dtype=np.float32).reshape(-1, 3)
+        origins, directions = (np.ascontiguousarray(array) for array in np.broadcast_arrays(origins, directions))
+
+        closest = np.array(np.broadcast_to(np.asarray(maxDist, dtype=np.float32), len(origins)))
+        slots     = np.full(len(origins), -1, dtype=np.int64)
+        triangles = np.full(len(origins), -1, dtype=np.int64)
+
+        if not self.accel.empty:
+            if len(origins) == 1:  self.intersectSingle(origins[0], directions[0], closest, slots, triangles)
+            elif len(origins):     self.intersectBatch(origins, directions, closest, slots, triangles)
+
+        hits = RayHits(len(origins))
+        self.resolve(hits, origins, directions, closest, slots, triangles)
+        return hits
+
+    def intersectSingle(self, origin, direction, closest, slots, triangles) -> None:
+        # One Ray Walks the Scalar Traversal, No Packet Bookkeeping
+        t, instance, triangle = self.accel.intersect(origin, direction, closest[0])
+        if triangle < 0:  return
+
+        closest[0]   = t
+        slots[0]     = np.flatnonzero(self.accel.instanceOrder == instance)[0]
+        triangles[0] = triangle
+
+    def intersectBatch(self, origins, directions, closest, slots, triangles, batchSize: int = Settings.Query.BATCH_SIZE) -> None:
+        # Breadth First over Both Levels, Chunked so the Pair Arrays Stay Bounded
+        for start in range(0, len(origins), batchSize):
+            rays = slice(start, start + batchSize)
+            self.intersectChunk(origins[rays], directions[rays], closest[rays], slots[rays], triangles[rays])
+
+    def intersectChunk(self, origins, directions, closest, slots, triangles) -> None:
+        # Writes Through the Views It Is Given
+        accel = self.accel
+        rayIndices = np.arange(len(origins))
+
+        # Top Level: Every (Ray, Slot) Pair Whose Instance Box the Ray Enters
+        leafRays, leaves = RayQuery.traverse(accel.top.nodes, origins, Intersection.safeInverse(directions), rayIndices, closest, np.zeros(len(origins), dtype=np.int64))
+
+        counts  = accel.top.nodes["count"][leaves].astype(np.int64)
+        pairRay = np.repeat(leafRays, counts)
+        slot    = np.repeat(accel.top.nodes["leftFirst"][leaves].astype(np.int64), counts)
+        slot   += np.arange(len(slot)) - np.repeat(np.cumsum(counts) - counts, counts)
+        if len(slot) == 0:  return
+
+        # Rays Move into Each Instance's Object Space, Unnormalized so Distances Stay in World Units
+        #   worldToObject Is Stored Transposed for std430, Row Vectors Times It Apply the Matrix
+        records = accel.instanceData[slot]
+        linear, translation = records["worldToObject"][:, :3, :3], records["worldToObject"][:, 3, :3]
+
+        objectOrigins    = np.einsum("nj,nji->ni", origins[pairRay],    linear) + translation
+        objectDirections = np.einsum("nj,nji->ni", directions[pairRay], linear)
+        objectInverse    = Intersection.safeInverse(objectDirections)
+
+        # Object Space Mesh Boxes Are Tighter Than the Instance's World Box Once It Is Rotated, Rays Missing Them Stop Here
+        meshes = records["meshIndex"].astype(np.int64)
+        entry  = Intersection.rayAABB(objectOrigins, objectInverse, accel.meshMin[meshes], accel.meshMax[meshes], closest[pairRay])
+        inside = np.isfinite(entry)
+
+        pairRay, slot, meshes = pairRay[inside], slot[inside], meshes[inside]
+        objectOrigins, objectDirections, objectInverse = objectOrigins[inside], objectDirections[inside], objectInverse[inside]
+
+        # Bottom Level: All Instances Walk the Packed Trees Together, Leaves Already Address Packed Triangles
+        pairs, leaves = RayQuery.traverse(accel.nodes, objectOrigins, objectInverse, pairRay, closest, accel.rootNodes[meshes].astype(np.int64))
+        if len(pairs) == 0:  return
+
+        v0, edge1, edge2 = accel.triangleEdges()
+
+        # Leaves Hold Up to MAX_LEAF_SIZE Triangles, Shorter Ones Are Padded With Misses
+        first = accel.nodes["leftFirst"][leaves].astype(np.int64)
+        count = accel.nodes["count"][leaves].astype(np.int64)
+        offsets = np.arange(count.max())
+
+        candidates = np.minimum(first[:, None] + offsets, len(v0) - 1)
+        t, _, _ = Intersection.rayTriangles(objectOrigins[pairs, None], objectDirections[pairs, None], v0[candidates], edge1[candidates], edge2[candidates])
+        t[offsets >= count[:, None]] = np.inf
+
+        best  = np.argmin(t, axis=1)
+        bestT = t[np.arange(len(t)), best]
+
+        # Nearest per Ray Across Every Leaf and Instance It Reached
+        np.minimum.at(closest, pairRay[pairs], bestT)
+        winners = np.isfinite(bestT) & (bestT == closest[pairRay[pairs]])
+
+        slots[pairRay[pairs[winners]]]     = slot[pairs[winners]]
+        triangles[pairRay[pairs[winners]]] = candidates[np.arange(len(t)), best][winners]
+
+    @staticmethod
+    def traverse(nodes: np.ndarray, origins: np.ndarray, invDirections: np.ndarray, rayOf: np.ndarray, closest: np.ndarray, roots: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # Breadth First Walk of Every (Query, Node) Pair at Once, One Tree Level per Step
+        #   Queries Cull Against closest[rayOf[query]], Returns the (Query, Leaf) Pairs Reached
+        queries = np.arange(len(origins))
+        current = roots
+
+        leafQueries, leafNodes = [], []
+        while len(queries):
+            boxes = nodes[current]
+            entry = Intersection.rayAABB(origins[queries], invDirections[queries], boxes["boundsMin"], boxes["boundsMax"], closest[rayOf[queries]])
+
+            inside = np.isfinite(entry)
+            queries, current = queries[inside], current[inside]
+
+            leaf = nodes["count"][current] > 0
+            leafQueries.append(queries[leaf])
+            leafNodes.append(current[leaf])
+
+            left    = nodes["leftFirst"][current[~leaf]].astype(np.int64)
+            queries = np.repeat(queries[~leaf], 2)
+            current = np.stack((left, left + 1), axis=1).reshape(-1)
+
+        return np.concatenate(leafQueries), np.concatenate(leafNodes)
+
+    def resolve(self, hits: RayHits, origins, directions, closest, slots, triangles) -> None:
+        # Packed Triangles Back to Mesh Local Ids, Plus the Attributes Only Hit Rays Need
+        hit = np.flatnonzero(triangles >= 0)
+        if len(hit) == 0:  return
+
+        records = self.accel.instanceData[slots[hit]]
+        meshes  = records["meshIndex"].astype(np.int64)
+        linear, translation = records["worldToObject"][:, :3, :3], records["worldToObject"][:, 3, :3]
+
+        objectOrigins    = np.einsum("nj,nji->ni", origins[hit],    linear) + translation
+        objectDirections = np.einsum("nj,nji->ni", directions[hit], linear)
+
+        v0, edge1, edge2 = self.accel.triangleEdges()
+        packed = triangles[hit]
+        _, u, v = Intersection.rayTriangles(objectOrigins, objectDirections, v0[packed], edge1[packed], edge2[packed])
+
+        # Inverse Transpose of the Object to World Matrix, Like NormalToWorld in Shaders/scene.glsl
+        normals = np.einsum("nij,nj->ni", linear, Intersection.triangleNormals(edge1[packed], edge2[packed]))
+        normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+
+        hits.distance[hit]     = closest[hit]
+        hits.mesh[hit]         = meshes
+        hits.instance[hit]     = self.accel.instanceOrder[slots[hit]]
+        hits.barycentrics[hit] = np.stack((1.0 - u - v, u, v), axis=1)
+        hits.normal[hit]       = normals
+
+        # Bottom Levels Reorder Triangles, Their order Maps Back to the Mesh's Index Buffer
+        for meshIndex in np.unique(meshes):
+            rows = meshes == meshIndex
+            local = packed[rows] - self.accel.scene.ranges[meshIndex].triangleOffset
+            hits.triangle[hit[rows]] = self.accel.blases[meshIndex].order[local]
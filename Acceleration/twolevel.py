@@ -0,0 +1,339 @@
+import copy
+import numpy as np
+import time
+
+from Acceleration.bvh       import BVH
+from Acceleration.intersect import Intersection
+from Buffers.packer import ScenePacker
+
+from instance import Instance
+from settings import Settings
+
+# One Bottom Level BVH per Unique Mesh in Object Space, and a Top Level BVH over Instance Bounds
+#   Moving Instances Only Rebuilds the Top Level, O(Instances) Instead of O(Vertices)
+class TwoLevelBVH:
+    # Matches `struct InstanceData` in Shaders/scene.glsl (std430, 80 Bytes)
+    INSTANCE_DTYPE = np.dtype({
+        "names":    ["worldToObject",  "rootNode", "meshIndex"],
+        "formats":  [("<f4", (4, 4)), "<i4",      "<i4"      ],
+        "offsets":  [0, 64, 68],
+        "itemsize": 80,
+    })
+
+    def __init__(
+            self,
+            scene:     ScenePacker,
+            blases:    list[BVH] | None      = None,
+            instances: list[Instance] | None = None,
+            bins:        int = Settings.BVH.BINS,
+            maxLeafSize: int = Settings.BVH.TOP_LEVEL_LEAF_SIZE,
+            lodBlases: list[list[BVH]] | None = None
+        ) -> None:
+
+        self.scene = scene
+        self.bins        = bins
+        self.maxLeafSize = maxLeafSize
+
+        self.blases:    list[BVH]       = []
+        self.lodBlases: list[list[BVH]] = []
+
+        self.nodes    = np.zeros(0, dtype=BVH.NODE_DTYPE)
+        self.nodeMesh = np.zeros(0, dtype=np.int32)  # Owning Mesh of Every Packed Node
+        self.indices  = np.zeros(0, dtype=np.uint32)
+
+        self.rootNodes  = np.zeros(0, dtype=np.int32)
+        self.levelRoots: list[list[int]] = []  # Per Mesh, Root of Each Level, Full Detail First
+        self.levelTriangles: list[list[int]] = []
+
+        # Bottom Levels Are Built over Each Mesh's Own Arrays, so They Can Be Cached per Asset
+        self.pack(
+            blases    if blases    is not None else [BVH(mesh.vertices, mesh.indices) for mesh in scene.meshes],
+            lodBlases if lodBlases is not None else [[BVH(mesh.vertices, lod) for lod in mesh.lodIndices] for mesh in scene.meshes]
+        )
+
+        # One Identity Instance per Mesh Unless a Layout Is Given
+        self.instances = list(instances) if instances is not None else [Instance(mesh) for mesh in scene.meshes]
+
+        # Chosen Level per Instance, Kept Across Top Level Rebuilds
+        self.levels: dict[int, int] = {}
+
+        self.top = BVH.fromBounds(np.zeros((0, 3)), np.zeros((0, 3)))
+        self.instanceData     = np.zeros(0, dtype=TwoLevelBVH.INSTANCE_DTYPE)
+        self.instanceVersions = None
+        self.updateTime = 0.0
+
+        self.update()
+
+    def pack(self, blases: list[BVH], lodBlases: list[list[BVH]]) -> None:
+        # Appends the Bottom Levels of the Scene's Next Meshes, Child and Triangle Indices Rebased to the Packed Buffers
+        #   Each Batch's Full Detail Trees Come First in Mesh Order, Then Every Coarser Level, as ScenePacker.append Lays Out Its Indices
+        #   Earlier Nodes and Indices Stay as They Were, and Like ScenePacker Nothing Is Changed in Place
+        first = len(self.blases)
+        self.blases    = self.blases    + list(blases)
+        self.lodBlases = self.lodBlases + list(lodBlases)
+
+        indices = np.empty_like(self.scene.indices)
+        indices[:len(self.indices)] = self.indices
+
+        rootNodes = np.zeros(len(self.blases), dtype=np.int32)
+        rootNodes[:first] = self.rootNodes
+
+        levelRoots     = self.levelRoots     + [[] for _ in blases]
+        levelTriangles = self.levelTriangles + [[] for _ in blases]
+
+        levels = [(meshIndex, blas, self.scene.ranges[meshIndex]) for meshIndex, blas in enumerate(blases, start=first)]
+        for meshIndex, meshLodBlases in enumerate(lodBlases, start=first):
+            levels += [(meshIndex, blas, meshRange) for blas, meshRange in zip(meshLodBlases, self.scene.lodRanges[meshIndex])]
+
+        nodes      = [self.nodes]
+        nodeMesh   = [self.nodeMesh]
+        nodeOffset = len(self.nodes)
+        for meshIndex, blas, meshRange in levels:
+            meshNodes = blas.nodes.copy()
+
+            leaves = meshNodes["count"] > 0
+            meshNodes["leftFirst"][~leaves] += nodeOffset
+            meshNodes["leftFirst"][leaves]  += meshRange.triangleOffset
+
+            span = slice(meshRange.indexOffset, meshRange.indexOffset + meshRange.indexCount)
+            indices[span] = blas.reorder(self.scene.indices[span])
+
+            if not levelRoots[meshIndex]:  rootNodes[meshIndex] = nodeOffset
+            levelRoots[meshIndex].append(nodeOffset)
+            levelTriangles[meshIndex].append(meshRange.triangleCount)
+
+            nodes.append(meshNodes)
+            nodeMesh.append(np.full(len(meshNodes), meshIndex, dtype=np.int32))
+            nodeOffset += len(meshNodes)
+
+        self.nodes    = np.concatenate(nodes)
+        self.nodeMesh = np.concatenate(nodeMesh)
+        self.indices  = indices
+
+        self.rootNodes      = rootNodes
+        self.levelRoots     = levelRoots
+        self.levelTriangles = levelTriangles
+
+        # Object Space Bounds per Mesh, Empty Meshes Keep Inverted Bounds
+        self.meshMin = np.array([blas.nodes[0]["boundsMin"] for blas in self.blases], dtype=np.float32).reshape(-1, 3)
+        self.meshMax = np.array([blas.nodes[0]["boundsMax"] for blas in self.blases], dtype=np.float32).reshape(-1, 3)
+
+        self.v0 = self.edge1 = self.edge2 = None
+
+    def extended(self, scene: ScenePacker, blases: list[BVH], lodBlases: list[list[BVH]]) -> "TwoLevelBVH":
+        # A Copy over scene, This Scene Extended by ScenePacker.extended, With the New Meshes' Bottom Levels Appended
+        #   Instances and Their Levels Are Shared With This Tree, the Caller Adds the New Meshes' Instances and Calls update
+        accel = copy.copy(self)
+        accel.scene = scene
+        accel.pack(blases, lodBlases)
+
+        return accel
+
+    @property
+    def instanceCount(self) -> int:  return len(self.instances)
+
+    @property
+    def empty(self) -> bool:  return bool(np.any(self.top.nodes[0]["boundsMin"] > self.top.nodes[0]["boundsMax"]))
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "meshes":       len(self.blases),
+            "instances":    self.instanceCount,
+            "bottomNodes":  len(self.nodes),
+            "topNodes":     self.top.nodeCount,
+            "topDepth":     self.top.maxDepth,
+            "levels":       sum(len(roots) for roots in self.levelRoots),
+            "triangles":    self.activeTriangles,
+            "updateTimeMs": self.updateTime * 1000.0,
+        }
+
+    @property
+    def activeTriangles(self) -> int:
+        # Triangles Behind the Levels Currently Selected, Summed over Instances
+        return sum(self.levelTriangles[int(mesh)][int(level)] for mesh, level in zip(self.instanceData["meshIndex"][:len(self.slotLevels)], self.slotLevels))
+
+    def addInstance(self, instance: Instance) -> Instance:
+        self.instances.append(instance)
+        self.instanceVersions = None
+        return instance
+
+    def removeInstance(self, instance: Instance) -> None:
+        self.instances.remove(instance)
+        self.levels.pop(id(instance), None)
+        self.instanceVersions = None
+
+    def update(self) -> bool:
+        # Rebuilds the Top Level When Any Instance Moved, Returns Whether Anything Changed
+        versions = [(id(instance), instance.version) for instance in self.instances]
+        if versions == self.instanceVersions:  return False
+
+        startTime = time.perf_counter()
+
+        meshOf = {id(mesh): meshIndex for meshIndex, mesh in enumerate(self.scene.meshes)}
+        meshIndices = np.array([meshOf[id(instance.mesh)] for instance in self.instances], dtype=np.int32)
+
+        transforms = np.array([instance.transform          for instance in self.instances], dtype=np.float32).reshape(-1, 4, 4)
+        inverses   = np.array([instance.getInverseTransform() for instance in self.instances], dtype=np.float32).reshape(-1, 4, 4)
+
+        # Instances of Empty Meshes Can Never Be Hit, Leave Them Out of the Tree
+        visible = np.flatnonzero(np.all(self.meshMin[meshIndices] <= self.meshMax[meshIndices], axis=1))
+        worldMin, worldMax = TwoLevelBVH.transformBounds(transforms[visible], self.meshMin[meshIndices[visible]], self.meshMax[meshIndices[visible]])
+
+        self.top = BVH.fromBounds(worldMin, worldMax, self.bins, self.maxLeafSize)
+
+        # Instance Records in Top Level Leaf Order, Leaves Then Address Contiguous Ranges
+        order = visible[self.top.order]
+        self.instanceOrder = order
+
+        self.instanceData = np.zeros(max(1, len(order)), dtype=TwoLevelBVH.INSTANCE_DTYPE)
+        self.instanceData["worldToObject"][:len(order)] = inverses[order].transpose(0, 2, 1)  # std430 Wants Columns
+        self.instanceData["meshIndex"][:len(order)]     = meshIndices[order]
+
+        # Sphere Around Each Slot's World Box for Level Selection, and the Coarsest Level Its Mesh Has
+        self.slotCenter = (worldMin[self.top.order] + worldMax[self.top.order]) * 0.5
+        self.slotRadius = np.linalg.norm(worldMax[self.top.order] - worldMin[self.top.order], axis=1) * 0.5
+        self.slotMaxLevel = np.array([len(self.levelRoots[meshIndex]) - 1 for meshIndex in meshIndices[order]], dtype=np.int64)
+        self.slotLevels   = np.array([self.levels.get(id(self.instances[index]), 0) for index in order], dtype=np.int64)
+        self.slotLevels   = np.minimum(self.slotLevels, self.slotMaxLevel)
+        self.applyLevels(np.arange(len(order)))
+
+        self.instanceVersions = versions
+        self.updateTime = time.perf_counter() - startTime
+        return True
+
+    def applyLevels(self, slots: np.ndarray) -> None:
+        for slot in slots:
+            self.instanceData[slot]["rootNode"] = self.levelRoots[int(self.instanceData[slot]["meshIndex"])][int(self.slotLevels[slot])]
+            self.levels[id(self.instances[self.instanceOrder[slot]])] = int(self.slotLevels[slot])
+
+    def resetLevels(self) -> None:
+        # Every Instance Back at Full Detail, e.g. Before Another Benchmark Run over the Same Tree
+        self.levels.clear()
+        self.slotLevels = np.zeros_like(self.slotLevels)
+        self.applyLevels(np.arange(len(self.slotLevels)))
+
+    def selectLOD(self, position, fov: float, detailSize: float = Settings.LOD.DETAIL_SIZE) -> bool:
+        # Picks Each Instance's Level From Its Projected Size, Returns Whether Any Record Changed
+        #   Only the GPU Records Switch, CPU Queries Always Run at Full Detail
+        if len(self.slotLevels) == 0 or not np.any(self.slotMaxLevel):  return False
+
+        distance = np.linalg.norm(self.slotCenter - np.asarray(position, dtype=np.float32), axis=1)
+
+        # Radius over Half the Visible Height at That Distance, Inside the Bounds Counts as Filling the Screen
+        with np.errstate(divide="ignore"):
+            size = np.where(distance > self.slotRadius, self.slotRadius / (distance * np.tan(np.radians(fov) * 0.5)), np.inf)
+            levels = np.ceil(np.log2(detailSize / size))
+
+        levels = np.clip(np.nan_to_num(levels, nan=0.0, neginf=0.0), 0, self.slotMaxLevel).astype(np.int64)
+
+        changed = np.flatnonzero(levels != self.slotLevels)
+        if len(changed) == 0:  return False
+
+        self.slotLevels = levels
+        self.applyLevels(changed)
+        return True
+
+    @staticmethod
+    def transformBounds(transforms: np.ndarray, boundsMin: np.ndarray, boundsMax: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # World Box of a Transformed Box from Its Center and Half Extent
+        center = (boundsMin + boundsMax) * 0.5
+        extent = (boundsMax - boundsMin) * 0.5
+
+        worldCenter = np.einsum("nij,nj->ni", transforms[:, :3, :3], center) + transforms[:, :3, 3]
+        worldExtent = np.einsum("nij,nj->ni", np.abs(transforms[:, :3, :3]), extent)
+
+        return worldCenter - worldExtent, worldCenter + worldExtent
+
+    def triangleEdges(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Object Space Triangles in Packed Order, Built on First CPU Query
+        if self.v0 is None:
+            self.v0, self.edge1, self.edge2 = Intersection.triangleEdges(self.scene.vertices, self.indices)
+
+        return self.v0, self.edge1, self.edge2
+
+    def intersect(self, origin, direction, tMax=np.inf) -> tuple[float, int, int]:
+        # CPU Traversal Mirroring the Shaders, Returns (Distance, Instance Index, Packed Triangle) or -1s on a Miss
+        origin    = np.asarray(origin,    dtype=np.float32)
+        direction = np.asarray(direction, dtype=np.float32)
+        invDirection = Intersection.safeInverse(direction)
+
+        v0, edge1, edge2 = self.triangleEdges()
+
+        closest  = tMax
+        instance = -1
+        triangle = -1
+
+        # Nothing to Walk Without Instances, Their Inverted Root Would Still Pass the Slab Test
+        nodes = self.top.nodes
+        stack = [0] if not self.empty and np.isfinite(Intersection.rayAABB(origin, invDirection, nodes[0]["boundsMin"], nodes[0]["boundsMax"], closest)) else []
+        while stack:
+            node = nodes[stack.pop()]
+
+            if node["count"] > 0:
+                for slot in range(node["leftFirst"], node["leftFirst"] + node["count"]):
+                    record    = self.instanceData[slot]
+                    meshIndex = int(record["meshIndex"])
+                    meshRange = self.scene.ranges[meshIndex]
+
+                    # Unnormalized Object Space Direction Keeps Distances in World Units
+                    worldToObject = record["worldToObject"].T
+                    objectOrigin    = worldToObject[:3, :3] @ origin + worldToObject[:3, 3]
+                    objectDirection = worldToObject[:3, :3] @ direction
+
+                    tris = slice(meshRange.triangleOffset, meshRange.triangleOffset + meshRange.triangleCount)
+                    t, localTriangle = self.blases[meshIndex].intersect(objectOrigin, objectDirection, v0[tris], edge1[tris], edge2[tris], closest)
+
+                    if localTriangle >= 0 and t < closest:
+                        closest  = t
+                        instance = int(self.instanceOrder[slot])
+                        triangle = meshRange.triangleOffset + localTriangle
+                continue
+
+            children = nodes[node["leftFirst"]:node["leftFirst"] + 2]
+            tNear = Intersection.rayAABB(origin, invDirection, children["boundsMin"], children["boundsMax"], closest)
+
+            for child in np.argsort(tNear)[::-1]:
+                if np.isfinite(tNear[child]):  stack.append(int(node["leftFirst"]) + int(child))
+
+        return closest, instance, triangle
+
+    def bake(self) -> tuple[np.ndarray, np.ndarray]:
+        # Flattens Every Instance into World Space Geometry, for Backends Without Instancing
+        vertexChunks, indexChunks = [], []
+
+        vertexOffset = 0
+        for instance in self.instances:
+            meshRange = self.scene.rangeOf(instance.mesh)
+            transform = np.array(instance.transform, dtype=np.float32)
+
+            vertices = self.scene.vertices[meshRange.vertexOffset:meshRange.vertexOffset + meshRange.vertexCount].copy()
+            vertices[:, 3] = 1.0
+            vertices = vertices @ transform.T
+            vertices[:, 3] = 0.0
+
+            indices = self.scene.indices[meshRange.indexOffset:meshRange.indexOffset + meshRange.indexCount]
+
+            vertexChunks.append(vertices)
+            indexChunks.append((indices.astype(np.int64) - meshRange.vertexOffset + vertexOffset).astype(np.uint32))
+            vertexOffset += meshRange.vertexCount
+
+        if not vertexChunks:  return np.zeros((0, 4), dtype=np.float32), np.zeros(0, dtype=np.uint32)
+
+        return np.concatenate(vertexChunks).astype(np.float32), np.concatenate(indexChunks)
+
+    def verify(self, origins: np.ndarray, directions: np.ndarray, tMax=np.inf) -> int:
+        # Compares Two Level Traversal Against Brute Force over the Baked Scene, Returns Mismatched Rays
+        vertices, indices = self.bake()
+        v0, edge1, edge2 = Intersection.triangleEdges(vertices, indices)
+        bruteT, bruteTriangle = Intersection.nearest(origins, directions, v0, edge1, edge2, tMax)
+
+        mismatches = 0
+        for i in range(len(origins)):
+            t, _, triangle = self.intersect(origins[i], directions[i], tMax)
+
+            bothMissed = triangle < 0 and bruteTriangle[i] < 0
+            sameHit    = triangle >= 0 and bruteTriangle[i] >= 0 and np.isclose(t, bruteT[i], rtol=1e-4, atol=1e-5)
+            if not (bothMissed or sameHit):  mismatches += 1
+
+        return mismatches
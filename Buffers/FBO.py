@@ -0,0 +1,50 @@
+import numpy as np
+from OpenGL.GL import *
+
+class FBO:
+    def __init__(self, width: int, height: int, internalFormat=GL_RGBA8) -> None:
+        self.ID      = glGenFramebuffers(1)
+        self.texture = glGenTextures(1)
+
+        self.internalFormat = internalFormat
+        self.width  = 0
+        self.height = 0
+
+        self.resize(width, height)
+
+    def resize(self, width: int, height: int) -> None:
+        if (width, height) == (self.width, self.height):  return
+
+        self.width  = width
+        self.height = height
+
+        glBindTexture(GL_TEXTURE_2D, self.texture)
+        glTexImage2D(GL_TEXTURE_2D, 0, self.internalFormat, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, None)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+        glBindTexture(GL_TEXTURE_2D, 0)
+
+        self.bind()
+        glFramebufferTexture2D(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_TEXTURE_2D, self.texture, 0)
+
+        status = glCheckFramebufferStatus(GL_FRAMEBUFFER)
+        self.unbind()
+
+        if status != GL_FRAMEBUFFER_COMPLETE:  raise RuntimeError(f"Framebuffer incomplete: {status}")
+
+    def bind(self)   -> None:  glBindFramebuffer(GL_FRAMEBUFFER, self.ID)
+    def unbind(self) -> None:  glBindFramebuffer(GL_FRAMEBUFFER, 0)
+
+    def readPixels(self) -> np.ndarray:
+        # RGBA float32, Row 0 Is the Bottom Row
+        self.bind()
+        pixels = glReadPixels(0, 0, self.width, self.height, GL_RGBA, GL_FLOAT)
+        self.unbind()
+
+        return np.frombuffer(pixels, dtype=np.float32).reshape(self.height, self.width, 4)
+
+    def delete(self) -> None:
+        glDeleteFramebuffers(1, [self.ID])
+        glDeleteTextures(1, [self.texture])
@@ -0,0 +1,26 @@
+import numpy as np
+from OpenGL.GL import *
+
+from Buffers.buffer import Buffer
+
+class UBO(Buffer):
+    TARGET = GL_UNIFORM_BUFFER
+    DEFAULT_USAGE = GL_DYNAMIC_DRAW
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.bindingPoint: int
+
+    def bindBase(self, bindingPoint: int) -> None:
+        self.bindingPoint = bindingPoint
+        glBindBufferBase(GL_UNIFORM_BUFFER, self.bindingPoint, self.ID)
+
+    @staticmethod
+    def sendData(data: np.ndarray, bindingPoint: int) -> "UBO":
+        newUBO = UBO()
+        newUBO.bind()
+        newUBO.bufferData(data)
+        newUBO.bindBase(bindingPoint)
+        newUBO.unbind()
+
+        return newUBO
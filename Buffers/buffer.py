@@ -0,0 +1,76 @@
+import numpy as np
+from OpenGL.GL import *
+
+# Shared by Every Buffer Object, Subclasses Only Pick the Target They Bind To
+class Buffer:
+    TARGET = GL_ARRAY_BUFFER
+    DEFAULT_USAGE = GL_STATIC_DRAW
+
+    def __init__(self) -> None:
+        self.ID = glGenBuffers(1)
+
+        self.capacity = 0  # Bytes Allocated on the GPU
+        self.size     = 0  # Bytes Holding Data, Preserved When the Buffer Grows
+        self.usage    = self.DEFAULT_USAGE
+
+    def bind(self)   -> None:  glBindBuffer(self.TARGET, self.ID)
+    def unbind(self) -> None:  glBindBuffer(self.TARGET, 0)
+
+    def bufferData(self, data: np.ndarray, usage=None) -> None:
+        # Reallocates the Whole Buffer, Use update() for Data That Changes
+        if not issubclass(type(data), np.ndarray):  data = np.array(data)
+        if usage is None:  usage = self.DEFAULT_USAGE
+
+        self.bind()
+        glBufferData(self.TARGET, data.nbytes, data, usage)
+
+        self.capacity = self.size = data.nbytes
+        self.usage = usage
+
+    def bufferSubData(self, data: np.ndarray, offset: int = 0) -> None:
+        # Must Fit in the Current Allocation
+        self.bind()
+        glBufferSubData(self.TARGET, offset, data.nbytes, data)
+
+    def reserve(self, nbytes: int) -> bool:
+        # Grows to at Least nbytes, Doubling so Repeated Growth Costs Amortized O(1) per Byte
+        #   The Buffer Name Stays the Same, so VAOs and Binding Points Still Refer to It
+        if nbytes <= self.capacity:  return False
+
+        capacity = max(nbytes, 2 * self.capacity)
+
+        # Contents Survive the Reallocation Through a GPU Side Copy
+        staging = None
+        if self.size:
+            staging = glGenBuffers(1)
+            glBindBuffer(GL_COPY_WRITE_BUFFER, staging)
+            glBufferData(GL_COPY_WRITE_BUFFER, self.size, None, GL_STREAM_COPY)
+
+            glBindBuffer(GL_COPY_READ_BUFFER, self.ID)
+            glCopyBufferSubData(GL_COPY_READ_BUFFER, GL_COPY_WRITE_BUFFER, 0, 0, self.size)
+
+        self.bind()
+        glBufferData(self.TARGET, capacity, None, self.usage)
+
+        if staging is not None:
+            glBindBuffer(GL_COPY_READ_BUFFER,  staging)
+            glBindBuffer(GL_COPY_WRITE_BUFFER, self.ID)
+            glCopyBufferSubData(GL_COPY_READ_BUFFER, GL_COPY_WRITE_BUFFER, 0, 0, self.size)
+            glDeleteBuffers(1, [staging])
+
+        glBindBuffer(GL_COPY_READ_BUFFER,  0)
+        glBindBuffer(GL_COPY_WRITE_BUFFER, 0)
+
+        self.capacity = capacity
+        return True
+
+    def update(self, data: np.ndarray, offset: int = 0) -> None:
+        # Writes a Range, Growing the Buffer First When It Does Not Fit
+        if not issubclass(type(data), np.ndarray):  data = np.array(data)
+
+        self.reserve(offset + data.nbytes)
+        self.bufferSubData(data, offset)
+
+        self.size = max(self.size, offset + data.nbytes)
+
+    def delete(self) -> None:  glDeleteBuffers(1, [self.ID])
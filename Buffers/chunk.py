@@ -6,6 +6,8 @@ from Buffers.VAO import VAO
 from Buffers.VBO import VBO
 from Buffers.EBO import EBO
 from Buffers.texture import Texture, TextureArray
+from Buffers.manager import TextureManager
+from MeshLoaders.image import ImageDecoder
 
 class Chunk:
     def __init__(
@@ -15,7 +17,8 @@ class Chunk:
             index:    int,
             length:   int,
             dataType,
-            textures: str | list[str] | pygame.Surface | list[pygame.Surface] | None = None
+            textures: str | list[str] | pygame.Surface | list[pygame.Surface] | np.ndarray | list[np.ndarray] | None = None,
+            manager:  TextureManager | None = None
         ):
         
         self.vertices = vertices
@@ -29,34 +32,49 @@ class Chunk:
         self.VBO = VBO()
         self.EBO = EBO()
         
-        if     textures is None:  self.textureAmount = 0
-        else:  self.textureAmount = 1
-        
+        self.manager  = manager
         self.textures = None
-        textureType = type(textures)
-        
-        if issubclass(textureType, pygame.Surface):
-            newTexture = Texture()
-            newTexture.loadSurface(textures)
-            self.textures = newTexture
-            
-        elif issubclass(textureType, str):
+        self.textureAmount = 0
+        self.layerIndices: list[int] = []  # Layer of Each Given Image, Equal Images Share One Through the Manager
+
+        if textures is None:  return
+
+        # Every Accepted Form Becomes Decoded RGBA Arrays, One Texture per Image or One Array for a List
+        isList = isinstance(textures, list)
+        layers = Chunk.decodeLayers(textures if isList else [textures])
+        self.textureAmount = len(layers)
+
+        if manager is not None and isList:
+            self.textures, self.layerIndices = manager.acquireArray(layers)
+        elif manager is not None:
+            self.textures, self.layerIndices = manager.acquire(layers[0]), [0]
+        elif isList:
+            self.textures = TextureArray()
+            self.textures.loadArrays(layers)
+            self.layerIndices = list(range(len(layers)))
+        else:
             self.textures = Texture()
-            self.textures.loadSurface(pygame.image.load(textures))
+            self.textures.loadArray(layers[0])
+            self.layerIndices = [0]
+
+    @staticmethod
+    def decodeLayers(textures: list) -> list[np.ndarray]:
+        paths = [texture for texture in textures if isinstance(texture, str)]
+        if paths:
+            with ImageDecoder() as decoder:
+                decoded = iter(decoder.decodeAll(paths))
         
-        elif issubclass(textureType, list):
-            self.textures = TextureArray()
-            self.textureAmount = len(textures)
-            
-            if all(issubclass(item, pygame.Surface) for item in textures):
-                self.textures.loadLayers(textures)
-            elif all(issubclass(item, str) for item in textures):
-                newTextures = []
-                for path in textures:
-                    newTextures.append(pygame.image.load(path))
-                self.textures.loadLayers(newTextures)
+        layers = []
+        for texture in textures:
+            if   isinstance(texture, np.ndarray):      layers.append(texture)
+            elif isinstance(texture, str):             layers.append(next(decoded))
+            elif isinstance(texture, pygame.Surface):
+                width, height = texture.get_size()
+                layers.append(np.frombuffer(pygame.image.tostring(texture, "RGBA"), dtype=np.uint8).reshape(height, width, 4))
             else:
-                raise RuntimeError(f"Unknown Texture Type: {type(textures[0])}")
+                raise RuntimeError(f"Unknown Texture Type: {type(texture)}")
+
+        return layers
         
     def sendData(self) -> None:
         self.VAO.bind()  # VAO
@@ -78,22 +96,25 @@ class Chunk:
     def bindTextureData(self, program, textureUnit) -> None:
         if self.textures:
 
-            if isinstance(type(self.textures), TextureArray):
+            if self.manager is not None:  self.manager.touch(self.textures)
+
+            # Sampler Uniforms Take the Unit Index, Not the GL_TEXTUREi Enum
+            if isinstance(self.textures, TextureArray):
                 uniformName = "u_textureArray"
                 
                 uniformLocation = glGetUniformLocation(program, uniformName)
                 if uniformLocation != -1:
                     self.textures.bind(textureUnit)
-                    glUniform1i(uniformLocation, 0)
+                    glUniform1i(uniformLocation, textureUnit - GL_TEXTURE0)
                 else:
-                    print(f"Warning: Shader Fniform '{uniformName}' not Found for TextureArray.")
+                    print(f"Warning: Shader Uniform '{uniformName}' not Found for TextureArray.")
 
-            elif isinstance(type(self.textures), Texture):
+            elif isinstance(self.textures, Texture):
                 uniformName = "u_texture2D"
                 uniformLocation = glGetUniformLocation(program, uniformName)
                 if uniformLocation != -1:
                     self.textures.bind(textureUnit)
-                    glUniform1i(uniformLocation, 0)
+                    glUniform1i(uniformLocation, textureUnit - GL_TEXTURE0)
                 else:
                     print(f"Warning: Shader Uniform '{uniformName}' not Found for 2D Texture.")
             else:
@@ -102,7 +123,7 @@ class Chunk:
     def unbindTextureData(self, textureUnit) -> None:
         if self.textures is None:  return
 
-        if isinstance(type(self.textures), TextureArray) or isinstance(type(self.textures), Texture):
+        if isinstance(self.textures, (TextureArray, Texture)):
             self.textures.unbind(textureUnit)
         else:
             raise RuntimeError(f"Unsupported Texture Type: {type(self.textures)}")
@@ -114,3 +135,10 @@ class Chunk:
         self.VAO.delete()
         self.VBO.delete()
         self.EBO.delete()
+
+        # Shared Textures Only Go Away Once the Manager Evicts Them
+        if self.textures is None:  return
+
+        if   self.manager is not None:  self.manager.release(self.textures)
+        else:                           self.textures.delete()
+        self.textures = None
@@ -0,0 +1,219 @@
+import hashlib
+import numpy as np
+from OpenGL.GL import *
+
+from Buffers.texture import Texture, TextureArray
+from Buffers.upload  import TextureUploader
+from settings import Settings
+
+class TextureEntry:
+    def __init__(self, key: str, texture: Texture | TextureArray, nbytes: int, layerKeys: list[str]) -> None:
+        self.key       = key
+        self.texture   = texture
+        self.nbytes    = nbytes
+        self.layerKeys = layerKeys  # Content Key of Each Layer, in Layer Order
+        self.refCount  = 0
+        self.lastUsed  = 0
+
+# Content Addressed Textures: Identical Images Share One GL Object, Counted by Reference
+#   Arrays Are Addressed per Layer, Equal Images Share One Layer and Layers Already Resident Elsewhere Are Copied on the GPU
+#   Unreferenced Textures Stay Resident for Reuse Until the Budget Is Exceeded, Then Go Least Recently Used First
+class TextureManager:
+    def __init__(self, budget: int = Settings.Textures.VRAM_BUDGET, uploader: TextureUploader | None = None) -> None:
+        self.budget   = budget
+        self.uploader = uploader  # Streams New Textures When Given, Otherwise They Upload Synchronously
+
+        self.entries: dict[str, TextureEntry] = {}
+        self.byID:    dict[int, TextureEntry] = {}
+
+        self.clock = 0  # Bumped on Every Use, Orders Entries for Eviction
+
+        self.hits      = 0
+        self.misses    = 0
+        self.evictions = 0
+
+        self.layersUploaded = 0
+        self.layersCopied   = 0
+
+    @staticmethod
+    def contentKey(layers: list[np.ndarray]) -> str:
+        # Shape Is Part of the Key, Equal Bytes in a Different Layout Are a Different Image
+        digest = hashlib.sha256()
+        for layer in layers:
+            digest.update(str(layer.shape).encode())
+            digest.update(np.ascontiguousarray(layer, dtype=np.uint8).data)
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def storageBytes(width: int, height: int, depth: int, levels: int) -> int:
+        # Every Mip Level glTexStorage Allocated, RGBA8
+        return sum(max(1, width >> level) * max(1, height >> level) * 4 * depth for level in range(levels))
+
+    def acquire(self, pixels: np.ndarray) -> Texture:  return self.acquireLayers([pixels], False)[0]
+
+    def acquireArray(self, layers: list[np.ndarray]) -> tuple[TextureArray, list[int]]:
+        # The Array Holds Each Distinct Image Once, Returned With the Layer Every Input Image Landed On
+        return self.acquireLayers(layers, True)
+
+    def acquireLayers(self, layers: list[np.ndarray], array: bool) -> tuple[Texture | TextureArray, list[int]]:
+        if len(layers) == 0:  raise ValueError("No layers provided for texture.")
+
+        # First Occurrence of Each Image Gets the Next Layer
+        distinct: dict[str, np.ndarray] = {}
+        layerKeys = [TextureManager.contentKey([layer]) for layer in layers]
+        for layerKey, layer in zip(layerKeys, layers):  distinct.setdefault(layerKey, layer)
+
+        slots = {layerKey: slot for slot, layerKey in enumerate(distinct)}
+        key = ("array:" + hashlib.sha256("".join(distinct).encode()).hexdigest()) if array else ("2d:" + layerKeys[0])
+
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            entry = self.create(key, list(distinct.values()), list(distinct), array)
+
+        entry.refCount += 1
+        self.touchEntry(entry)
+
+        # Make Room Once the Entry Is Referenced, so a New Texture Never Evicts Itself
+        self.evict()
+        return entry.texture, [slots[layerKey] for layerKey in layerKeys]
+
+    def create(self, key: str, layers: list[np.ndarray], layerKeys: list[str], array: bool) -> TextureEntry:
+        if array:
+            texture = self.createArray(layers, layerKeys)
+        elif self.uploader is not None:
+            texture = self.uploader.loadTexture(layers[0])
+            self.layersUploaded += 1
+        else:
+            texture = Texture()
+            texture.loadArray(layers[0])
+            self.layersUploaded += 1
+
+        depth = texture.depth if array else 1
+        entry = TextureEntry(key, texture, TextureManager.storageBytes(texture.width, texture.height, depth, texture.levels), layerKeys)
+
+        self.entries[key] = entry
+        self.byID[texture.ID] = entry
+
+        return entry
+
+    def createArray(self, layers: list[np.ndarray], layerKeys: list[str]) -> TextureArray:
+        padded, width, height = TextureArray.padLayers(layers)
+
+        texture = TextureArray()
+        texture.allocate(width, height, len(layers))
+
+        # A Changed Texture Set Only Uploads the Images That Are New, the Rest Come From the Arrays Already Resident
+        resident = self.residentLayers(texture)
+
+        uploaded = False
+        for layer, layerKey in enumerate(layerKeys):
+            source = resident.get(layerKey)
+            if source is not None:
+                texture.copyLayer(layer, *source)
+                self.layersCopied += 1
+                continue
+
+            if self.uploader is not None:  self.uploader.enqueue(texture, padded[layer], layer)
+            else:                          texture.loadLayer(layer, padded[layer])
+
+            self.layersUploaded += 1
+            uploaded = True
+
+        # The Uploader Builds Mipmaps Once Its Last Row Lands, Copies Already Brought Theirs
+        if uploaded and self.uploader is None and texture.levels > 1:
+            glBindTexture(GL_TEXTURE_2D_ARRAY, texture.ID)
+            glGenerateMipmap(GL_TEXTURE_2D_ARRAY)
+            glBindTexture(GL_TEXTURE_2D_ARRAY, 0)
+
+        return texture
+
+    def residentLayers(self, texture: TextureArray) -> dict[str, tuple[TextureArray, int]]:
+        # Layer Key -> (Array, Layer) for Every Fully Uploaded Array of the Same Size
+        resident = {}
+        for entry in self.entries.values():
+            other = entry.texture
+            if not isinstance(other, TextureArray):  continue
+            if (other.width, other.height, other.levels) != (texture.width, texture.height, texture.levels):  continue
+            if self.uploader is not None and other.ID in self.uploader.remaining:  continue
+
+            for layer, layerKey in enumerate(entry.layerKeys):  resident.setdefault(layerKey, (other, layer))
+
+        return resident
+
+    def touchEntry(self, entry: TextureEntry) -> None:
+        self.clock += 1
+        entry.lastUsed = self.clock
+
+    def touch(self, texture: Texture | TextureArray) -> None:
+        # Call When a Texture Is Bound for Drawing
+        entry = self.byID.get(texture.ID)
+        if entry is not None:  self.touchEntry(entry)
+
+    def release(self, texture: Texture | TextureArray) -> None:
+        entry = self.byID.get(texture.ID)
+        if entry is None:  raise KeyError(f"Texture {texture.ID} Is Not Managed")
+        if entry.refCount == 0:  raise RuntimeError(f"Texture {texture.ID} Released More Often Than Acquired")
+
+        entry.refCount -= 1
+        self.evict()
+
+    @property
+    def residentBytes(self) -> int:  return sum(entry.nbytes for entry in self.entries.values())
+
+    @property
+    def overBudget(self) -> bool:  return self.residentBytes > self.budget
+
+    def evict(self) -> None:
+        # Only Textures Nothing References Can Go, Referenced Ones May Keep Usage over Budget
+        residentBytes = self.residentBytes
+        if residentBytes <= self.budget:  return
+
+        unused = sorted((entry for entry in self.entries.values() if entry.refCount == 0), key=lambda entry: entry.lastUsed)
+        for entry in unused:
+            if residentBytes <= self.budget:  break
+
+            self.remove(entry)
+            residentBytes -= entry.nbytes
+            self.evictions += 1
+
+    def remove(self, entry: TextureEntry) -> None:
+        if self.uploader is not None:  self.uploader.cancel(entry.texture)
+
+        entry.texture.delete()
+        del self.entries[entry.key]
+        del self.byID[entry.texture.ID]
+
+    def report(self) -> list[dict]:
+        # One Row per Resident Texture, Largest First
+        rows = [
+            {
+                "key":      entry.key.split(":")[1][:12],
+                "size":     f"{entry.texture.width}x{entry.texture.height}" + (f"x{entry.texture.depth}" if isinstance(entry.texture, TextureArray) else ""),
+                "bytes":    entry.nbytes,
+                "refs":     entry.refCount,
+                "lastUsed": entry.lastUsed,
+            }
+            for entry in self.entries.values()
+        ]
+
+        return sorted(rows, key=lambda row: row["bytes"], reverse=True)
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "textures":       len(self.entries),
+            "residentBytes":  self.residentBytes,
+            "budget":         self.budget,
+            "hits":           self.hits,
+            "misses":         self.misses,
+            "evictions":      self.evictions,
+            "layersUploaded": self.layersUploaded,
+            "layersCopied":   self.layersCopied,
+        }
+
+    def delete(self) -> None:
+        for entry in list(self.entries.values()):  self.remove(entry)
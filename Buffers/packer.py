@@ -0,0 +1,128 @@
+import copy
+import numpy as np
+
+from typing import Iterable
+
+from mesh import Mesh
+
+class MeshRange:
+    def __init__(self, vertexOffset: int, vertexCount: int, indexOffset: int, indexCount: int, textureOffset: int = 0, textureCount: int = 0) -> None:
+        self.vertexOffset  = vertexOffset
+        self.vertexCount   = vertexCount
+        self.indexOffset   = indexOffset
+        self.indexCount    = indexCount
+        self.textureOffset = textureOffset  # Into ScenePacker.textures
+        self.textureCount  = textureCount
+
+    @property
+    def triangleOffset(self) -> int:  return self.indexOffset // 3
+
+    @property
+    def triangleCount(self) -> int:   return self.indexCount // 3
+
+    def __repr__(self) -> str:
+        return f"MeshRange(vertices={self.vertexOffset}+{self.vertexCount}, indices={self.indexOffset}+{self.indexCount})"
+
+# Packs Any Number of Meshes into Contiguous, std430 Ready Arrays, One Batch at a Time
+class ScenePacker:
+    def __init__(self, meshes: Iterable[Mesh]) -> None:
+        self.meshes: list[Mesh] = []
+        self.ranges: list[MeshRange] = []
+        self.lodRanges: list[list[MeshRange]] = []  # Coarser Levels per Mesh, Sharing Its Vertex Range
+
+        self.vertices = np.zeros((0, 4), dtype=np.float32)
+        self.indices  = np.zeros(0,      dtype=np.uint32 )
+        self.normals  = np.zeros((0, 4), dtype=np.float32)
+        self.uvs      = np.zeros((0, 2), dtype=np.float32)
+        self.textures = []
+
+        self.append(meshes)
+
+    @property
+    def vertexCount(self) -> int:    return len(self.vertices)
+
+    @property
+    def triangleCount(self) -> int:  return len(self.indices) // 3
+
+    def append(self, meshes: Iterable[Mesh]) -> None:
+        # Packs meshes After Everything Already Here, Earlier Offsets and Array Contents Stay as They Were
+        #   Arrays and Lists Are Replaced, Never Changed in Place, so a Shallow Copy Can Grow While the Original Is in Use
+        meshes = list(meshes)
+
+        vertexOffset = self.vertexCount
+        indexOffset  = len(self.indices)
+
+        vertexCount = vertexOffset + sum(len(obj.vertices) for obj in meshes)
+        indexCount  = indexOffset  + sum(len(obj.indices)  for obj in meshes)
+        lodCount    = sum(len(lod) for obj in meshes for lod in obj.lodIndices)
+
+        hasNormals = len(self.normals) > 0 or any(obj.normals is not None for obj in meshes)
+        hasUVs     = len(self.uvs)     > 0 or any(obj.uvs     is not None for obj in meshes)
+
+        # Preallocate Everything, Vec4 for Padding, Earlier Meshes Without Normals or UVs Read Zeros
+        vertices = np.zeros((vertexCount, 4), dtype=np.float32)
+        indices  = np.empty(indexCount + lodCount, dtype=np.uint32)
+        normals  = np.zeros((vertexCount if hasNormals else 0, 4), dtype=np.float32)
+        uvs      = np.zeros((vertexCount if hasUVs     else 0, 2), dtype=np.float32)
+        textures = list(self.textures)
+        ranges    = []
+        lodRanges = []
+
+        vertices[:vertexOffset]     = self.vertices
+        indices[:indexOffset]       = self.indices
+        normals[:len(self.normals)] = self.normals
+        uvs[:len(self.uvs)]         = self.uvs
+
+        for obj in meshes:
+            vertexEnd = vertexOffset + len(obj.vertices)
+            indexEnd  = indexOffset  + len(obj.indices)
+
+            vertices[vertexOffset:vertexEnd, :3] = obj.vertices
+            np.add(obj.indices, vertexOffset, out=indices[indexOffset:indexEnd], dtype=np.uint32, casting="unsafe")
+
+            textureOffset = len(textures)
+
+            if obj.normals is not None:   normals[vertexOffset:vertexEnd, :3] = obj.normals
+            if obj.uvs     is not None:   uvs[vertexOffset:vertexEnd]         = obj.uvs
+            if obj.textures is not None:  textures.extend(obj.textures)
+
+            ranges.append(MeshRange(vertexOffset, vertexEnd - vertexOffset, indexOffset, indexEnd - indexOffset, textureOffset, len(textures) - textureOffset))
+
+            vertexOffset = vertexEnd
+            indexOffset  = indexEnd
+
+        # Levels Follow Every Full Mesh of the Batch, so Its Full Detail Ranges Stay Contiguous
+        for obj, meshRange in zip(meshes, ranges):
+            levels = []
+            for lod in obj.lodIndices:
+                indexEnd = indexOffset + len(lod)
+                np.add(lod, meshRange.vertexOffset, out=indices[indexOffset:indexEnd], dtype=np.uint32, casting="unsafe")
+
+                levels.append(MeshRange(meshRange.vertexOffset, meshRange.vertexCount, indexOffset, indexEnd - indexOffset))
+                indexOffset = indexEnd
+
+            lodRanges.append(levels)
+
+        self.meshes    = self.meshes    + meshes
+        self.ranges    = self.ranges    + ranges
+        self.lodRanges = self.lodRanges + lodRanges
+
+        self.vertices = vertices
+        self.indices  = indices
+        self.normals  = normals
+        self.uvs      = uvs
+        self.textures = textures
+
+    def extended(self, meshes: Iterable[Mesh]) -> "ScenePacker":
+        # A Copy With meshes Appended, This Packer Is Left as It Was
+        scene = copy.copy(self)
+        scene.append(meshes)
+
+        return scene
+
+    def rangeOf(self, mesh: Mesh) -> MeshRange:
+        return self.ranges[self.meshes.index(mesh)]
+
+    def levelRanges(self, meshIndex: int) -> list[MeshRange]:
+        # Full Detail First, Then Each Coarser Level
+        return [self.ranges[meshIndex]] + self.lodRanges[meshIndex]
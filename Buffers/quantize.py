@@ -0,0 +1,185 @@
+import numpy as np
+
+from Acceleration.twolevel import TwoLevelBVH
+
+# Compressed Geometry for the Shaders, Decoded There by Fetch* in Shaders/scene.glsl (QUANTIZED_GEOMETRY)
+#   Positions: 3 x uint16 Steps Across Each Mesh's Bounds (8 Bytes, Was 16)
+#   Normals:   Octahedral, 2 x snorm16 (4 Bytes, Was 16)
+#   UVs:       2 x float16 (4 Bytes, Was 8)
+#   Indices:   Local to Their Mesh, uint16 When Every Mesh Has at Most 65536 Vertices
+class QuantizedGeometry:
+    LAYOUT = "quantized"
+
+    # Matches `struct MeshQuantization` in Shaders/scene.glsl (std430, 32 Bytes)
+    MESH_DTYPE = np.dtype({
+        "names":    ["boundsMin",  "vertexOffset", "stepSize",   "padding"],
+        "formats":  [("<f4", 3),   "<u4",          ("<f4", 3),   "<u4"    ],
+        "offsets":  [0, 12, 16, 28],
+        "itemsize": 32,
+    })
+
+    POSITION_STEPS = 65535
+    NORMAL_STEPS   = 32767
+    INDEX_16_LIMIT = 1 << 16
+
+    def __init__(self, accel: TwoLevelBVH) -> None:
+        self.accel = accel
+        self.scene = accel.scene
+
+        self.quantizeMeshes()
+        self.positions = self.quantizePositions()
+        self.normals   = QuantizedGeometry.encodeOctahedral(self.scene.normals[:, :3])
+        self.uvs       = np.ascontiguousarray(self.scene.uvs.astype(np.float16)).view(np.uint32).reshape(-1)
+        self.indices   = self.localIndices()
+        self.nodes     = self.expandNodes()
+
+    @property
+    def index16(self) -> bool:  return self.indices.dtype == np.uint16
+
+    @property
+    def defines(self) -> dict:
+        defines = {"QUANTIZED_GEOMETRY": 1}
+        if self.index16:  defines["INDEX_16"] = 1
+
+        return defines
+
+    def quantizeMeshes(self) -> None:
+        self.meshes = np.zeros(max(1, len(self.scene.ranges)), dtype=QuantizedGeometry.MESH_DTYPE)
+
+        for meshIndex, meshRange in enumerate(self.scene.ranges):
+            vertices = self.scene.vertices[meshRange.vertexOffset:meshRange.vertexOffset + meshRange.vertexCount, :3]
+            boundsMin = vertices.min(axis=0) if len(vertices) else np.zeros(3, dtype=np.float32)
+            boundsMax = vertices.max(axis=0) if len(vertices) else np.zeros(3, dtype=np.float32)
+
+            self.meshes[meshIndex]["boundsMin"]    = boundsMin
+            self.meshes[meshIndex]["stepSize"]     = (boundsMax - boundsMin) / QuantizedGeometry.POSITION_STEPS
+            self.meshes[meshIndex]["vertexOffset"] = meshRange.vertexOffset
+
+    def vertexMeshes(self) -> np.ndarray:
+        # Mesh Index of Every Packed Vertex
+        return np.repeat(np.arange(len(self.scene.ranges)), [meshRange.vertexCount for meshRange in self.scene.ranges])
+
+    def quantizePositions(self) -> np.ndarray:
+        meshOf   = self.vertexMeshes()
+        boundsMin = self.meshes["boundsMin"][meshOf]
+        stepSize  = self.meshes["stepSize"][meshOf]
+
+        # Flat Axes Have No Steps, Everything on Them Sits at boundsMin
+        with np.errstate(divide="ignore", invalid="ignore"):
+            steps = np.where(stepSize > 0.0, (self.scene.vertices[:, :3] - boundsMin) / stepSize, 0.0)
+
+        # Fourth Lane Pads Each Vertex to a uvec2
+        positions = np.zeros((len(steps), 4), dtype=np.uint16)
+        positions[:, :3] = np.clip(np.rint(steps), 0, QuantizedGeometry.POSITION_STEPS)
+
+        return positions
+
+    def decodePositions(self) -> np.ndarray:
+        # Same Arithmetic as FetchVertex, in float32
+        meshOf = self.vertexMeshes()
+        return self.meshes["boundsMin"][meshOf] + self.positions[:, :3].astype(np.float32) * self.meshes["stepSize"][meshOf]
+
+    @staticmethod
+    def encodeOctahedral(normals: np.ndarray) -> np.ndarray:
+        # Unit Vector -> Square via the Octahedron, Stored as packSnorm2x16 Would (x Low, y High)
+        normals = np.asarray(normals, dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            projected = normals[:, :2] / np.sum(np.abs(normals), axis=1, keepdims=True)
+        projected = np.nan_to_num(projected)
+
+        # Lower Hemisphere Folds Over the Diagonals
+        signs  = np.where(projected >= 0.0, 1.0, -1.0)
+        folded = (1.0 - np.abs(projected[:, ::-1])) * signs
+        projected = np.where(normals[:, 2:3] < 0.0, folded, projected)
+
+        encoded = np.rint(np.clip(projected, -1.0, 1.0) * QuantizedGeometry.NORMAL_STEPS).astype(np.int16)
+        return np.ascontiguousarray(encoded).view(np.uint32).reshape(-1)
+
+    @staticmethod
+    def decodeOctahedral(encoded: np.ndarray) -> np.ndarray:
+        # Mirrors OctDecode in Shaders/scene.glsl
+        projected = np.maximum(encoded.view(np.int16).reshape(-1, 2).astype(np.float32) / QuantizedGeometry.NORMAL_STEPS, -1.0)
+
+        normals = np.empty((len(projected), 3), dtype=np.float32)
+        normals[:, :2] = projected
+        normals[:, 2]  = 1.0 - np.abs(projected).sum(axis=1)
+
+        fold = np.maximum(-normals[:, 2], 0.0)[:, None]
+        normals[:, :2] += np.where(normals[:, :2] >= 0.0, -fold, fold)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.nan_to_num(normals / np.linalg.norm(normals, axis=1, keepdims=True))
+
+    def localIndices(self) -> np.ndarray:
+        # Each Mesh's Indices Count From Its Own First Vertex, FetchVertex Adds vertexOffset Back
+        local = np.empty(len(self.accel.indices), dtype=np.int64)
+        for meshRange in self.scene.ranges + [lodRange for lodRanges in self.scene.lodRanges for lodRange in lodRanges]:
+            span = slice(meshRange.indexOffset, meshRange.indexOffset + meshRange.indexCount)
+            local[span] = self.accel.indices[span].astype(np.int64) - meshRange.vertexOffset
+
+        largest = max((meshRange.vertexCount for meshRange in self.scene.ranges), default=0)
+        if largest > QuantizedGeometry.INDEX_16_LIMIT:  return local.astype(np.uint32)
+
+        # Two per Word in the Shader, an Odd Count Gets One Padding Index
+        return np.concatenate([local, np.zeros(len(local) % 2, dtype=np.int64)]).astype(np.uint16)
+
+    def expandNodes(self) -> np.ndarray:
+        # Rounding Moves Vertices up to Half a Step, Inner Node Bounds Grow by a Full Step to Still Contain Them
+        nodes = self.accel.nodes.copy()
+        stepSize = self.meshes["stepSize"][self.accel.nodeMesh]
+
+        nodes["boundsMin"] -= stepSize
+        nodes["boundsMax"] += stepSize
+
+        return nodes
+
+    def memoryUsage(self) -> dict[str, dict[str, int]]:
+        return {
+            "float": {
+                "vertices": self.scene.vertices.nbytes,
+                "normals":  self.scene.normals.nbytes,
+                "uvs":      self.scene.uvs.nbytes,
+                "indices":  self.accel.indices.nbytes,
+            },
+            "quantized": {
+                "vertices": self.positions.nbytes,
+                "normals":  self.normals.nbytes,
+                "uvs":      self.uvs.nbytes,
+                "indices":  self.indices.nbytes,
+                "meshes":   self.meshes.nbytes,
+            },
+        }
+
+    def errorReport(self) -> list[dict]:
+        # Worst Case Decode Error per Mesh, Positions Also Relative to the Bounds Diagonal
+        positions = self.decodePositions()
+        normals   = QuantizedGeometry.decodeOctahedral(self.normals)
+        uvs       = self.uvs.view(np.float16).reshape(-1, 2).astype(np.float32)
+
+        report = []
+        for meshIndex, meshRange in enumerate(self.scene.ranges):
+            span = slice(meshRange.vertexOffset, meshRange.vertexOffset + meshRange.vertexCount)
+
+            original  = self.scene.vertices[span, :3]
+            diagonal  = float(np.linalg.norm(np.ptp(original, axis=0))) if len(original) else 0.0
+            positionError = float(np.linalg.norm(positions[span] - original, axis=1).max(initial=0.0))
+
+            row = {
+                "mesh":             meshIndex,
+                "vertices":         meshRange.vertexCount,
+                "positionError":    positionError,
+                "positionRelative": positionError / diagonal if diagonal > 0.0 else 0.0,
+            }
+
+            if len(self.scene.normals):
+                originalNormals = self.scene.normals[span, :3]
+                valid  = np.linalg.norm(originalNormals, axis=1) > 0.5
+                cosine = np.clip(np.sum(normals[span][valid] * originalNormals[valid], axis=1), -1.0, 1.0)
+                row["normalErrorDegrees"] = float(np.degrees(np.arccos(cosine)).max(initial=0.0))
+
+            if len(self.scene.uvs):
+                row["uvError"] = float(np.abs(uvs[span] - self.scene.uvs[span]).max(initial=0.0))
+
+            report.append(row)
+
+        return report
@@ -0,0 +1,123 @@
+import ctypes
+import numpy as np
+from OpenGL.GL import *
+
+from settings import Settings
+
+# Per Frame Streaming Without Reallocation or Stalls: One Buffer Split into Regions Written Round Robin
+#   Persistent Mode Maps It Once (glBufferStorage) and Writes Straight into the Mapping,
+#   a Fence per Region Only Blocks if the GPU Is Still Reading It regions Frames Later
+class RingBuffer:
+    FLAGS = GL_MAP_WRITE_BIT | GL_MAP_PERSISTENT_BIT | GL_MAP_COHERENT_BIT
+
+    OFFSET_ALIGNMENTS = {
+        GL_SHADER_STORAGE_BUFFER: GL_SHADER_STORAGE_BUFFER_OFFSET_ALIGNMENT,
+        GL_UNIFORM_BUFFER:        GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT,
+    }
+
+    def __init__(
+            self,
+            regionSize: int,
+            target = GL_SHADER_STORAGE_BUFFER,
+            regions:    int  = Settings.Buffers.RING_REGIONS,
+            persistent: bool = Settings.Buffers.PERSISTENT
+        ) -> None:
+
+        self.target  = target
+        self.regions = regions
+
+        # Falls Back to glBufferSubData into Rotating Regions Without GL 4.4 / ARB_buffer_storage
+        self.persistent = persistent and bool(glBufferStorage)
+
+        alignmentQuery = RingBuffer.OFFSET_ALIGNMENTS.get(target)
+        self.alignment = int(glGetIntegerv(alignmentQuery)) if alignmentQuery is not None else 1
+
+        self.ID = None
+        self.index = 0
+        self.stalls = 0  # Writes That Had to Wait for the GPU
+
+        self.allocate(regionSize)
+
+    def align(self, nbytes: int) -> int:
+        return (nbytes + self.alignment - 1) // self.alignment * self.alignment
+
+    def allocate(self, regionSize: int) -> None:
+        self.regionSize = self.align(max(regionSize, 1))
+        self.fences = [None] * self.regions
+        self.mapped = None
+
+        self.ID = glGenBuffers(1)
+        glBindBuffer(self.target, self.ID)
+
+        totalSize = self.regionSize * self.regions
+        if self.persistent:
+            glBufferStorage(self.target, totalSize, None, RingBuffer.FLAGS)
+            pointer = glMapBufferRange(self.target, 0, totalSize, RingBuffer.FLAGS)
+            self.mapped = np.ctypeslib.as_array((ctypes.c_ubyte * totalSize).from_address(pointer))
+        else:
+            glBufferData(self.target, totalSize, None, GL_STREAM_DRAW)
+
+        glBindBuffer(self.target, 0)
+
+    def grow(self, nbytes: int) -> None:
+        # Immutable Storage Can't Be Resized, Drain Every Region and Replace It at Double Size
+        for region in range(self.regions):  self.waitRegion(region)
+
+        self.release()
+        self.allocate(max(nbytes, 2 * self.regionSize))
+
+    def waitRegion(self, region: int) -> None:
+        fence = self.fences[region]
+        if fence is None:  return
+
+        result = glClientWaitSync(fence, 0, 0)
+        if result == GL_TIMEOUT_EXPIRED:
+            self.stalls += 1
+            while result == GL_TIMEOUT_EXPIRED:
+                result = glClientWaitSync(fence, GL_SYNC_FLUSH_COMMANDS_BIT, 1_000_000)
+
+        glDeleteSync(fence)
+        self.fences[region] = None
+
+        if result == GL_WAIT_FAILED:  raise RuntimeError("Waiting on a ring buffer fence failed")
+
+    def write(self, data: np.ndarray, bindingPoint: int | None = None) -> int:
+        # Copies data into the Next Region and Binds That Range, Returns Its Byte Offset
+        #   Non Indexed Targets (Pixel Unpack) Pass No bindingPoint and Bind the Whole Buffer Themselves
+        data = np.ascontiguousarray(data)
+        if data.nbytes > self.regionSize:  self.grow(data.nbytes)
+
+        self.index = (self.index + 1) % self.regions
+        self.waitRegion(self.index)
+
+        offset = self.index * self.regionSize
+        if self.persistent:
+            self.mapped[offset:offset + data.nbytes] = data.reshape(-1).view(np.uint8)
+        else:
+            glBindBuffer(self.target, self.ID)
+            glBufferSubData(self.target, offset, data.nbytes, data)
+            glBindBuffer(self.target, 0)
+
+        if bindingPoint is not None:  glBindBufferRange(self.target, bindingPoint, self.ID, offset, max(data.nbytes, 1))
+        return offset
+
+    def fence(self) -> None:
+        # Call After the Draws Reading the Current Region Were Submitted
+        if not self.persistent:  return
+
+        if self.fences[self.index] is not None:  glDeleteSync(self.fences[self.index])
+        self.fences[self.index] = glFenceSync(GL_SYNC_GPU_COMMANDS_COMPLETE, 0)
+
+    def release(self) -> None:
+        for fence in self.fences:
+            if fence is not None:  glDeleteSync(fence)
+
+        if self.persistent:
+            glBindBuffer(self.target, self.ID)
+            glUnmapBuffer(self.target)
+            glBindBuffer(self.target, 0)
+
+        glDeleteBuffers(1, [self.ID])
+        self.mapped = None
+
+    def delete(self) -> None:  self.release()
@@ -0,0 +1,51 @@
+import numpy as np
+
+from Acceleration.intersect import Intersection
+from Acceleration.twolevel  import TwoLevelBVH
+
+# Triangles Stored Whole, in Leaf Order: v0, edge1, edge2 and the Face Normal Side by Side
+#   The Hit Loop Reads One 64 Byte Record per Triangle Instead of Three Indices and Three Scattered Vertices,
+#   and Neither the Edges Nor the Normal Are Recomputed. The Same Arrays Feed TwoLevelBVH.intersect on the CPU
+class TriangleSoup:
+    LAYOUT = "soup"
+
+    # Matches `struct SoupTriangle` in Shaders/scene.glsl (std430, 64 Bytes)
+    DTYPE = np.dtype({
+        "names":    ["v0",        "edge1",     "edge2",     "normal"   ],
+        "formats":  [("<f4", 3),  ("<f4", 3),  ("<f4", 3),  ("<f4", 3) ],
+        "offsets":  [0, 16, 32, 48],
+        "itemsize": 64,
+    })
+
+    def __init__(self, accel: TwoLevelBVH) -> None:
+        self.accel = accel
+        self.scene = accel.scene
+
+        v0, edge1, edge2 = accel.triangleEdges()
+        self.triangles = TriangleSoup.pack(v0, edge1, edge2)
+
+    @property
+    def defines(self) -> dict:  return {"TRIANGLE_SOUP": 1}
+
+    @staticmethod
+    def pack(v0: np.ndarray, edge1: np.ndarray, edge2: np.ndarray) -> np.ndarray:
+        # An Empty Buffer Can't Be Bound, Keep at Least One Record
+        triangles = np.zeros(max(1, len(v0)), dtype=TriangleSoup.DTYPE)
+
+        triangles["v0"][:len(v0)]     = v0
+        triangles["edge1"][:len(v0)]  = edge1
+        triangles["edge2"][:len(v0)]  = edge2
+        triangles["normal"][:len(v0)] = np.nan_to_num(Intersection.triangleNormals(edge1, edge2))
+
+        return triangles
+
+    def memoryUsage(self) -> dict[str, dict[str, int]]:
+        return {
+            "float": {
+                "vertices": self.scene.vertices.nbytes,
+                "indices":  self.accel.indices.nbytes,
+            },
+            "soup": {
+                "triangles": self.triangles.nbytes,
+            },
+        }
@@ -6,11 +6,22 @@ from typing import Union
 
 number = Union[int, float]
 
+def setSamplerParams(target, levels: int) -> None:
+    glTexParameteri(target, GL_TEXTURE_MIN_FILTER, GL_LINEAR_MIPMAP_LINEAR if levels > 1 else GL_LINEAR)
+    glTexParameteri(target, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+    glTexParameteri(target, GL_TEXTURE_MAX_LEVEL,  levels - 1)
+
+    glTexParameteri(target, GL_TEXTURE_WRAP_S, GL_REPEAT)  # U
+    glTexParameteri(target, GL_TEXTURE_WRAP_T, GL_REPEAT)  # V
+
 class Texture:
+    TARGET = GL_TEXTURE_2D
+
     def __init__(self) -> None:
         self.ID = glGenTextures(1) # Generate a single texture ID
         self.width = 0
         self.height = 0
+        self.levels = 1
 
     def bind(self, textureUnit=GL_TEXTURE0) -> None:
         glActiveTexture(textureUnit)
@@ -62,6 +73,30 @@ class Texture:
 
         self.unbind()
 
+    @staticmethod
+    def mipLevels(width: int, height: int) -> int:  return max(width, height, 1).bit_length()
+
+    def allocate(self, width: int, height: int, internalFormat=GL_RGBA8, generateMipmaps: bool = True) -> None:
+        # Immutable Storage, Every Level Exists up Front so Streamed Rows Never Reallocate
+        self.width  = width
+        self.height = height
+        self.levels = Texture.mipLevels(width, height) if generateMipmaps else 1
+
+        self.bind()
+        glTexStorage2D(GL_TEXTURE_2D, self.levels, internalFormat, self.width, self.height)
+        setSamplerParams(GL_TEXTURE_2D, self.levels)
+        self.unbind()
+
+    def loadArray(self, pixels: np.ndarray, generateMipmaps: bool = True) -> None:
+        # Synchronous Upload of an RGBA8 Array, Use Buffers.upload.TextureUploader to Stream Instead
+        height, width = pixels.shape[:2]
+        self.allocate(width, height, generateMipmaps=generateMipmaps)
+
+        self.bind()
+        glTexSubImage2D(GL_TEXTURE_2D, 0, 0, 0, width, height, GL_RGBA, GL_UNSIGNED_BYTE, np.ascontiguousarray(pixels[::-1]))
+        if self.levels > 1:  glGenerateMipmap(GL_TEXTURE_2D)
+        self.unbind()
+
     def setParam(self, paramName, param: number) -> None:
         self.bind()
         glTexParameteri(GL_TEXTURE_2D, paramName, param)
@@ -70,11 +105,68 @@ class Texture:
     def delete(self) -> None:  glDeleteTextures(1, [self.ID])
 
 class TextureArray:
+    TARGET = GL_TEXTURE_2D_ARRAY
+
     def __init__(self):
         self.ID = glGenTextures(1)
         self.width  = 0
         self.height = 0
         self.depth  = 0
+        self.levels = 1
+
+    def allocate(self, width: int, height: int, depth: int, internalFormat=GL_RGBA8, generateMipmaps: bool = True) -> None:
+        self.width  = width
+        self.height = height
+        self.depth  = depth
+        self.levels = Texture.mipLevels(width, height) if generateMipmaps else 1
+
+        glBindTexture(GL_TEXTURE_2D_ARRAY, self.ID)
+        glTexStorage3D(GL_TEXTURE_2D_ARRAY, self.levels, internalFormat, self.width, self.height, self.depth)
+        setSamplerParams(GL_TEXTURE_2D_ARRAY, self.levels)
+        glBindTexture(GL_TEXTURE_2D_ARRAY, 0)
+
+    @staticmethod
+    def padLayers(layers: list[np.ndarray]) -> tuple[np.ndarray, int, int]:
+        # Smaller Layers Sit in the Top Left Corner, the Rest Is Transparent Black
+        height = max(layer.shape[0] for layer in layers)
+        width  = max(layer.shape[1] for layer in layers)
+
+        padded = np.zeros((len(layers), height, width, 4), dtype=np.uint8)
+        for i, layer in enumerate(layers):
+            padded[i, :layer.shape[0], :layer.shape[1]] = layer
+
+        return padded, width, height
+
+    def loadArrays(self, layers: list[np.ndarray]) -> None:
+        if len(layers) == 0:  raise ValueError("No layers provided for texture array.")
+
+        padded, width, height = TextureArray.padLayers(layers)
+        self.allocate(width, height, len(layers))
+
+        glBindTexture(GL_TEXTURE_2D_ARRAY, self.ID)
+        glTexSubImage3D(
+            GL_TEXTURE_2D_ARRAY, 0,
+            0, 0, 0,
+            self.width, self.height, self.depth,
+            GL_RGBA, GL_UNSIGNED_BYTE, np.ascontiguousarray(padded[:, ::-1])
+        )
+        glGenerateMipmap(GL_TEXTURE_2D_ARRAY)
+        glBindTexture(GL_TEXTURE_2D_ARRAY, 0)
+
+    def loadLayer(self, layer: int, pixels: np.ndarray) -> None:
+        # Level 0 of One Layer, Already Padded to the Array's Size, Mipmaps Are Left to the Caller
+        glBindTexture(GL_TEXTURE_2D_ARRAY, self.ID)
+        glTexSubImage3D(GL_TEXTURE_2D_ARRAY, 0, 0, 0, layer, self.width, self.height, 1, GL_RGBA, GL_UNSIGNED_BYTE, np.ascontiguousarray(pixels[::-1]))
+        glBindTexture(GL_TEXTURE_2D_ARRAY, 0)
+
+    def copyLayer(self, layer: int, source: "TextureArray", sourceLayer: int) -> None:
+        # Every Mip Level, GPU to GPU, source Must Have the Same Size and Level Count
+        for level in range(self.levels):
+            glCopyImageSubData(
+                source.ID, GL_TEXTURE_2D_ARRAY, level, 0, 0, sourceLayer,
+                self.ID,   GL_TEXTURE_2D_ARRAY, level, 0, 0, layer,
+                max(1, self.width >> level), max(1, self.height >> level), 1
+            )
 
     def loadLayers(self, surfaces: list[pygame.Surface]):
         if len(surfaces) == 0:  raise ValueError("No surfaces provided for texture array.")
@@ -0,0 +1,141 @@
+import ctypes
+import numpy as np
+
+from OpenGL.GL import *
+from collections import deque
+
+from Buffers.ring    import RingBuffer
+from Buffers.texture import Texture, TextureArray
+from settings import Settings
+
+class PendingUpload:
+    def __init__(self, texture: Texture | TextureArray, pixels: np.ndarray, layer: int) -> None:
+        self.texture = texture
+        self.pixels  = pixels  # RGBA8 (Height, Width, 4), Top Row First
+        self.layer   = layer
+        self.row     = 0       # Next GL Row to Upload, GL Rows Count Up From the Bottom
+
+    @property
+    def rowBytes(self) -> int:        return self.pixels.shape[1] * 4
+
+    @property
+    def remainingBytes(self) -> int:  return (self.pixels.shape[0] - self.row) * self.rowBytes
+
+    def takeRows(self, rows: int) -> np.ndarray:
+        # Flipped to GL Order While Copying, the Source Array Is Never Modified
+        height = self.pixels.shape[0]
+        block  = self.pixels[height - self.row - rows:height - self.row][::-1]
+        self.row += rows
+
+        return block
+
+# Streams Texel Rows Through a Pixel Unpack Ring into Immutable Texture Storage
+#   At Most budget Bytes per pump, so Large Texture Sets Load Across Frames Instead of Hitching One
+class TextureUploader:
+    def __init__(self, budget: int = Settings.Textures.UPLOAD_BUDGET) -> None:
+        self.budget = budget
+        self.ring   = RingBuffer(budget, GL_PIXEL_UNPACK_BUFFER)
+        self.queue: deque[PendingUpload] = deque()
+
+        # Textures Still Waiting on Rows, Mipmaps Are Built Once the Count Reaches Zero
+        self.remaining: dict[int, int] = {}
+
+        self.bytesUploaded = 0
+        self.framesUsed    = 0
+
+    def enqueue(self, texture: Texture | TextureArray, pixels: np.ndarray, layer: int = 0) -> None:
+        # texture Must Already Be Allocated, pixels Fills Level 0 (of One Layer) From the Top Left
+        self.queue.append(PendingUpload(texture, np.ascontiguousarray(pixels, dtype=np.uint8), layer))
+        self.remaining[texture.ID] = self.remaining.get(texture.ID, 0) + 1
+
+    def loadTexture(self, pixels: np.ndarray) -> Texture:
+        texture = Texture()
+        texture.allocate(pixels.shape[1], pixels.shape[0])
+        self.enqueue(texture, pixels)
+
+        return texture
+
+    def loadTextureArray(self, layers: list[np.ndarray]) -> TextureArray:
+        if len(layers) == 0:  raise ValueError("No layers provided for texture array.")
+
+        padded, width, height = TextureArray.padLayers(layers)
+
+        texture = TextureArray()
+        texture.allocate(width, height, len(layers))
+        for layer in range(len(layers)):  self.enqueue(texture, padded[layer], layer)
+
+        return texture
+
+    def cancel(self, texture: Texture | TextureArray) -> None:
+        # Drops Queued Rows of a Texture About to Be Deleted
+        self.queue = deque(upload for upload in self.queue if upload.texture is not texture)
+        self.remaining.pop(texture.ID, None)
+
+    @property
+    def pendingBytes(self) -> int:  return sum(upload.remainingBytes for upload in self.queue)
+
+    @property
+    def idle(self) -> bool:  return not self.queue
+
+    def pump(self, budget: int | None = None) -> list[Texture | TextureArray]:
+        # Call Once per Frame, Returns the Textures That Became Complete
+        if not self.queue:  return []
+        if budget is None:  budget = self.budget
+
+        # Rows for Every Texture This Frame Share One Ring Region and One Fence
+        blocks, copies = [], []
+        staged = 0
+        while self.queue:
+            upload = self.queue[0]
+
+            # At Least One Row per Frame, Even When a Single Row Is Over Budget
+            rows = min((budget - staged) // upload.rowBytes, upload.pixels.shape[0] - upload.row)
+            if rows <= 0 and staged > 0:  break
+            rows = max(rows, 1)
+
+            row = upload.row
+            blocks.append(upload.takeRows(rows).reshape(-1))
+            copies.append((upload, row, rows, staged))
+            staged += rows * upload.rowBytes
+
+            if upload.remainingBytes == 0:  self.queue.popleft()
+
+        base = self.ring.write(np.concatenate(blocks))
+        glBindBuffer(GL_PIXEL_UNPACK_BUFFER, self.ring.ID)
+
+        completed = []
+        for upload, row, rows, offset in copies:
+            texture = upload.texture
+            pointer = ctypes.c_void_p(base + offset)
+
+            glBindTexture(texture.TARGET, texture.ID)
+            if texture.TARGET == GL_TEXTURE_2D_ARRAY:
+                glTexSubImage3D(GL_TEXTURE_2D_ARRAY, 0, 0, row, upload.layer, upload.pixels.shape[1], rows, 1, GL_RGBA, GL_UNSIGNED_BYTE, pointer)
+            else:
+                glTexSubImage2D(GL_TEXTURE_2D, 0, 0, row, upload.pixels.shape[1], rows, GL_RGBA, GL_UNSIGNED_BYTE, pointer)
+
+            if upload.remainingBytes == 0:
+                self.remaining[texture.ID] -= 1
+                if self.remaining[texture.ID] == 0:
+                    del self.remaining[texture.ID]
+                    if texture.levels > 1:  glGenerateMipmap(texture.TARGET)
+                    completed.append(texture)
+
+            glBindTexture(texture.TARGET, 0)
+
+        glBindBuffer(GL_PIXEL_UNPACK_BUFFER, 0)
+        self.ring.fence()
+
+        self.bytesUploaded += staged
+        self.framesUsed    += 1
+
+        return completed
+
+    def flush(self) -> list[Texture | TextureArray]:
+        # Uploads Everything Left, for Loading Screens and Tests
+        completed = []
+        while self.queue:  completed.extend(self.pump())
+
+        return completed
+
+    def delete(self) -> None:  self.ring.delete()
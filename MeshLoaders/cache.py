@@ -0,0 +1,234 @@
+import hashlib
+import json
+import mmap
+import numpy as np
+import os
+import struct
+import threading
+
+from typing import Callable
+from os     import path
+
+from MeshLoaders.glb import GLB
+from settings import Settings
+
+# Preprocessed Mesh Blobs, Keyed by Asset Content Hash + Loader Version
+#   Layout: MAGIC | u32 Header Length | JSON Header | Arrays, Each Aligned to ALIGNMENT
+#   The Header Records the Source Assets and Their Digests, so Entries Can Be Dropped by Filename Once the Asset Has Changed
+class MeshCache:
+    MAGIC     = b"RCMC"
+    VERSION   = 2  # Bump When the Blob Layout Changes
+    ALIGNMENT = 64
+    EXTENSION = ".blob"
+
+    def __init__(
+            self,
+            directory: str  = Settings.Cache.DIRECTORY,
+            maxBytes:  int  = Settings.Cache.MAX_BYTES,
+            enabled:   bool = Settings.Cache.ENABLED
+        ) -> None:
+
+        self.directory = directory
+        self.maxBytes  = maxBytes
+        self.enabled   = enabled
+
+        self.hits   = 0
+        self.misses = 0
+
+        # filename -> (mtime, size, digest), so Each Asset Is Hashed Once per Run
+        self.digests: dict[str, tuple[float, int, bytes]] = {}
+
+        # key -> Source Assets It Was Hashed From, Written into the Header of Every Entry Stored Under It
+        self.keySources: dict[str, tuple[str, ...]] = {}
+
+        # Loader Threads Store at Once, One Evicts at a Time, and Stale Entries Are Only Looked For Once per Run
+        self.evictLock = threading.Lock()
+        self.pruned    = False
+
+    def key(self, *filenames: str) -> str:
+        if not self.enabled:  return ""  # Nothing Is Looked Up, Skip Hashing
+
+        digest = hashlib.sha256(f"{MeshCache.VERSION}:{GLB.LOADER_VERSION}".encode())
+
+        for filename in filenames:  digest.update(self.fileDigest(filename))
+
+        key = digest.hexdigest()
+        self.keySources[key] = tuple(MeshCache.sourcePath(filename) for filename in filenames)
+        return key
+
+    def fileDigest(self, filename: str) -> bytes:
+        stat = os.stat(filename)
+        known = self.digests.get(filename)
+        if known is not None and known[:2] == (stat.st_mtime, stat.st_size):  return known[2]
+
+        with open(filename, "rb") as f:
+            fileDigest = hashlib.file_digest(f, "sha256").digest()
+
+        self.digests[filename] = (stat.st_mtime, stat.st_size, fileDigest)
+        return fileDigest
+
+    def entryPath(self, key: str, name: str) -> str:
+        return path.join(self.directory, f"{key}.{name}{MeshCache.EXTENSION}")
+
+    def load(self, key: str, name: str) -> dict[str, np.ndarray] | None:
+        if not self.enabled:  return None
+
+        entryPath = self.entryPath(key, name)
+        if not path.exists(entryPath):  return None
+
+        try:
+            with open(entryPath, "rb") as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            magic, headerLength = struct.unpack_from("<4sI", data, 0)
+            if magic != MeshCache.MAGIC:  raise ValueError("Invalid cache blob")
+
+            header = json.loads(data[8:8 + headerLength].decode("utf-8"))
+
+            # Views into the Mapping, Nothing Is Read Until It Is Touched
+            arrays = {}
+            for arrayName, (offset, dtype, shape) in header["arrays"].items():
+                dtype = np.dtype(dtype)
+                count = int(np.prod(shape))
+                arrays[arrayName] = np.frombuffer(data, dtype=dtype, count=count, offset=offset).reshape(shape)
+
+        except (OSError, ValueError, KeyError, struct.error) as e:
+            print(f"Warning: discarding unreadable cache entry '{entryPath}': {e}")
+            self.remove(entryPath)
+            return None
+
+        os.utime(entryPath)  # Most Recently Used
+        return arrays
+
+    def store(self, key: str, name: str, arrays: dict[str, np.ndarray]) -> None:
+        if not self.enabled:  return
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        arrays  = {arrayName: np.ascontiguousarray(array) for arrayName, array in arrays.items() if array is not None}
+        sources = {source: self.fileDigest(source).hex() for source in self.keySources.get(key, ())}
+
+        # Offsets Depend on the Header Length, so Lay Out Until the Header Stops Growing
+        headerBytes = b""
+        while True:
+            header, offset = {}, MeshCache.align(8 + len(headerBytes))
+            for arrayName, array in arrays.items():
+                header[arrayName] = (offset, array.dtype.str, list(array.shape))
+                offset = MeshCache.align(offset + array.nbytes)
+
+            newHeaderBytes = json.dumps({"sources": sources, "arrays": header}).encode("utf-8")
+            if len(newHeaderBytes) == len(headerBytes):  break
+            headerBytes = newHeaderBytes
+
+        entryPath = self.entryPath(key, name)
+        tempPath  = f"{entryPath}.{os.getpid()}.{threading.get_ident()}.tmp"  # Loader Threads May Store the Same Entry at Once
+
+        with open(tempPath, "wb") as f:
+            f.write(struct.pack("<4sI", MeshCache.MAGIC, len(headerBytes)))
+            f.write(headerBytes)
+
+            for arrayName, array in arrays.items():
+                f.seek(header[arrayName][0])
+                f.write(array.tobytes())
+
+        os.replace(tempPath, entryPath)
+        self.evict()
+
+    def fetch(self, key: str, name: str, build: Callable[[], dict[str, np.ndarray]]) -> dict[str, np.ndarray]:
+        arrays = self.load(key, name)
+        if arrays is not None:
+            self.hits += 1
+            return arrays
+
+        self.misses += 1
+        arrays = {arrayName: array for arrayName, array in build().items() if array is not None}
+        self.store(key, name, arrays)
+
+        return arrays
+
+    def entries(self) -> list[tuple[str, int, float]]:
+        if not path.isdir(self.directory):  return []
+
+        entries = []
+        for filename in os.listdir(self.directory):
+            if not filename.endswith(MeshCache.EXTENSION):  continue
+
+            # Another Thread May Have Removed It Since the Listing
+            entryPath = path.join(self.directory, filename)
+            try:
+                stat = os.stat(entryPath)
+            except OSError:
+                continue
+
+            entries.append((entryPath, stat.st_size, stat.st_mtime))
+
+        return entries
+
+    @property
+    def size(self) -> int:  return sum(size for _, size, _ in self.entries())
+
+    def evict(self) -> None:
+        # Entries for Edited or Deleted Assets Can Never Hit Again, Dropped on the First Store of a Run Rather Than Rehashed on Every One,
+        #   Then Least Recently Used First Until Under the Size Cap
+        with self.evictLock:
+            if not self.pruned:
+                self.prune()
+                self.pruned = True
+
+            entries = sorted(self.entries(), key=lambda entry: entry[2])
+            total = sum(size for _, size, _ in entries)
+
+            for entryPath, size, _ in entries:
+                if total <= self.maxBytes:  break
+
+                self.remove(entryPath)
+                total -= size
+
+    def invalidate(self, *filenames: str) -> None:
+        # Drops Every Entry Built From the Given Assets, Whatever Their Content Is Now, or the Whole Cache When None Are Given
+        if not self.enabled:  return
+
+        targets = {MeshCache.sourcePath(filename) for filename in filenames}
+
+        for entryPath, _, _ in self.entries():
+            sources = MeshCache.entrySources(entryPath)
+            if not targets or sources is None or targets & sources.keys():  self.remove(entryPath)
+
+    def prune(self) -> None:
+        # Drops Entries Whose Source Asset Was Deleted or No Longer Matches the Digest It Was Built From
+        if not self.enabled:  return
+
+        for entryPath, _, _ in self.entries():
+            sources = MeshCache.entrySources(entryPath)
+            if sources is None or any(not self.matches(source, digest) for source, digest in sources.items()):  self.remove(entryPath)
+
+    def matches(self, source: str, digest: str) -> bool:
+        try:
+            return self.fileDigest(source).hex() == digest
+        except OSError:
+            return False
+
+    @staticmethod
+    def entrySources(entryPath: str) -> dict[str, str] | None:
+        # Source Path -> Hex Digest From an Entry's Header, None When It Is Unreadable or Predates Source Tracking
+        try:
+            with open(entryPath, "rb") as f:
+                magic, headerLength = struct.unpack("<4sI", f.read(8))
+                if magic != MeshCache.MAGIC:  return None
+
+                return json.loads(f.read(headerLength).decode("utf-8"))["sources"]
+        except (OSError, ValueError, KeyError, TypeError, struct.error):
+            return None
+
+    @staticmethod
+    def sourcePath(filename: str) -> str:  return path.normcase(path.abspath(filename))
+
+    def remove(self, entryPath: str) -> None:
+        try:
+            os.remove(entryPath)
+        except OSError:
+            pass
+
+    @staticmethod
+    def align(offset: int) -> int:
+        return (offset + MeshCache.ALIGNMENT - 1) // MeshCache.ALIGNMENT * MeshCache.ALIGNMENT
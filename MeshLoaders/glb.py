@@ -1,19 +1,34 @@
 import base64
 import json
-import pygame
+import mmap
+import numpy as np
 import struct
 
-from io     import BytesIO
 from typing import Union
 from os     import path
 
 number = Union[int, float]
 
 class GLB:
+    LOADER_VERSION = 1  # Bump When Decoding Changes, Invalidates the Mesh Cache
+
+    # glTF componentType -> Little Endian NumPy dtype
+    COMPONENT_TYPES = {
+        5120: np.dtype("<i1"),  # BYTE
+        5121: np.dtype("<u1"),  # UNSIGNED_BYTE
+        5122: np.dtype("<i2"),  # SHORT
+        5123: np.dtype("<u2"),  # UNSIGNED_SHORT
+        5125: np.dtype("<u4"),  # UNSIGNED_INT
+        5126: np.dtype("<f4"),  # FLOAT
+    }
+
+    COMPONENT_COUNTS = {"SCALAR": 1, "VEC2": 2, "VEC3": 3, "VEC4": 4}
+
     @staticmethod
     def load(filename: str):
+        # Map the file instead of reading it, accessors become views into the mapping
         with open(filename, "rb") as f:
-            data = f.read()
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
 
         # Parse GLB header
         magic, version, length = struct.unpack_from("<4sII", data, 0)
@@ -33,7 +48,7 @@ class GLB:
 
         binStart = jsonEnd + 8
         binEnd  = binStart + binChunkLength
-        binBlob = data[binStart:binEnd]
+        binBlob = memoryview(data)[binStart:binEnd]
 
         mesh = jsonData["meshes"][0]
         primitive = mesh["primitives"][0]
@@ -43,78 +58,78 @@ class GLB:
         uvs       = GLB.unpackAttr(jsonData, binBlob, primitive, "TEXCOORD_0")
         
         indices = GLB.unpackIndices(jsonData, binBlob, primitive)
-        texture = GLB.loadTextureSurface(jsonData, filename, primitive, binBlob)
+        texture = GLB.loadTextureSource(jsonData, filename, primitive, binBlob)
 
         return positions, indices, normals, uvs, texture
-    
-    @staticmethod
-    def unpackAttr(jsonData, binBlob, primitive, attrName):
-        if attrName not in primitive["attributes"]:  return None
 
-        accessorIndex = primitive["attributes"][attrName]
-        accessor   = jsonData["accessors"][accessorIndex]
-        bufferView = jsonData["bufferViews"][accessor["bufferView"]]
+    @staticmethod
+    def unpackAccessor(jsonData, binBlob, accessorIndex) -> np.ndarray:
+        accessor = jsonData["accessors"][accessorIndex]
 
-        byteOffset = bufferView.get("byteOffset", 0) + accessor.get("byteOffset", 0)
         compType   = accessor["componentType"]
         count      = accessor["count"]
         typeString = accessor["type"]
 
-        # Supported Component Types
-        if compType == 5126:
-            fmtChar = "f"
-            bytesPerComp = 4
-        elif compType == 5123:
-            fmtChar = "H"
-            bytesPerComp = 2
-        elif compType == 5125:
-            fmtChar = "I"
-            bytesPerComp = 4
-        else:
+        if compType not in GLB.COMPONENT_TYPES:
             raise NotImplementedError(f"Unsupported component type: {compType}")
+        if typeString not in GLB.COMPONENT_COUNTS:
+            raise NotImplementedError(f"Unsupported accessor type: {typeString}")
+        if "sparse" in accessor:
+            raise NotImplementedError("Sparse accessors are not supported")
+
+        dtype     = GLB.COMPONENT_TYPES[compType]
+        compCount = GLB.COMPONENT_COUNTS[typeString]
+        shape     = (count,) if compCount == 1 else (count, compCount)
+
+        # Accessors without a bufferView are defined to be all zeros
+        if "bufferView" not in accessor:
+            values = np.zeros(shape, dtype=dtype)
+        else:
+            bufferView = jsonData["bufferViews"][accessor["bufferView"]]
 
-        compCount = {"SCALAR": 1, "VEC2": 2, "VEC3": 3, "VEC4": 4}[typeString]
+            byteOffset  = bufferView.get("byteOffset", 0) + accessor.get("byteOffset", 0)
+            elementSize = dtype.itemsize * compCount
+            byteStride  = bufferView.get("byteStride", elementSize)
 
-        values = []
-        for i in range(count):
-            start = byteOffset + i * compCount * bytesPerComp
-            comps = tuple(struct.unpack_from("<" + fmtChar * compCount, binBlob, start))
+            # Strided view straight into the BIN chunk, no copy
+            strides = (byteStride,) if compCount == 1 else (byteStride, dtype.itemsize)
+            values  = np.ndarray(shape, dtype=dtype, buffer=binBlob, offset=byteOffset, strides=strides)
 
-            values.append(comps)
+        if accessor.get("normalized", False) and dtype.kind in "iu":
+            values = GLB.normalize(values)
 
         return values
 
     @staticmethod
-    def unpackIndices(jsonData, binBlob, primitive):
-        if "indices" not in primitive:  return None
+    def normalize(values: np.ndarray) -> np.ndarray:
+        # glTF 2.0 Normalized Integers: f = max(c / MAX, -1.0)
+        info = np.iinfo(values.dtype)
+        normalized = values.astype(np.float32) / np.float32(info.max)
 
-        accessorIndex = primitive["indices"]
-        accessor   = jsonData["accessors"][accessorIndex]
-        bufferView = jsonData["bufferViews"][accessor["bufferView"]]
+        if info.min < 0:  np.maximum(normalized, -1.0, out=normalized)
 
-        byteOffset = bufferView.get("byteOffset", 0) + accessor.get("byteOffset", 0)
-        count = accessor["count"]
-        componentType = accessor["componentType"]
+        return normalized
+    
+    @staticmethod
+    def unpackAttr(jsonData, binBlob, primitive, attrName) -> np.ndarray | None:
+        if attrName not in primitive["attributes"]:  return None
 
-        if componentType == 5123:
-            fmtChar = "H"
-            bytesPerComp = 2
-        elif componentType == 5125:
-            fmtChar = "I"
-            bytesPerComp = 4
-        else:
-            raise NotImplementedError(f"Unsupported index component type: {componentType}")
+        return GLB.unpackAccessor(jsonData, binBlob, primitive["attributes"][attrName])
+
+    @staticmethod
+    def unpackIndices(jsonData, binBlob, primitive) -> np.ndarray | None:
+        if "indices" not in primitive:  return None
+
+        indices = GLB.unpackAccessor(jsonData, binBlob, primitive["indices"])
 
-        indices = []
-        for i in range(count):
-            start = byteOffset + i * bytesPerComp
-            index = struct.unpack_from("<" + fmtChar, binBlob, start)[0]
-            indices.append(index)
+        if indices.dtype not in (np.uint8, np.uint16, np.uint32):
+            raise NotImplementedError(f"Unsupported index component type: {indices.dtype}")
 
-        return indices
+        return indices.reshape(-1)
 
     @staticmethod
-    def loadTextureSurface(jsonData, filename, primitive, binBlob=None):
+    def loadTextureSource(jsonData, filename, primitive, binBlob=None) -> bytes | str | None:
+        # Still Encoded, Decoding Is Left to MeshLoaders.image So It Can Run off the Main Thread
         materialIndex = primitive.get("material")
         if materialIndex is None:  return None
 
@@ -132,14 +147,9 @@ class GLB:
 
             if imageUri.startswith("data:"):
                 header, encoded = imageUri.split(",", 1)
-                imageBytes = base64.b64decode(encoded)
-                imageStream = BytesIO(imageBytes)
-                surface = pygame.image.load(imageStream)
-            else:
-                imagePath = path.join(path.dirname(filename), imageUri)
-                surface = pygame.image.load(imagePath)
+                return base64.b64decode(encoded)
 
-            return surface
+            return path.join(path.dirname(filename), imageUri)
 
         elif "bufferView" in imageInfo:
             bufferViewIndex = imageInfo["bufferView"]
@@ -147,8 +157,7 @@ class GLB:
             byteOffset = bufferView.get("byteOffset", 0)
             byteLength = bufferView["byteLength"]
 
-            imageBytes = binBlob[byteOffset:byteOffset + byteLength]
-            imageStream = BytesIO(imageBytes)
-            surface = pygame.image.load(imageStream)
+            # Copied Out of the Mapping, the Decoder Thread May Outlive It
+            return bytes(binBlob[byteOffset:byteOffset + byteLength])
 
-            return surface
+        return None
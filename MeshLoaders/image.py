@@ -0,0 +1,37 @@
+import numpy as np
+import os
+import pygame
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from io import BytesIO
+from typing import Iterable
+
+from settings import Settings
+
+# Encoded Image Bytes or a File Path
+ImageSource = bytes | str
+
+# Decodes Images on a Thread Pool, SDL_image Releases the GIL While It Works
+#   Results Are Tightly Packed RGBA8 Arrays (Height, Width, 4), Top Row First
+class ImageDecoder:
+    def __init__(self, workers: int = Settings.Textures.DECODE_WORKERS) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ImageDecoder")
+
+    @staticmethod
+    def decode(source: ImageSource) -> np.ndarray:
+        surface = pygame.image.load(BytesIO(source) if isinstance(source, bytes) else source)
+        width, height = surface.get_size()
+
+        return np.frombuffer(pygame.image.tostring(surface, "RGBA"), dtype=np.uint8).reshape(height, width, 4)
+
+    def submit(self, source: ImageSource) -> Future:  return self.pool.submit(ImageDecoder.decode, source)
+
+    def decodeAll(self, sources: Iterable[ImageSource]) -> list[np.ndarray]:
+        # Every Image Starts Decoding Before the First One Is Awaited, Order Is Kept
+        return list(self.pool.map(ImageDecoder.decode, sources))
+
+    def close(self) -> None:  self.pool.shutdown()
+
+    def __enter__(self) -> "ImageDecoder":  return self
+    def __exit__(self, *args) -> None:      self.close()
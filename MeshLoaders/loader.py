@@ -0,0 +1,146 @@
+import os
+import queue
+import threading
+import time
+
+from concurrent import futures
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable
+
+from Acceleration.bvh  import BVH
+from MeshLoaders.cache import MeshCache
+from MeshLoaders.image import ImageDecoder
+
+from mesh import Mesh
+from settings import Settings
+
+# Everything a Mesh Needs Before It Can Join a Scene, Built Entirely off the GL Thread
+class LoadedAsset:
+    def __init__(self, filename: str, mesh: Mesh | None, blas: BVH | None, lodBlases: list[BVH], seconds: float, error: Exception | None = None) -> None:
+        self.filename  = filename
+        self.mesh      = mesh
+        self.blas      = blas
+        self.lodBlases = lodBlases
+        self.seconds   = seconds  # Worker Time From Start of Parsing to Ready
+        self.error     = error
+
+    @property
+    def failed(self) -> bool:  return self.error is not None
+
+# Parses GLBs, Decodes Their Textures and Builds Their Bottom Levels on Worker Threads
+#   Finished Assets Wait in a Queue Until the GL Thread Takes Them, Nothing Here Touches GL
+class AssetLoader:
+    def __init__(
+            self,
+            cache:   MeshCache | None = None,
+            workers: int              = Settings.Streaming.WORKERS,
+            notify:  Callable[[], None] | None = None  # Called From a Worker Whenever an Asset Is Ready, e.g. to Wake an Idle Loop
+        ) -> None:
+
+        self.cache   = cache or MeshCache()
+        self.workers = workers or os.cpu_count() or 1
+        self.notify  = notify
+
+        self.pool    = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="AssetLoader")
+        self.packer  = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ScenePacker")  # Whole Scene Work, in Order and Never Queued Behind Loads
+        self.decoder = ImageDecoder()
+        self.ready: queue.Queue[LoadedAsset] = queue.Queue()
+        self.submitted: list[Future] = []
+
+        # Progress, Counters Are Only Bumped Under the Lock
+        self.lock = threading.Lock()
+        self.requested = 0
+        self.loaded    = 0
+        self.failed    = 0
+        self.startTime = None
+
+    @staticmethod
+    def bvhName() -> str:
+        # Bottom Levels Depend on the Build Settings and the Exact Triangle Order the Mesh Cache Produced
+        return f"bvh-{Settings.BVH.BINS}-{Settings.BVH.MAX_LEAF_SIZE}-{Mesh.cacheName()}"
+
+    @staticmethod
+    def loadAsset(filename: str, cache: MeshCache, decoder: ImageDecoder | None = None) -> LoadedAsset:
+        startTime = time.perf_counter()
+
+        mesh = Mesh.create(filename, cache, decoder)
+
+        # Bottom Level per Mesh in Object Space, Cached Next to the Asset It Was Built From
+        #   Coarser Levels Get Their Own Trees, Cached the Same Way
+        key  = cache.key(filename)
+        name = AssetLoader.bvhName()
+
+        blas = BVH.fromArrays(cache.fetch(key, name, lambda: BVH(mesh.vertices, mesh.indices).toArrays()))
+        lodBlases = [
+            BVH.fromArrays(cache.fetch(key, f"{name}-lod{level}", lambda lod=lod: BVH(mesh.vertices, lod).toArrays()))
+            for level, lod in enumerate(mesh.lodIndices, start=1)
+        ]
+
+        return LoadedAsset(filename, mesh, blas, lodBlases, time.perf_counter() - startTime)
+
+    def submit(self, filenames: Iterable[str]) -> None:
+        # Returns Immediately, Assets Arrive in Completion Order, Not Submission Order
+        filenames = list(filenames)
+
+        with self.lock:
+            if self.startTime is None:  self.startTime = time.perf_counter()
+            self.requested += len(filenames)
+
+        self.submitted += [self.pool.submit(self.work, filename) for filename in filenames]
+
+    def work(self, filename: str) -> None:
+        startTime = time.perf_counter()
+        try:
+            asset = AssetLoader.loadAsset(filename, self.cache, self.decoder)
+        except Exception as e:
+            # Reported on the GL Thread Through the Queue, a Bad File Must Not Stall the Rest
+            asset = LoadedAsset(filename, None, None, [], time.perf_counter() - startTime, e)
+
+        with self.lock:
+            if asset.failed:  self.failed += 1
+            else:             self.loaded += 1
+
+        self.ready.put(asset)
+        if self.notify is not None:  self.notify()
+
+    def run(self, function: Callable, *args) -> Future:
+        # Scene Level Work Such as Packing the Next Batch, Runs After Whatever run Was Given Before It
+        future = self.packer.submit(function, *args)
+        if self.notify is not None:  future.add_done_callback(lambda future: self.notify())
+
+        return future
+
+    def take(self, limit: int | None = None) -> list[LoadedAsset]:
+        # Never Blocks, Finished Assets in Arrival Order
+        assets = []
+        while limit is None or len(assets) < limit:
+            try:
+                assets.append(self.ready.get_nowait())
+            except queue.Empty:
+                break
+
+        return assets
+
+    def wait(self) -> list[LoadedAsset]:
+        # Blocks Until Everything Submitted So Far Is Ready, Then Takes It All in Arrival Order
+        futures.wait(self.submitted)
+        self.submitted = []
+
+        return self.take()
+
+    @property
+    def pending(self) -> int:
+        # Requested Assets Still on a Worker
+        with self.lock:  return self.requested - self.loaded - self.failed
+
+    @property
+    def elapsed(self) -> float:  return time.perf_counter() - self.startTime if self.startTime is not None else 0.0
+
+    def close(self) -> None:
+        # Waits for Running Loads, Queued Ones Are Dropped
+        self.pool.shutdown(cancel_futures=True)
+        self.packer.shutdown(cancel_futures=True)
+        self.decoder.close()
+
+    def __enter__(self) -> "AssetLoader":  return self
+    def __exit__(self, *args) -> None:     self.close()
@@ -0,0 +1,107 @@
+import numpy as np
+
+from settings import Settings
+
+# Runs Between GLB.load and Upload, Its Output Is What the Mesh Cache Stores
+#   Welds Duplicate Vertices, Sorts Triangles Along a Morton Curve and Renumbers Vertices in First Use Order,
+#   so Neighbouring Rays Testing Neighbouring Triangles Also Read Neighbouring Memory
+class MeshOptimizer:
+    VERSION = 1  # Bump When the Output Changes, Cached Meshes Are Keyed by It
+
+    @staticmethod
+    def optimize(
+            arrays:  dict[str, np.ndarray],
+            epsilon: float = Settings.Optimize.WELD_EPSILON,
+            bits:    int   = Settings.Optimize.MORTON_BITS
+        ) -> tuple[dict[str, np.ndarray], dict]:
+
+        vertices = arrays["vertices"]
+        normals  = arrays.get("normals")
+        uvs      = arrays.get("uvs")
+
+        before = {"vertices": len(vertices), "indices": len(arrays["indices"]), "span": MeshOptimizer.vertexSpan(arrays["indices"])}
+
+        remap, kept = MeshOptimizer.weld(vertices, normals, uvs, epsilon)
+        indices = MeshOptimizer.dropDegenerate(remap[arrays["indices"]])
+
+        triangles = indices.reshape(-1, 3)
+        curve = triangles[MeshOptimizer.mortonOrder(vertices[kept], triangles, bits)].reshape(-1)
+
+        # First Use Renumbering Also Drops Vertices No Triangle References
+        #   Exporters Sometimes Already Emit Coherent Strips, the Curve Only Replaces Them When It Is Tighter
+        order, indices = min(
+            (MeshOptimizer.firstUseOrder(curve), MeshOptimizer.firstUseOrder(indices)),
+            key=lambda candidate: MeshOptimizer.vertexSpan(candidate[1])
+        )
+        kept = kept[order]
+
+        optimized = dict(arrays)
+        optimized["vertices"] = np.ascontiguousarray(vertices[kept])
+        optimized["indices"]  = indices.astype(np.uint32)
+        if normals is not None:  optimized["normals"] = np.ascontiguousarray(normals[kept])
+        if uvs     is not None:  optimized["uvs"]     = np.ascontiguousarray(uvs[kept])
+
+        after = {"vertices": len(kept), "indices": len(indices), "span": MeshOptimizer.vertexSpan(indices)}
+        return optimized, {"before": before, "after": after}
+
+    @staticmethod
+    def weld(vertices: np.ndarray, normals: np.ndarray | None, uvs: np.ndarray | None, epsilon: float) -> tuple[np.ndarray, np.ndarray]:
+        # Vertices Equal in Every Attribute to Within epsilon Become One, the First of Them Survives
+        #   Returns (Old Index -> Welded Index, Welded Index -> Surviving Old Index)
+        attributes = np.concatenate([array for array in (vertices, normals, uvs) if array is not None], axis=1).astype(np.float64)
+        if len(attributes) == 0:  return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+        # Snapping to an epsilon Grid Also Folds -0.0 into 0.0
+        keys = np.floor(attributes / epsilon + 0.5).astype(np.int64) if epsilon > 0.0 else attributes + 0.0
+        _, kept, remap = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+
+        return remap.reshape(-1), kept
+
+    @staticmethod
+    def dropDegenerate(indices: np.ndarray) -> np.ndarray:
+        # Welding Can Collapse a Sliver into a Line, Rays Never Hit Those
+        triangles = indices.reshape(-1, 3)
+        valid = (triangles[:, 0] != triangles[:, 1]) & (triangles[:, 1] != triangles[:, 2]) & (triangles[:, 0] != triangles[:, 2])
+
+        return triangles[valid].reshape(-1)
+
+    @staticmethod
+    def mortonCodes(points: np.ndarray, bits: int) -> np.ndarray:
+        # Interleaves bits per Axis of the Position Within the Points' Bounds
+        boundsMin = points.min(axis=0)
+        extent    = np.maximum(points.max(axis=0) - boundsMin, 1e-12)
+
+        cells = np.clip((points - boundsMin) / extent * (1 << bits), 0, (1 << bits) - 1).astype(np.uint64)
+
+        codes = np.zeros(len(points), dtype=np.uint64)
+        for bit in range(bits):
+            for axis in range(3):
+                codes |= ((cells[:, axis] >> np.uint64(bit)) & np.uint64(1)) << np.uint64(bit * 3 + axis)
+
+        return codes
+
+    @staticmethod
+    def mortonOrder(vertices: np.ndarray, triangles: np.ndarray, bits: int) -> np.ndarray:
+        if len(triangles) == 0:  return np.zeros(0, dtype=np.int64)
+
+        centroids = vertices[triangles].mean(axis=1)
+        return np.argsort(MeshOptimizer.mortonCodes(centroids, bits), kind="stable")
+
+    @staticmethod
+    def firstUseOrder(indices: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # Returns (New Index -> Old Index, Renumbered Indices)
+        used, firstUse = np.unique(indices, return_index=True)
+        order = used[np.argsort(firstUse)]
+
+        renumber = np.empty(int(indices.max(initial=-1)) + 1, dtype=np.int64)
+        renumber[order] = np.arange(len(order))
+
+        return order, renumber[indices]
+
+    @staticmethod
+    def vertexSpan(indices: np.ndarray) -> float:
+        # Mean Distance in the Vertex Array Between a Triangle's Corners, Lower Is More Cache Friendly
+        triangles = np.asarray(indices, dtype=np.int64).reshape(-1, 3)
+        if len(triangles) == 0:  return 0.0
+
+        return float((triangles.max(axis=1) - triangles.min(axis=1)).mean())
@@ -0,0 +1,155 @@
+import numpy as np
+
+from settings import Settings
+
+# Quadric Error Metric Simplification, Batched: Every Pass Collapses a Set of Edges That Share No Vertex
+#   Collapses Keep One of the Edge's Endpoints, so Every Level Indexes the Original Vertex Array
+#   and Levels Only Add Index Buffers. Normals and UVs Stay Valid Without Interpolation
+class MeshSimplifier:
+    VERSION = 1  # Bump When the Output Changes, Cached Meshes Are Keyed by It
+
+    @staticmethod
+    def levels(
+            vertices:     np.ndarray,
+            indices:      np.ndarray,
+            ratios:       tuple[float, ...] = Settings.LOD.RATIOS,
+            minTriangles: int               = Settings.LOD.MIN_TRIANGLES
+        ) -> list[np.ndarray]:
+        # Index Buffers for Each Coarser Level, Each Simplified From the One Before
+        vertices  = np.asarray(vertices, dtype=np.float64)[:, :3]
+        triangles = np.asarray(indices, dtype=np.int64).reshape(-1, 3)
+        quadrics  = MeshSimplifier.quadrics(vertices, triangles)
+
+        levels = []
+        baseCount = len(triangles)
+        for ratio in ratios:
+            target = max(minTriangles, int(baseCount * ratio))
+            if target >= len(triangles):  break
+
+            simplified = MeshSimplifier.simplify(vertices, triangles, quadrics, target)
+
+            # Stalled, Usually Only Boundaries and Sharp Features Are Left
+            if len(simplified) > len(triangles) * Settings.LOD.MIN_REDUCTION:  break
+
+            triangles = simplified
+            levels.append(triangles.reshape(-1).astype(np.uint32))
+
+        return levels
+
+    @staticmethod
+    def planes(vertices: np.ndarray, triangles: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # Unit Plane (nx, ny, nz, d) and Area per Triangle
+        p0, p1, p2 = vertices[triangles[:, 0]], vertices[triangles[:, 1]], vertices[triangles[:, 2]]
+        normals = np.cross(p1 - p0, p2 - p0)
+        lengths = np.linalg.norm(normals, axis=1)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            normals = np.nan_to_num(normals / lengths[:, None])
+
+        planes = np.concatenate([normals, -np.sum(normals * p0, axis=1, keepdims=True)], axis=1)
+        return planes, lengths * 0.5
+
+    @staticmethod
+    def accumulate(vertexCount: int, corners: np.ndarray, planes: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        # Sums weight * plane plane^T into Every Listed Corner, One bincount per Matrix Entry
+        outer = planes[:, :, None] * planes[:, None, :] * weights[:, None, None]
+        corners = corners.reshape(len(planes), -1)
+
+        quadrics = np.empty((vertexCount, 4, 4), dtype=np.float64)
+        repeated = np.repeat(outer.reshape(len(planes), 16), corners.shape[1], axis=0)
+        for entry in range(16):
+            quadrics.reshape(vertexCount, 16)[:, entry] = np.bincount(corners.reshape(-1), weights=repeated[:, entry], minlength=vertexCount)
+
+        return quadrics
+
+    @staticmethod
+    def edges(triangles: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # Undirected Edges (Low, High) and the Triangle Each of the 3 * T Half Edges Came From
+        edges = np.sort(triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+        return edges, np.repeat(np.arange(len(triangles)), 3)
+
+    @staticmethod
+    def quadrics(vertices: np.ndarray, triangles: np.ndarray) -> np.ndarray:
+        planes, areas = MeshSimplifier.planes(vertices, triangles)
+        quadrics = MeshSimplifier.accumulate(len(vertices), triangles, planes, areas)
+
+        # Open Edges Get a Plane Through Them, Perpendicular to Their Face, so Borders and UV Seams Hold Their Shape
+        edges, faces = MeshSimplifier.edges(triangles)
+        _, inverse, counts = np.unique(edges, axis=0, return_inverse=True, return_counts=True)
+        border = counts[inverse.reshape(-1)] == 1
+        if not np.any(border):  return quadrics
+
+        a, b = vertices[edges[border, 0]], vertices[edges[border, 1]]
+        normals = np.cross(b - a, planes[faces[border], :3])
+        with np.errstate(invalid="ignore", divide="ignore"):
+            normals = np.nan_to_num(normals / np.linalg.norm(normals, axis=1, keepdims=True))
+
+        borderPlanes = np.concatenate([normals, -np.sum(normals * a, axis=1, keepdims=True)], axis=1)
+        weights = np.sum((b - a) ** 2, axis=1) * Settings.LOD.BORDER_WEIGHT
+
+        return quadrics + MeshSimplifier.accumulate(len(vertices), edges[border], borderPlanes, weights)
+
+    @staticmethod
+    def error(quadrics: np.ndarray, points: np.ndarray) -> np.ndarray:
+        homogeneous = np.concatenate([points, np.ones((len(points), 1))], axis=1)
+        return np.abs(np.einsum("ni,nij,nj->n", homogeneous, quadrics, homogeneous))
+
+    @staticmethod
+    def simplify(vertices: np.ndarray, triangles: np.ndarray, quadrics: np.ndarray, target: int) -> np.ndarray:
+        # Collapses Until target Triangles Remain or No Edge Can Go, quadrics Is Updated in Place
+        while len(triangles) > target:
+            edges = np.unique(MeshSimplifier.edges(triangles)[0], axis=0)
+            low, high = edges[:, 0], edges[:, 1]
+
+            # Both Directions Are Priced, the Cheaper Endpoint Survives
+            combined = quadrics[low] + quadrics[high]
+            keepLowCost  = MeshSimplifier.error(combined, vertices[low])
+            keepHighCost = MeshSimplifier.error(combined, vertices[high])
+
+            keepLow = keepLowCost <= keepHighCost
+            keep    = np.where(keepLow, low, high)
+            remove  = np.where(keepLow, high, low)
+            cost    = np.minimum(keepLowCost, keepHighCost)
+
+            # An Edge Goes When It Is the Cheapest at Both Its Ends, Which Makes the Chosen Set Vertex Disjoint
+            rank = np.empty(len(edges), dtype=np.int64)
+            rank[np.argsort(cost, kind="stable")] = np.arange(len(edges))
+
+            cheapest = np.full(len(vertices), len(edges), dtype=np.int64)
+            np.minimum.at(cheapest, low,  rank)
+            np.minimum.at(cheapest, high, rank)
+
+            chosen = np.flatnonzero((cheapest[low] == rank) & (cheapest[high] == rank))
+
+            # About Two Triangles per Collapse, Never Far Past the Target
+            chosen = chosen[np.argsort(rank[chosen])][:max(1, (len(triangles) - target + 1) // 2)]
+            chosen = MeshSimplifier.rejectFlips(vertices, triangles, keep[chosen], remove[chosen], chosen)
+            if len(chosen) == 0:  break
+
+            remap = np.arange(len(vertices))
+            remap[remove[chosen]] = keep[chosen]
+            quadrics[keep[chosen]] += quadrics[remove[chosen]]
+
+            triangles = remap[triangles]
+            triangles = triangles[(triangles[:, 0] != triangles[:, 1]) & (triangles[:, 1] != triangles[:, 2]) & (triangles[:, 0] != triangles[:, 2])]
+
+        return triangles
+
+    @staticmethod
+    def rejectFlips(vertices: np.ndarray, triangles: np.ndarray, keep: np.ndarray, remove: np.ndarray, chosen: np.ndarray) -> np.ndarray:
+        # Drops Collapses That Would Turn a Surviving Triangle Over
+        remap = np.arange(len(vertices))
+        remap[remove] = keep
+
+        moved = remap[triangles]
+        changed = np.any(moved != triangles, axis=1)
+        changed &= (moved[:, 0] != moved[:, 1]) & (moved[:, 1] != moved[:, 2]) & (moved[:, 0] != moved[:, 2])
+
+        before, _ = MeshSimplifier.planes(vertices, triangles[changed])
+        after,  _ = MeshSimplifier.planes(vertices, moved[changed])
+        flipped = np.sum(before[:, :3] * after[:, :3], axis=1) < Settings.LOD.MIN_NORMAL_DOT
+
+        unsafe = np.zeros(len(vertices), dtype=bool)
+        unsafe[triangles[changed][flipped].reshape(-1)] = True
+
+        return chosen[~unsafe[remove]]
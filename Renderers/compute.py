@@ -0,0 +1,83 @@
+from OpenGL.GL import *
+from os import path as ospath
+
+from Buffers.FBO    import FBO
+from Buffers.packer import ScenePacker
+
+from Acceleration.twolevel import TwoLevelBVH
+from Renderers.gl import GLRenderer
+from programcache import ProgramCache
+from shader import ComputeShader
+from settings import Settings
+
+# Tiled Compute Pass, One Workgroup per Screen Tile Writing into an Image That Is Blitted to the Bound Framebuffer
+class ComputeRenderer(GLRenderer):
+    IMAGE_UNIT = 0
+
+    def __init__(
+            self,
+            scene:         ScenePacker,
+            accel:         TwoLevelBVH,
+            workgroupSize: tuple[int, int] = Settings.Renderer.WORKGROUP_SIZE,
+            quantized:     bool            = Settings.Renderer.QUANTIZED,
+            triangleSoup:  bool            = Settings.Renderer.TRIANGLE_SOUP,
+            programCache:  ProgramCache | None = None
+        ) -> None:
+
+        self.requestedWorkgroupSize = workgroupSize
+
+        super().__init__(scene, accel, quantized, triangleSoup, programCache)
+
+    def pipelineKey(self, scene: ScenePacker) -> tuple:
+        # Nothing Here Samples the Scene Textures
+        return self.shaderDefines,
+
+    def createShader(self) -> ComputeShader:
+        tileX, tileY = self.requestedWorkgroupSize
+        return ComputeShader(ospath.join("Shaders", "raycast.csh"), {"TILE_SIZE_X": tileX, "TILE_SIZE_Y": tileY, **self.shaderDefines}, self.programCache)
+
+    def createPipeline(self, scene: ScenePacker, shader: ComputeShader | None = None) -> None:
+        self.shader = shader if shader is not None else self.createShader()
+        self.pipelineState = self.pipelineKey(scene)
+        self.workgroupSize = self.shader.workgroupSize[:2]
+
+        # Grown to the Largest Resolution Seen, Smaller Frames Use Its Corner
+        self.image: FBO | None = None
+
+    def deletePipeline(self) -> None:
+        if self.image is not None:  self.image.delete()
+
+    def groupCount(self, width: int, height: int) -> tuple[int, int]:
+        tileX, tileY = self.workgroupSize
+        return (width + tileX - 1) // tileX, (height + tileY - 1) // tileY
+
+    def render(self, camera, currentTime: float, width: int = Settings.Screen.WIDTH, height: int = Settings.Screen.HEIGHT) -> None:
+        self.renderScaled(camera, currentTime, width, height, width, height)
+
+    def renderScaled(self, camera, currentTime: float, width: int, height: int, windowWidth: int, windowHeight: int) -> None:
+        # Image Setup Rebinds Framebuffers, Remember Where the Frame Goes First
+        target = glGetIntegerv(GL_DRAW_FRAMEBUFFER_BINDING)
+
+        if self.image is None:  self.image = FBO(width, height)
+        self.image.resize(max(width, self.image.width), max(height, self.image.height))
+
+        glUseProgram(self.shader.program)
+
+        self.updateCameraBlock(camera, width, height)
+        self.shader.setUniform("iTime", currentTime)
+
+        glBindImageTexture(ComputeRenderer.IMAGE_UNIT, self.image.texture, 0, GL_FALSE, 0, GL_WRITE_ONLY, GL_RGBA8)
+        glDispatchCompute(*self.groupCount(width, height), 1)
+
+        # Image Stores Must Land Before the Blit Reads the Texture
+        glMemoryBarrier(GL_FRAMEBUFFER_BARRIER_BIT | GL_TEXTURE_FETCH_BARRIER_BIT)
+
+        # Scaled Frames Are Stretched Here Directly, No Second Offscreen Pass
+        glBindFramebuffer(GL_READ_FRAMEBUFFER, self.image.ID)
+        glBindFramebuffer(GL_DRAW_FRAMEBUFFER, target)
+        filtering = GL_NEAREST if (width, height) == (windowWidth, windowHeight) else GL_LINEAR
+        glBlitFramebuffer(0, 0, width, height, 0, 0, windowWidth, windowHeight, GL_COLOR_BUFFER_BIT, filtering)
+
+        glBindFramebuffer(GL_FRAMEBUFFER, target)
+
+        self.frameRendered(camera, width, height)
@@ -0,0 +1,64 @@
+import ctypes
+import os
+import sys
+
+# Surfaceless EGL Context for Rendering Without a Window
+#   PyOpenGL Picks Its Platform on First Import, so prepare() Must Run Before Any OpenGL Import
+class HeadlessContext:
+    @staticmethod
+    def prepare(software: bool = True) -> bool:
+        if not sys.platform.startswith("linux"):  return False
+
+        os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+        os.environ.setdefault("EGL_PLATFORM",      "surfaceless")
+
+        # Forces Mesa's llvmpipe Even When a GPU Driver Is Installed
+        if software:  os.environ.setdefault("LIBGL_ALWAYS_SOFTWARE", "1")
+
+        return True
+
+    def __init__(self, major: int = 4, minor: int = 3) -> None:
+        from OpenGL import EGL
+
+        self.display = EGL.eglGetDisplay(EGL.EGL_DEFAULT_DISPLAY)
+
+        versionMajor, versionMinor = EGL.EGLint(), EGL.EGLint()
+        if not EGL.eglInitialize(self.display, ctypes.pointer(versionMajor), ctypes.pointer(versionMinor)):
+            raise RuntimeError("eglInitialize failed")
+
+        configAttributes = (EGL.EGLint * 5)(
+            EGL.EGL_SURFACE_TYPE,    EGL.EGL_PBUFFER_BIT,
+            EGL.EGL_RENDERABLE_TYPE, EGL.EGL_OPENGL_BIT,
+            EGL.EGL_NONE
+        )
+
+        config, configCount = EGL.EGLConfig(), EGL.EGLint()
+        if not EGL.eglChooseConfig(self.display, configAttributes, ctypes.pointer(config), 1, ctypes.pointer(configCount)) or configCount.value == 0:
+            raise RuntimeError("No EGL config supports desktop OpenGL")
+
+        EGL.eglBindAPI(EGL.EGL_OPENGL_API)
+
+        contextAttributes = (EGL.EGLint * 7)(
+            EGL.EGL_CONTEXT_MAJOR_VERSION,       major,
+            EGL.EGL_CONTEXT_MINOR_VERSION,       minor,
+            EGL.EGL_CONTEXT_OPENGL_PROFILE_MASK, EGL.EGL_CONTEXT_OPENGL_CORE_PROFILE_BIT,
+            EGL.EGL_NONE
+        )
+
+        self.context = EGL.eglCreateContext(self.display, config, EGL.EGL_NO_CONTEXT, contextAttributes)
+        if not self.context:  raise RuntimeError(f"Could not create an OpenGL {major}.{minor} core context")
+
+        # No Surface at All, Everything Renders into FBOs
+        if not EGL.eglMakeCurrent(self.display, EGL.EGL_NO_SURFACE, EGL.EGL_NO_SURFACE, self.context):
+            raise RuntimeError("eglMakeCurrent failed")
+
+        from OpenGL.GL import glGetString, GL_RENDERER, GL_VERSION
+        self.renderer = glGetString(GL_RENDERER).decode()
+        self.version  = glGetString(GL_VERSION).decode()
+
+    def delete(self) -> None:
+        from OpenGL import EGL
+
+        EGL.eglMakeCurrent(self.display, EGL.EGL_NO_SURFACE, EGL.EGL_NO_SURFACE, EGL.EGL_NO_CONTEXT)
+        EGL.eglDestroyContext(self.display, self.context)
+        EGL.eglTerminate(self.display)
@@ -0,0 +1,163 @@
+import numpy as np
+import pygame
+
+from Acceleration.bvh       import BVH
+from Acceleration.intersect import Intersection
+from settings import Settings
+
+# Headless NumPy Backend, Mirrors Shaders/default.fsh Ray for Ray
+class CPURenderer:
+    # Everything renderTile Reads, Shared Between Processes by the Parallel Renderer
+    SCENE_ARRAYS = ("v0", "edge1", "edge2", "normals", "clusterMin", "clusterMax")
+
+    LIGHT_POSITION   = np.array([0.0, 10.0, 5.0], dtype=np.float32)
+    BACKGROUND_COLOR = np.array([0.0, 0.0,  0.0], dtype=np.float32)
+
+    AMBIENT = 0.2
+    DIFFUSE = 1.0
+
+    def __init__(
+            self,
+            vertices: np.ndarray,
+            indices:  np.ndarray,
+            width:      int = Settings.Screen.WIDTH,
+            height:     int = Settings.Screen.HEIGHT,
+            tileBudget:  int = Settings.Renderer.TILE_BUDGET,
+            clusterSize: int = Settings.Renderer.CLUSTER_SIZE,
+            bvh:         BVH | None = None
+        ) -> None:
+
+        self.width  = width
+        self.height = height
+        self.tileBudget  = tileBudget
+        self.clusterSize = clusterSize
+
+        # BVH Order Keeps Neighbouring Triangles Together, so Fixed Size Runs Make Tight Clusters
+        if bvh is None:  bvh = BVH(vertices, indices)
+        indices = bvh.reorder(indices)
+        self.v0, self.edge1, self.edge2 = Intersection.triangleEdges(vertices, indices)
+        self.normals = Intersection.triangleNormals(self.edge1, self.edge2)
+
+        # Cluster Bounds, Rays Missing a Cluster Skip Its Triangles Entirely
+        corners = np.stack((self.v0, self.v0 + self.edge1, self.v0 + self.edge2), axis=1)
+        starts  = np.arange(0, len(self.v0), clusterSize)
+
+        if len(starts):
+            self.clusterMin = np.minimum.reduceat(corners.min(axis=1), starts, axis=0)
+            self.clusterMax = np.maximum.reduceat(corners.max(axis=1), starts, axis=0)
+        else:
+            self.clusterMin = np.zeros((0, 3), dtype=np.float32)
+            self.clusterMax = np.zeros((0, 3), dtype=np.float32)
+
+        self.framebuffer = np.zeros((height, width, 4), dtype=np.float32)
+        self.triangleTests = 0
+
+    @staticmethod
+    def attach(arrays: dict, width: int, height: int, tileBudget: int, clusterSize: int) -> "CPURenderer":
+        # Wraps Already Prepared Scene Arrays Without Rebuilding Them
+        renderer = CPURenderer.__new__(CPURenderer)
+
+        renderer.width  = width
+        renderer.height = height
+        renderer.tileBudget  = tileBudget
+        renderer.clusterSize = clusterSize
+
+        for name in CPURenderer.SCENE_ARRAYS:  setattr(renderer, name, arrays[name])
+
+        renderer.framebuffer = arrays.get("framebuffer")
+        renderer.triangleTests = 0
+        return renderer
+
+    @staticmethod
+    def cameraState(camera) -> dict:
+        # Plain NumPy Copy of Everything default.fsh Reads from the Camera
+        return {
+            "position": np.array(camera.position,          dtype=np.float32),
+            "invView":  np.array(camera.getInverseVM(),    dtype=np.float32),
+            "invProj":  np.array(camera.invPM,             dtype=np.float32),
+            "near":     float(camera.NEAR),
+            "far":      float(camera.FAR),
+        }
+
+    def generateRays(self, state: dict, x0: int, y0: int, x1: int, y1: int) -> tuple[np.ndarray, np.ndarray]:
+        # Pixel Centers, Rows Bottom to Top Like gl_FragCoord
+        ys, xs = np.mgrid[y0:y1, x0:x1].astype(np.float32) + 0.5
+
+        uvX = xs / self.width  * 2.0 - 1.0
+        uvY = ys / self.height * 2.0 - 1.0
+
+        clipPosition = np.stack((uvX, uvY, -np.ones_like(uvX), np.ones_like(uvX)), axis=-1).reshape(-1, 4)
+        viewPosition = clipPosition @ state["invProj"].T
+
+        directions = viewPosition[:, :3] / viewPosition[:, 3:]
+        directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+
+        directions = directions @ state["invView"][:3, :3].T
+        directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+
+        origins = np.broadcast_to(state["position"], directions.shape)
+        return origins, directions.astype(np.float32)
+
+    def shade(self, state: dict, origins: np.ndarray, directions: np.ndarray, distance: np.ndarray, triangle: np.ndarray) -> np.ndarray:
+        colors = np.empty((len(directions), 4), dtype=np.float32)
+        colors[:, :3] = CPURenderer.BACKGROUND_COLOR
+        colors[:,  3] = 1.0
+
+        hit = (triangle >= 0) & (distance > state["near"]) & (distance < state["far"])
+        if not np.any(hit):  return colors
+
+        hitPoints = origins[hit] + distance[hit, None] * directions[hit]
+
+        lightDirections = CPURenderer.LIGHT_POSITION - hitPoints
+        lightDirections /= np.linalg.norm(lightDirections, axis=1, keepdims=True)
+
+        angle = np.sum(lightDirections * self.normals[triangle[hit]], axis=1)
+        colors[hit, :3] = (CPURenderer.AMBIENT + CPURenderer.DIFFUSE * np.maximum(0.0, angle))[:, None]
+
+        return colors
+
+    def renderTile(self, state: dict, x0: int, y0: int, x1: int, y1: int, framebuffer: np.ndarray | None = None) -> int:
+        # Returns the Number of Ray/Triangle Tests Performed
+        if framebuffer is None:  framebuffer = self.framebuffer
+
+        origins, directions = self.generateRays(state, x0, y0, x1, y1)
+
+        distance = np.full(len(directions), state["far"], dtype=np.float32)
+        triangle = np.full(len(directions), -1, dtype=np.int64)
+
+        invDirections = Intersection.safeInverse(directions)
+        triangleTests = 0
+
+        for cluster in range(len(self.clusterMin)):
+            # Only Rays Entering the Cluster Before Their Current Hit Are Tested
+            entry = Intersection.rayAABB(origins, invDirections, self.clusterMin[cluster], self.clusterMax[cluster], distance)
+            rays  = np.flatnonzero(np.isfinite(entry))
+            if len(rays) == 0:  continue
+
+            first = cluster * self.clusterSize
+            tris  = slice(first, first + self.clusterSize)
+            triangleTests += len(rays) * len(self.v0[tris])
+
+            clusterDistance, clusterTriangle = Intersection.nearest(
+                origins[rays], directions[rays], self.v0[tris], self.edge1[tris], self.edge2[tris],
+                distance[rays], tileBudget=self.tileBudget
+            )
+
+            closer = clusterTriangle >= 0
+            distance[rays[closer]] = clusterDistance[closer]
+            triangle[rays[closer]] = clusterTriangle[closer] + first
+
+        framebuffer[y0:y1, x0:x1] = self.shade(state, origins, directions, distance, triangle).reshape(y1 - y0, x1 - x0, 4)
+        return triangleTests
+
+    def render(self, camera) -> np.ndarray:
+        # Returns an RGBA float32 Framebuffer, Row 0 Is the Bottom Row Like glReadPixels
+        self.triangleTests = self.renderTile(CPURenderer.cameraState(camera), 0, 0, self.width, self.height)
+        return self.framebuffer
+
+    @staticmethod
+    def saveImage(framebuffer: np.ndarray, filename: str) -> None:
+        pixels = (np.clip(framebuffer[::-1], 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8)
+        height, width = pixels.shape[:2]
+
+        pygame.image.save(pygame.image.frombuffer(pixels.tobytes(), (width, height), "RGBA"), filename)
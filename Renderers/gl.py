@@ -0,0 +1,308 @@
+import numpy as np
+
+from OpenGL.GL import *
+from os import path as ospath
+
+from Buffers.chunk    import Chunk
+from Buffers.FBO      import FBO
+from Buffers.manager  import TextureManager
+from Buffers.SSBO     import SSBO
+from Buffers.ring     import RingBuffer
+from Buffers.UBO      import UBO
+from Buffers.upload   import TextureUploader
+from Buffers.quantize import QuantizedGeometry
+from Buffers.soup     import TriangleSoup
+from Buffers.packer   import ScenePacker
+
+from Acceleration.twolevel import TwoLevelBVH
+from programcache import ProgramCache
+from shader import Shader
+from settings import Settings
+
+# Fullscreen Fragment Pass over the Scene SSBOs, Draws into Whatever Framebuffer Is Bound
+class GLRenderer:
+    # std140 Layout of CameraBlock in Shaders/default.fsh
+    CAMERA_BLOCK_BINDING = 0
+    CAMERA_BLOCK_DTYPE   = np.dtype({
+        "names":    ["invView",   "invProj",   "position",  "near", "far", "resolution"],
+        "formats":  [("<f4", (4, 4)), ("<f4", (4, 4)), ("<f4", 3), "<f4", "<f4", ("<f4", 2)],
+        "offsets":  [0, 64, 128, 140, 144, 152],
+        "itemsize": 160,
+    })
+
+    SCREEN_VERTICES = np.array([
+         1.0,  1.0,  0.0,
+        -1.0,  1.0,  0.0,
+         1.0, -1.0,  0.0,
+        -1.0, -1.0,  0.0
+    ], dtype=np.float32)
+
+    SCREEN_INDICES = np.array([
+        0, 1, 2,
+        1, 3, 2
+    ], dtype=np.uint32)
+
+    def __init__(
+            self,
+            scene:        ScenePacker,
+            accel:        TwoLevelBVH,
+            quantized:    bool = Settings.Renderer.QUANTIZED,
+            triangleSoup: bool = Settings.Renderer.TRIANGLE_SOUP,
+            programCache: ProgramCache | None = None
+        ) -> None:
+
+        if quantized and triangleSoup:  raise ValueError("Quantized geometry and the triangle soup layout are exclusive.")
+
+        # Linked Shader Binaries, Shared by Every Pipeline This Renderer Builds
+        self.programCache = programCache if programCache is not None else ProgramCache()
+
+        # Render on Demand, Anything Outside the Camera That Changes the Image Sets sceneDirty
+        self.sceneDirty    = True
+        self.renderedState = None
+
+        self.framesRendered = 0
+        self.framesSkipped  = 0
+
+        # Adaptive Resolution Target, Created on First Use
+        self.offscreen: FBO | None = None
+
+        # Scene Textures Stream in Over the First Frames Instead of Blocking Startup
+        self.uploader = TextureUploader()
+        self.textureManager = TextureManager(uploader=self.uploader)
+        self.textureLayers: list[list[int]] = []
+
+        # Compressed or Triangle Soup Geometry Buffers, the Layout Is Compiled into the Pipeline
+        self.quantized    = quantized
+        self.triangleSoup = triangleSoup
+        self.geometry: QuantizedGeometry | TriangleSoup | None = None
+        self.shader = None
+
+        # Instance Records and the Top Level Change at Runtime, They Stream Through Rings
+        self.ssbos = []
+        self.instanceRing = RingBuffer(accel.instanceData.nbytes)
+        self.topRing      = RingBuffer(accel.top.nodes.nbytes)
+        self.setScene(scene, accel)
+
+        self.createPipeline(scene)
+
+        # Camera Uniform Block, Uploaded Lazily by updateCameraBlock
+        self.cameraBlock = np.zeros(1, dtype=GLRenderer.CAMERA_BLOCK_DTYPE)
+        self.cameraUBO   = UBO.sendData(self.cameraBlock, GLRenderer.CAMERA_BLOCK_BINDING)
+        self.cameraState = None
+
+    @property
+    def shaderDefines(self) -> dict:  return self.geometry.defines if self.geometry is not None else {}
+
+    def pipelineKey(self, scene: ScenePacker) -> tuple:
+        # Everything createPipeline Compiles or Binds In, a Scene That Changes It Needs a New Pipeline
+        return self.shaderDefines, len(scene.textures)
+
+    def createShader(self) -> Shader:
+        return Shader(ospath.join("Shaders", "default.vsh"), ospath.join("Shaders", "default.fsh"), self.programCache, self.shaderDefines)
+
+    def createPipeline(self, scene: ScenePacker, shader: Shader | None = None) -> None:
+        self.shader = shader if shader is not None else self.createShader()
+        self.pipelineState = self.pipelineKey(scene)
+
+        # Screen Buffer
+        textures = scene.textures if len(scene.textures) else None
+        self.screenChunk = Chunk(GLRenderer.SCREEN_VERTICES, GLRenderer.SCREEN_INDICES, 0, 3, GL_FLOAT, textures, self.textureManager)
+        self.screenChunk.sendData()
+        self.screenChunk.bindTextureData(self.shader.program, GL_TEXTURE0)
+
+        # Array Layer of Each Mesh's Textures, Meshes Embedding the Same Image Point at the Same Layer
+        self.textureLayers = [self.screenChunk.layerIndices[meshRange.textureOffset:meshRange.textureOffset + meshRange.textureCount] for meshRange in scene.ranges]
+
+    def deletePipeline(self) -> None:
+        self.screenChunk.unbindTextureData(GL_TEXTURE0)
+        self.screenChunk.delete()
+
+    def sceneBuffers(self, scene: ScenePacker, accel: TwoLevelBVH) -> tuple[QuantizedGeometry | TriangleSoup | None, list[tuple[np.ndarray, int]]]:
+        # Geometry Layout and Every Static SSBO as (Data, Binding), Nothing Touches GL so SceneStreamer Runs It on a Loader Thread
+        #   Object Space Mesh Data Is Uploaded Once, Leaves Index Contiguous Triangle Ranges
+        if self.triangleSoup:
+            # Leaves Read Whole Triangles, No Vertex or Index Buffers
+            geometry = TriangleSoup(accel)
+            return geometry, [(geometry.triangles, 0), (accel.nodes, 4)]
+
+        if self.quantized:
+            geometry = QuantizedGeometry(accel)
+            return geometry, [
+                (geometry.positions, 0),
+                (geometry.indices,   1),
+                (geometry.normals,   2),
+                (geometry.uvs,       3),
+                (geometry.nodes,     4),
+                (geometry.meshes,    7),
+            ]
+
+        return None, [
+            (scene.vertices, 0),
+            (accel.indices,  1),
+            (scene.normals,  2),
+            (scene.uvs,      3),
+            (accel.nodes,    4),
+        ]
+
+    def setScene(
+            self,
+            scene:    ScenePacker,
+            accel:    TwoLevelBVH,
+            geometry: QuantizedGeometry | TriangleSoup | None = None,
+            ssbos:    list[SSBO] | None                       = None
+        ) -> None:
+        # ssbos Are Already Filled From sceneBuffers, e.g. Across Frames by SceneStreamer, and Only Get Bound Here
+        #   Any of the Current SSBOs Among Them Were Appended to in Place and Stay Alive
+        if ssbos is None:
+            geometry, buffers = self.sceneBuffers(scene, accel)
+            ssbos = [SSBO.sendData(data, binding) for data, binding in buffers]
+        else:
+            for ssbo in ssbos:  ssbo.bindBase(ssbo.bindingPoint)
+
+        for ssbo in self.ssbos:
+            if ssbo not in ssbos:  ssbo.delete()
+
+        self.ssbos    = ssbos
+        self.geometry = geometry
+        self.accel    = accel
+
+        # The Index Width and the Texture Set Are Baked In, a Scene That Changes Them Needs a New Pipeline
+        if self.shader is not None and self.pipelineKey(scene) != self.pipelineState:
+            glDeleteProgram(self.shader.program)
+            self.deletePipeline()
+            self.createPipeline(scene)
+
+        self.uploadInstances()
+
+    def reloadShaders(self) -> bool:
+        # Rebuilds the Pipeline Once a Shader Source or Include Changed on Disk, Returns Whether It Did
+        if self.shader is None or not self.shader.isStale():  return False
+
+        # Compiled Before Anything Is Torn Down, a Broken Edit Keeps the Running Pipeline
+        try:
+            shader = self.createShader()
+        except RuntimeError as e:
+            print(f"Warning: shader reload failed, keeping the previous program: {e}")
+            self.shader.trackDependencies(list(self.shader.dependencies))  # Retried on the Next Edit, Not Every Check
+            return False
+
+        glDeleteProgram(self.shader.program)
+        self.deletePipeline()
+        self.createPipeline(self.accel.scene, shader)
+
+        self.markDirty()
+        return True
+
+    def uploadInstances(self) -> None:
+        # Only the Instance Records and Top Level, Geometry Stays Where It Is
+        self.instanceRing.write(self.accel.instanceData, 5)
+        self.topRing.write(self.accel.top.nodes,         6)
+
+        self.markDirty()
+
+    def updateInstances(self) -> bool:
+        # Call Once per Frame, Re-Uploads Only When an Instance Moved
+        if not self.accel.update():  return False
+
+        self.uploadInstances()
+        return True
+
+    def updateLOD(self, camera) -> bool:
+        # Call Once per Frame, Switches Instances Between Detail Levels as the Camera Moves
+        if not self.accel.selectLOD(camera.position, camera.FOV):  return False
+
+        self.uploadInstances()
+        return True
+
+    def streamTextures(self) -> bool:
+        # Call Once per Frame, Uploads up to the Per Frame Budget and Redraws When a Texture Completes
+        if not self.uploader.pump():  return False
+
+        self.markDirty()
+        return True
+
+    def markDirty(self) -> None:  self.sceneDirty = True
+
+    def needsRender(self, camera, width: int = Settings.Screen.WIDTH, height: int = Settings.Screen.HEIGHT) -> bool:
+        return self.sceneDirty or self.renderedState != (id(camera), camera.version, width, height)
+
+    def skipFrame(self) -> None:  self.framesSkipped += 1
+
+    def updateCameraBlock(self, camera, width: int, height: int) -> bool:
+        # Skipped Entirely Unless the Camera Reported a Change or the Resolution Moved
+        state = (id(camera), camera.version, width, height)
+        if state == self.cameraState:  return False
+
+        block = self.cameraBlock[0]
+        block["invView"]    = np.array(camera.getInverseVM()).T  # glm Is Row Indexed, std140 Wants Columns
+        block["invProj"]    = np.array(camera.invPM).T
+        block["position"]   = tuple(camera.position)
+        block["near"]       = camera.NEAR
+        block["far"]        = camera.FAR
+        block["resolution"] = (width, height)
+
+        self.cameraUBO.bufferSubData(self.cameraBlock)
+        self.cameraUBO.unbind()
+
+        self.cameraState = state
+        return True
+
+    def render(self, camera, currentTime: float, width: int = Settings.Screen.WIDTH, height: int = Settings.Screen.HEIGHT) -> None:
+        glUseProgram(self.shader.program)
+
+        self.updateCameraBlock(camera, width, height)
+        self.shader.setUniform("iTime", currentTime)
+
+        self.screenChunk.bind()
+        glDrawElements(GL_TRIANGLES, len(GLRenderer.SCREEN_INDICES), GL_UNSIGNED_INT, None)
+        self.screenChunk.unbind()
+
+        self.frameRendered(camera, width, height)
+
+    def frameRendered(self, camera, width: int, height: int) -> None:
+        # Regions Written for This Frame Are Not Reused Until the GPU Is Done With Them
+        self.instanceRing.fence()
+        self.topRing.fence()
+
+        self.sceneDirty    = False
+        self.renderedState = (id(camera), camera.version, width, height)
+        self.framesRendered += 1
+
+    def renderScaled(self, camera, currentTime: float, width: int, height: int, windowWidth: int, windowHeight: int) -> None:
+        # Raycasts into the Corner of an Offscreen Target, Then Stretches It over the Bound Framebuffer
+        if (width, height) == (windowWidth, windowHeight):
+            glViewport(0, 0, windowWidth, windowHeight)
+            self.render(camera, currentTime, width, height)
+            return
+
+        target = glGetIntegerv(GL_DRAW_FRAMEBUFFER_BINDING)
+
+        # Sized Once for the Window, Smaller Scales Only Use Part of It
+        if self.offscreen is None:  self.offscreen = FBO(windowWidth, windowHeight)
+        self.offscreen.resize(max(windowWidth, self.offscreen.width), max(windowHeight, self.offscreen.height))
+
+        self.offscreen.bind()
+        glViewport(0, 0, width, height)
+        self.render(camera, currentTime, width, height)
+
+        glBindFramebuffer(GL_READ_FRAMEBUFFER, self.offscreen.ID)
+        glBindFramebuffer(GL_DRAW_FRAMEBUFFER, target)
+        glBlitFramebuffer(0, 0, width, height, 0, 0, windowWidth, windowHeight, GL_COLOR_BUFFER_BIT, GL_LINEAR)
+
+        glBindFramebuffer(GL_FRAMEBUFFER, target)
+        glViewport(0, 0, windowWidth, windowHeight)
+
+    def delete(self) -> None:
+        self.deletePipeline()
+
+        for ssbo in self.ssbos:  ssbo.delete()
+        self.cameraUBO.delete()
+
+        self.instanceRing.delete()
+        self.topRing.delete()
+        self.textureManager.delete()
+        self.uploader.delete()
+
+        if self.offscreen is not None:  self.offscreen.delete()
+
+        glDeleteProgram(self.shader.program)
@@ -0,0 +1,124 @@
+import numpy as np
+import os
+import time
+
+from concurrent.futures     import ProcessPoolExecutor
+from multiprocessing        import shared_memory
+
+from Renderers.cpu import CPURenderer
+from settings import Settings
+
+# Per Worker State, Set Once by the Pool Initializer
+workerRenderer: CPURenderer | None = None
+workerMemory:   list[shared_memory.SharedMemory] = []
+
+def attachArrays(layout: dict) -> tuple[dict, list[shared_memory.SharedMemory]]:
+    arrays, blocks = {}, []
+
+    for name, (memoryName, shape, dtype) in layout.items():
+        block = shared_memory.SharedMemory(name=memoryName)
+        arrays[name] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        blocks.append(block)
+
+    return arrays, blocks
+
+def initWorker(layout: dict, width: int, height: int, tileBudget: int, clusterSize: int) -> None:
+    global workerRenderer, workerMemory
+
+    arrays, workerMemory = attachArrays(layout)
+    workerRenderer = CPURenderer.attach(arrays, width, height, tileBudget, clusterSize)
+
+def renderWorkerTile(state: dict, tile: tuple[int, int, int, int]) -> int:
+    # Writes Straight into the Shared Framebuffer, Only the Triangle Test Count Is Returned
+    return workerRenderer.renderTile(state, *tile)
+
+# Splits the CPU Backend into Screen Tiles Rendered on a Process Pool
+class ParallelCPURenderer:
+    def __init__(
+            self,
+            renderer: CPURenderer,
+            workers:  int = Settings.Renderer.WORKERS,
+            tileSize: int = Settings.Renderer.TILE_SIZE
+        ) -> None:
+
+        self.renderer = renderer
+        self.workers  = workers if workers > 0 else (os.cpu_count() or 1)
+        self.tileSize = tileSize
+
+        self.width  = renderer.width
+        self.height = renderer.height
+        self.triangleTests = 0
+
+        # Scene Arrays and the Framebuffer Are Placed in Shared Memory Once, Never Pickled per Tile
+        self.memory: list[shared_memory.SharedMemory] = []
+        self.layout: dict = {}
+
+        sharedArrays = {name: getattr(renderer, name) for name in CPURenderer.SCENE_ARRAYS}
+        sharedArrays["framebuffer"] = np.zeros((self.height, self.width, 4), dtype=np.float32)
+
+        for name, array in sharedArrays.items():
+            block  = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+            shared = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+            shared[...] = array
+
+            self.memory.append(block)
+            self.layout[name] = (block.name, array.shape, array.dtype.str)
+
+            if name == "framebuffer":  self.framebuffer = shared
+
+        self.tiles = [
+            (x, y, min(x + tileSize, self.width), min(y + tileSize, self.height))
+            for y in range(0, self.height, tileSize)
+            for x in range(0, self.width,  tileSize)
+        ]
+
+        self.pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=initWorker,
+            initargs=(self.layout, self.width, self.height, renderer.tileBudget, renderer.clusterSize)
+        )
+
+    def render(self, camera) -> np.ndarray:
+        state = CPURenderer.cameraState(camera)
+
+        # Small Chunks Keep Cheap and Expensive Tiles Balanced Across Workers
+        chunkSize = max(1, len(self.tiles) // (self.workers * 8))
+        self.triangleTests = sum(self.pool.map(renderWorkerTile, [state] * len(self.tiles), self.tiles, chunksize=chunkSize))
+
+        return self.framebuffer
+
+    def close(self) -> None:
+        self.pool.shutdown()
+
+        for block in self.memory:
+            block.close()
+            block.unlink()
+
+        self.memory = []
+
+    def __enter__(self) -> "ParallelCPURenderer":  return self
+    def __exit__(self, *args) -> None:              self.close()
+
+    @staticmethod
+    def scalingReport(renderer: CPURenderer, camera, maxWorkers: int | None = None, frames: int = 3) -> list[dict]:
+        # Throughput at 1..maxWorkers, Each Pool Warmed Up With One Untimed Frame
+        maxWorkers = maxWorkers or os.cpu_count() or 1
+        rays = renderer.width * renderer.height
+
+        report = []
+        for workers in range(1, maxWorkers + 1):
+            with ParallelCPURenderer(renderer, workers) as parallel:
+                parallel.render(camera)
+
+                startTime = time.perf_counter()
+                for _ in range(frames):  parallel.render(camera)
+                frameTime = (time.perf_counter() - startTime) / frames
+
+            report.append({
+                "workers":    workers,
+                "frameMs":    frameTime * 1000.0,
+                "raysPerSec": rays / frameTime,
+                "speedup":    report[0]["frameMs"] / (frameTime * 1000.0) if report else 1.0,
+            })
+
+        return report
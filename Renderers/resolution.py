@@ -0,0 +1,50 @@
+from settings import Settings
+
+# Picks the Raycast Resolution Scale From Measured Frame Times to Hold a Target FPS
+class ResolutionController:
+    def __init__(
+            self,
+            targetFPS: float = Settings.Screen.FPS,
+            minScale:  float = Settings.Resolution.MIN_SCALE,
+            maxStep:   float = Settings.Resolution.MAX_STEP,
+            smoothing: float = Settings.Resolution.SMOOTHING,
+            deadband:  float = Settings.Resolution.DEADBAND
+        ) -> None:
+
+        self.targetFrameTime = 1.0 / targetFPS
+        self.minScale  = minScale
+        self.maxStep   = maxStep
+        self.smoothing = smoothing
+        self.deadband  = deadband
+
+        self.scale       = 1.0
+        self.movingScale = 1.0   # Scale to Resume With When the Camera Starts Moving Again
+        self.frameTime   = None  # Smoothed, None Until the First Moving Frame
+
+    def update(self, frameTime: float, moving: bool) -> float:
+        if not moving:
+            # Static Image, Show It at Full Resolution
+            self.scale     = 1.0
+            self.frameTime = None
+            return self.scale
+
+        if self.frameTime is None:
+            # Full Resolution Frames Don't Say Anything About the Moving Scale
+            self.scale     = self.movingScale
+            self.frameTime = frameTime
+            return self.scale
+
+        self.frameTime += self.smoothing * (frameTime - self.frameTime)
+
+        # Cost Follows Pixel Count, Which Is Quadratic in the Scale
+        ratio = self.targetFrameTime / max(self.frameTime, 1e-6)
+        if abs(ratio - 1.0) > self.deadband:
+            desired = self.scale * ratio ** 0.5
+            step = min(max(desired - self.scale, -self.maxStep), self.maxStep)
+            self.scale = min(max(self.scale + step, self.minScale), 1.0)
+
+        self.movingScale = self.scale
+        return self.scale
+
+    def resolution(self, width: int, height: int) -> tuple[int, int]:
+        return max(1, round(width * self.scale)), max(1, round(height * self.scale))
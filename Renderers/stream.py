@@ -0,0 +1,216 @@
+import numpy as np
+import time
+
+from concurrent.futures import Future
+
+from Buffers.SSBO import SSBO
+
+from Acceleration.twolevel import TwoLevelBVH
+from MeshLoaders.loader import AssetLoader, LoadedAsset
+from Renderers.gl import GLRenderer
+
+from instance import Instance
+from settings import Settings
+
+# Writes One Buffer of the Next Scene a Chunk at a Time, Starting at the First Byte the GPU Doesn't Already Hold
+#   Appends Leave Every Byte the Current Scene Reads as It Was, so They Go Straight into Its Live SSBO Past the End,
+#   Only a Buffer Whose Element Type Changed (16 to 32 Bit Indices) Fills a Fresh SSBO, Bound Once the Scene Swaps
+class StagedBuffer:
+    def __init__(self, data: np.ndarray, bindingPoint: int, resident: SSBO | None, offset: int) -> None:
+        self.data   = StagedBuffer.bytesOf(data)
+        self.offset = offset
+
+        self.inPlace = resident is not None
+        if self.inPlace:
+            self.ssbo = resident
+            return
+
+        self.ssbo = SSBO()
+        self.ssbo.bindingPoint = bindingPoint
+        self.ssbo.bind()
+        self.ssbo.reserve(len(self.data))
+        self.ssbo.unbind()
+
+    @staticmethod
+    def bytesOf(data: np.ndarray) -> np.ndarray:  return np.ascontiguousarray(data).reshape(-1).view(np.uint8)
+
+    @staticmethod
+    def firstDifference(resident: np.ndarray, data: np.ndarray) -> int:
+        # Byte Offset Where data Stops Matching resident, Usually Its Length as Only Padding or an Empty Placeholder Differs
+        resident = StagedBuffer.bytesOf(resident)
+        data     = StagedBuffer.bytesOf(data)
+
+        shared  = min(len(resident), len(data))
+        differs = np.flatnonzero(resident[:shared] != data[:shared])
+        return int(differs[0]) if len(differs) else shared
+
+    @property
+    def remainingBytes(self) -> int:  return len(self.data) - self.offset
+
+    def upload(self, maxBytes: int) -> int:
+        # Returns the Bytes Written
+        chunk = self.data[self.offset:self.offset + maxBytes]
+        self.ssbo.update(chunk, self.offset)
+        self.ssbo.unbind()
+
+        # Growing Reallocates the Store, the Current Scene Keeps Reading It Through the Same Binding
+        if self.inPlace:  self.ssbo.bindBase(self.ssbo.bindingPoint)
+
+        self.offset += len(chunk)
+        return len(chunk)
+
+# The Next Scene: the Resident One With a Batch of Assets Appended, Packed on a Loader Thread and Uploaded While the Current One Keeps Rendering
+class StagedScene:
+    def __init__(self, renderer: GLRenderer, accel: TwoLevelBVH, assets: list[LoadedAsset], resident: dict[int, np.ndarray]) -> None:
+        # Runs on AssetLoader.run, Nothing Here Touches GL
+        self.assets = assets
+
+        self.scene = accel.scene.extended([asset.mesh for asset in assets])
+        self.accel = accel.extended(self.scene, [asset.blas for asset in assets], [asset.lodBlases for asset in assets])
+
+        self.geometry, self.data = renderer.sceneBuffers(self.scene, self.accel)
+
+        # Where Each Buffer Starts Differing From What Is on the GPU, None When It Needs a Fresh SSBO
+        self.offsets = [
+            StagedBuffer.firstDifference(resident[bindingPoint], data) if bindingPoint in resident and resident[bindingPoint].dtype == data.dtype else None
+            for data, bindingPoint in self.data
+        ]
+        self.buffers: list[StagedBuffer] = []
+
+    def start(self, ssbos: list[SSBO]) -> None:
+        # GL Thread, Once the Batch Is Packed
+        live = {ssbo.bindingPoint: ssbo for ssbo in ssbos}
+        self.buffers = [
+            StagedBuffer(data, bindingPoint, live.get(bindingPoint) if offset is not None else None, offset or 0)
+            for (data, bindingPoint), offset in zip(self.data, self.offsets)
+        ]
+
+    @property
+    def remainingBytes(self) -> int:  return sum(buffer.remainingBytes for buffer in self.buffers)
+
+    def delete(self) -> None:
+        # The Live SSBOs Belong to the Renderer
+        for buffer in self.buffers:
+            if not buffer.inPlace:  buffer.ssbo.delete()
+
+# GL Thread Half of Asset Streaming: Takes What AssetLoader Finished, Uploads It Under a per Frame Time Budget
+#   and Swaps It into the Renderer, so Meshes Appear One Batch at a Time While Frames Keep Coming
+class SceneStreamer:
+    def __init__(
+            self,
+            renderer:   GLRenderer,
+            loader:     AssetLoader,
+            budget:     float = Settings.Streaming.UPLOAD_BUDGET,
+            chunkBytes: int   = Settings.Streaming.CHUNK_BYTES
+        ) -> None:
+
+        self.renderer   = renderer
+        self.loader     = loader
+        self.budget     = budget
+        self.chunkBytes = chunkBytes
+
+        # Resident Assets in the Order They Joined the Scene, Failures Are Reported Once and Dropped
+        self.assets: list[LoadedAsset] = []
+        self.failures: list[LoadedAsset] = []
+        self.packing: Future | None = None
+        self.staging: StagedScene | None = None
+
+        # CPU Copy of Every Live SSBO by Binding Point, What the Next Batch Is Compared Against
+        _, buffers = renderer.sceneBuffers(renderer.accel.scene, renderer.accel)
+        self.resident = {bindingPoint: data for data, bindingPoint in buffers}
+
+        self.bytesUploaded = 0
+        self.framesUsed    = 0
+        self.uploadTime    = 0.0   # Seconds Spent in update
+        self.firstMeshTime = None  # Loader Seconds Until Something Was Visible
+        self.readyTime     = None  # Loader Seconds Until Everything Requested Was Resident
+
+    def update(self) -> bool:
+        # Call Once per Frame, Returns Whether New Meshes Became Visible
+        startTime = time.perf_counter()
+
+        if self.staging is None and self.packing is None:  self.stage()
+
+        if self.packing is not None and self.packing.done():
+            self.staging = self.packing.result()
+            self.packing = None
+            self.staging.start(self.renderer.ssbos)
+
+        swapped = False
+        if self.staging is not None:
+            # At Least One Chunk per Frame, so Progress Never Stalls on a Tight Budget
+            uploaded = False
+            for buffer in self.staging.buffers:
+                while buffer.remainingBytes and not (uploaded and time.perf_counter() - startTime >= self.budget):
+                    self.bytesUploaded += buffer.upload(self.chunkBytes)
+                    uploaded = True
+
+            self.framesUsed += 1
+
+            swapped = self.staging.remainingBytes == 0
+            if swapped:  self.swap()
+
+        if self.readyTime is None and self.loader.requested and self.idle:  self.readyTime = self.loader.elapsed
+
+        self.uploadTime += time.perf_counter() - startTime
+        return swapped
+
+    def stage(self) -> None:
+        # Everything That Arrived Since the Last Swap Is Appended as One Batch, Packed on the Loader's Scene Thread
+        arrived = self.loader.take()
+        for asset in arrived:
+            if asset.failed:
+                print(f"Warning: failed to load '{asset.filename}': {asset.error}")
+                self.failures.append(asset)
+
+        arrived = [asset for asset in arrived if not asset.failed]
+        if not arrived:  return
+
+        self.packing = self.loader.run(StagedScene, self.renderer, self.renderer.accel, arrived, self.resident)
+
+    def swap(self) -> None:
+        staging = self.staging
+        self.staging = None
+
+        # Instances Placed, Moved or Added Meanwhile Carry Over, Each New Mesh Gets One Identity Instance
+        #   Only the Top Level Is Rebuilt Here, It Goes up Through the Rings in setScene
+        accel = staging.accel
+        for asset in staging.assets:  accel.addInstance(Instance(asset.mesh))
+        accel.update()
+
+        self.renderer.setScene(staging.scene, accel, staging.geometry, [buffer.ssbo for buffer in staging.buffers])
+        self.assets   = self.assets + staging.assets
+        self.resident = {bindingPoint: data for data, bindingPoint in staging.data}
+
+        if self.firstMeshTime is None:  self.firstMeshTime = self.loader.elapsed
+
+    @property
+    def idle(self) -> bool:
+        # Nothing on a Worker, in the Queue or Half Uploaded
+        return self.staging is None and self.packing is None and self.loader.pending == 0 and self.loader.ready.empty()
+
+    @property
+    def progress(self) -> dict:
+        requested = self.loader.requested
+        return {
+            "requested":     requested,
+            "loaded":        self.loader.loaded,  # Parsed and Built on a Worker
+            "failed":        len(self.failures),
+            "resident":      len(self.assets),    # Visible in the Current Scene
+            "fraction":      (len(self.assets) + len(self.failures)) / requested if requested else 1.0,
+            "pendingBytes":  self.staging.remainingBytes if self.staging is not None else 0,
+            "bytesUploaded": self.bytesUploaded,
+            "framesUsed":    self.framesUsed,
+            "uploadTimeMs":  self.uploadTime * 1000.0,
+            "firstMeshMs":   self.firstMeshTime * 1000.0 if self.firstMeshTime is not None else None,
+            "readyMs":       self.readyTime * 1000.0     if self.readyTime     is not None else None,
+        }
+
+    def summary(self) -> str:
+        progress = self.progress
+        return f"Loading {progress['resident']}/{progress['requested']} Meshes ({progress['fraction'] * 100.0:.0f}%)"
+
+    def delete(self) -> None:
+        if self.staging is not None:  self.staging.delete()
+        self.staging = None
+        self.packing = None
@@ -1,7 +1,5 @@
-float RayIntersectsTriangle(vec3 orig, vec3 dir, vec3 v0, vec3 v1, vec3 v2) {
-    vec3 edge1 = v1 - v0;
-    vec3 edge2 = v2 - v0;
-
+// Möller–Trumbore on Precomputed Edges, edge1 = v1 - v0 and edge2 = v2 - v0
+float RayIntersectsTriangle(vec3 orig, vec3 dir, vec3 v0, vec3 edge1, vec3 edge2) {
     vec3 h = cross(dir, edge2);
     float a = dot(edge1, h);
     if (abs(a) < 0.0001)  return -1.0;
@@ -19,4 +17,33 @@ float RayIntersectsTriangle(vec3 orig, vec3 dir, vec3 v0, vec3 v1, vec3 v2) {
     if (t > 0.0001)  return t;
         
     return -1.0;
+}
+
+#define BVH_STACK_SIZE 64  // Must Match Settings.BVH.STACK_SIZE
+
+struct BVHNode {
+    vec3 boundsMin;
+    int  leftFirst;  // Interior: Left Child (Right = leftFirst + 1), Leaf: First Triangle
+    vec3 boundsMax;
+    int  count;      // 0 for Interior Nodes
+};
+
+float RayIntersectsAABB(vec3 orig, vec3 invDir, vec3 boundsMin, vec3 boundsMax, float tMax) {
+    vec3 t0 = (boundsMin - orig) * invDir;
+    vec3 t1 = (boundsMax - orig) * invDir;
+
+    vec3 tSmall = min(t0, t1);
+    vec3 tLarge = max(t0, t1);
+
+    float tNear = max(max(tSmall.x, tSmall.y), tSmall.z);
+    float tFar  = min(min(tLarge.x, tLarge.y), tLarge.z);
+
+    if (tNear > tFar || tFar < 0.0 || tNear >= tMax)  return -1.0;
+
+    return max(tNear, 0.0);
+}
+
+vec3 SafeInverse(vec3 dir) {
+    vec3 signs = vec3(greaterThanEqual(dir, vec3(0.0))) * 2.0 - 1.0;  // Sign Without Zero
+    return 1.0 / mix(dir, signs * 1e-8, lessThan(abs(dir), vec3(1e-8)));
 }
\ No newline at end of file
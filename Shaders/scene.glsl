@@ -0,0 +1,149 @@
+#if defined(TRIANGLE_SOUP)
+
+// Buffers.soup.TriangleSoup, One Record per Triangle in Leaf Order, Takes the Vertex Buffer's Binding
+struct SoupTriangle {
+    vec3 v0;
+    vec3 edge1;
+    vec3 edge2;
+    vec3 normal;
+};
+
+layout(std430, binding = 0) buffer TriangleBuffer { SoupTriangle triangles[]; };
+
+void FetchTriangle(int meshIndex, int triangle, out vec3 v0, out vec3 edge1, out vec3 edge2) {
+    v0    = triangles[triangle].v0;
+    edge1 = triangles[triangle].edge1;
+    edge2 = triangles[triangle].edge2;
+}
+
+vec3 TriangleNormal(int meshIndex, int triangle) { return triangles[triangle].normal; }
+
+#elif defined(QUANTIZED_GEOMETRY)
+
+// Buffers.quantize.QuantizedGeometry, Positions Are 16 Bit Steps Across Each Mesh's Bounds
+struct MeshQuantization {
+    vec3 boundsMin;
+    uint vertexOffset;  // Indices Are Local to Their Mesh
+    vec3 stepSize;
+    uint padding;
+};
+
+layout(std430, binding = 0) buffer VertexBuffer { uvec2 packedVertices[]; };  // x: X | Y << 16, y: Z
+layout(std430, binding = 1) buffer IndexBuffer  { uint  packedIndices[];  };  // Two per Word With INDEX_16
+layout(std430, binding = 2) buffer NormalBuffer { uint  packedNormals[];  };  // Octahedral, Two snorm16
+layout(std430, binding = 3) buffer UVBuffer     { uint  packedUVs[];      };  // Two float16
+layout(std430, binding = 7) buffer MeshBuffer   { MeshQuantization meshes[]; };
+
+uint FetchIndex(int i) {
+#ifdef INDEX_16
+    return (packedIndices[i >> 1] >> ((i & 1) * 16)) & 0xFFFFu;
+#else
+    return packedIndices[i];
+#endif
+}
+
+vec3 FetchVertex(int meshIndex, uint index) {
+    MeshQuantization mesh = meshes[meshIndex];
+    uvec2 bits = packedVertices[mesh.vertexOffset + index];
+
+    return mesh.boundsMin + vec3(bits.x & 0xFFFFu, bits.x >> 16, bits.y & 0xFFFFu) * mesh.stepSize;
+}
+
+vec3 OctDecode(vec2 e) {
+    vec3 n = vec3(e, 1.0 - abs(e.x) - abs(e.y));
+    float fold = max(-n.z, 0.0);
+    n.xy += mix(vec2(fold), vec2(-fold), greaterThanEqual(n.xy, vec2(0.0)));
+
+    return normalize(n);
+}
+
+vec3 FetchNormal(int meshIndex, uint index) { return OctDecode(unpackSnorm2x16(packedNormals[meshes[meshIndex].vertexOffset + index])); }
+vec2 FetchUV(int meshIndex, uint index)     { return unpackHalf2x16(packedUVs[meshes[meshIndex].vertexOffset + index]); }
+
+#else
+
+layout(std430, binding = 0) buffer VertexBuffer { vec3 vertices[]; };
+layout(std430, binding = 1) buffer IndexBuffer  { uint indices[];  };
+layout(std430, binding = 2) buffer NormalBuffer { vec3 normals[];  };
+layout(std430, binding = 3) buffer UVBuffer     { vec2 UVs[];      };
+
+// Indices Are Global, meshIndex Is Only Needed by the Quantized Layout
+uint FetchIndex(int i)                      { return indices[i];  }
+vec3 FetchVertex(int meshIndex, uint index) { return vertices[index]; }
+vec3 FetchNormal(int meshIndex, uint index) { return normals[index];  }
+vec2 FetchUV(int meshIndex, uint index)     { return UVs[index];      }
+
+#endif
+
+#ifndef TRIANGLE_SOUP
+
+void FetchTriangle(int meshIndex, int triangle, out vec3 v0, out vec3 edge1, out vec3 edge2) {
+    v0    = FetchVertex(meshIndex, FetchIndex(triangle * 3 + 0));
+    edge1 = FetchVertex(meshIndex, FetchIndex(triangle * 3 + 1)) - v0;
+    edge2 = FetchVertex(meshIndex, FetchIndex(triangle * 3 + 2)) - v0;
+}
+
+// Only Evaluated for the Closest Hit, Not on Every Closer One
+vec3 TriangleNormal(int meshIndex, int triangle) {
+    vec3 v0, edge1, edge2;
+    FetchTriangle(meshIndex, triangle, v0, edge1, edge2);
+
+    return normalize(cross(edge1, edge2));
+}
+
+#endif
+
+layout(std430, binding = 4) buffer BVHBuffer    { BVHNode nodes[]; };  // Every Mesh's Bottom Level, Object Space
+
+// One Record per Instance in Top Level Leaf Order
+struct InstanceData {
+    mat4 worldToObject;
+    int  rootNode;   // Bottom Level Root in nodes[]
+    int  meshIndex;
+};
+
+layout(std430, binding = 5) buffer InstanceBuffer { InstanceData instances[]; };
+layout(std430, binding = 6) buffer TopLevelBuffer { BVHNode topNodes[];        };
+
+// Rewritten by GLRenderer Only When the Camera or Resolution Changes
+layout(std140, binding = 0) uniform CameraBlock {
+    mat4  CAM_INV_VIEW;
+    mat4  CAM_INV_PROJ;
+    vec3  CAM_POS;
+    float CAM_NEAR;
+    float CAM_FAR;
+    vec2  iResolution;
+};
+
+vec3 PrimaryRay(vec2 pixel) {
+    vec2 uv = (pixel / iResolution.xy) * 2.0 - 1.0;
+
+    vec4 clipPosition = vec4(uv.x, uv.y, -1.0, 1.0);
+    vec4 viewPosition = CAM_INV_PROJ * clipPosition;
+    
+    vec3 rayDirectionViewSpace = normalize(viewPosition.xyz / viewPosition.w);
+    return normalize((CAM_INV_VIEW * vec4(rayDirectionViewSpace, 0.0)).xyz);
+}
+
+// Object Space Rays Keep Their Unnormalized Direction, so Hit Distances Stay in World Units
+vec3 ToObject(InstanceData instance, vec3 v, float w) { return (instance.worldToObject * vec4(v, w)).xyz; }
+
+// Inverse Transpose of the Object to World Matrix
+vec3 NormalToWorld(InstanceData instance, vec3 normal) { return normalize((vec4(normal, 0.0) * instance.worldToObject).xyz); }
+
+vec3 ShadeHit(vec3 rayDirection, float closestDist, vec3 hitNormal) {
+    vec3 lightPosition = vec3(0.0, 10.0, 5.0);
+    vec3 backgroundColor = vec3(0.0);
+
+    float ambient = 0.2;
+    float diffuse = 1.0;
+
+    if (closestDist <= CAM_NEAR || closestDist >= CAM_FAR)  return backgroundColor;
+
+    vec3 hitPoint = CAM_POS + closestDist * rayDirection;
+
+    vec3 lightDirection = normalize(lightPosition - hitPoint);
+    float angle = dot(lightDirection, hitNormal);
+
+    return vec3(1.0, 1.0, 1.0) * (ambient + diffuse * max(0.0, angle));
+}
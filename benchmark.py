@@ -0,0 +1,223 @@
+from Renderers.context import HeadlessContext
+
+# Must Run Before Anything Imports OpenGL, the GL Backend Then Uses a Surfaceless llvmpipe Context
+HEADLESS_GL = HeadlessContext.prepare(software=True)
+
+import argparse
+import json
+import numpy as np
+import os
+import platform
+import time
+
+from os import path as ospath
+
+from Buffers.packer    import ScenePacker
+from Acceleration.twolevel import TwoLevelBVH
+from MeshLoaders.cache import MeshCache
+
+from camera   import Camera, CameraPath
+from instance import Instance
+from mesh     import Mesh
+from settings import Settings
+
+SCENES = {
+    "monkey": [ospath.join("Meshes", "monkey.glb")],
+    "teapot": [ospath.join("Meshes", "teapot.glb")],
+}
+
+# Synthetic Scenes Are "<mesh>-grid-<N>", N x N Instances of One Mesh on the XZ Plane
+GRID_SPACING = 1.25
+
+def loadBenchmarkScene(name: str, cache: MeshCache, optimize: bool = Settings.Optimize.ENABLED) -> tuple[ScenePacker, TwoLevelBVH]:
+    if name in SCENES:
+        scene = ScenePacker([Mesh.create(filename, cache, optimize=optimize) for filename in SCENES[name]])
+        return scene, TwoLevelBVH(scene)
+
+    if "-grid-" not in name:  raise ValueError(f"Unknown benchmark scene: {name}")
+
+    baseName, count = name.split("-grid-")
+    base  = Mesh.create(SCENES[baseName][0], cache, optimize=optimize)
+    count = int(count)
+
+    extent  = base.vertices.max(axis=0) - base.vertices.min(axis=0)
+    spacing = float(max(extent[0], extent[2])) * GRID_SPACING
+
+    instances = []
+    for row in range(count):
+        for column in range(count):
+            instances.append(Instance(base, ((column - (count - 1) / 2) * spacing, 0.0, (row - (count - 1) / 2) * spacing)))
+
+    scene = ScenePacker([base])
+    return scene, TwoLevelBVH(scene, instances=instances)
+
+def defaultPath(accel: TwoLevelBVH, frames: int) -> CameraPath:
+    # Orbit Framing the Whole Scene, Identical on Every Run
+    boundsMin = accel.top.nodes[0]["boundsMin"].astype(np.float64)
+    boundsMax = accel.top.nodes[0]["boundsMax"].astype(np.float64)
+
+    center = (boundsMin + boundsMax) * 0.5
+    radius = float(np.linalg.norm(boundsMax - boundsMin)) * 0.9
+
+    return CameraPath.orbit(tuple(float(value) for value in center), radius, frames, height=radius * 0.3)
+
+def createCamera(width: int, height: int) -> Camera:
+    camera = Camera(
+        None, (0, 0, 0), (0, -90, 0),
+        Settings.Camera.FOV, Settings.Camera.NEAR, Settings.Camera.FAR
+    )
+
+    # Benchmark Resolution May Differ From the Window's Aspect Ratio
+    camera.setAspectRatio(width / height)
+
+    return camera
+
+def summarize(frameTimes: list[float], rays: int, triangleTests: list[int] | None) -> dict:
+    frameTimes = np.asarray(frameTimes)
+    totalTime  = float(frameTimes.sum())
+
+    return {
+        "frames":   len(frameTimes),
+        "frameMs":  [round(frameTime * 1000.0, 4) for frameTime in frameTimes],
+        "meanMs":   float(frameTimes.mean()) * 1000.0,
+        "minMs":    float(frameTimes.min())  * 1000.0,
+        "maxMs":    float(frameTimes.max())  * 1000.0,
+        "p50Ms":    float(np.percentile(frameTimes, 50)) * 1000.0,
+        "p90Ms":    float(np.percentile(frameTimes, 90)) * 1000.0,
+        "p99Ms":    float(np.percentile(frameTimes, 99)) * 1000.0,
+        "raysPerSec": rays * len(frameTimes) / totalTime,
+        "triangleTestsPerSec": sum(triangleTests) / totalTime if triangleTests is not None else None,
+    }
+
+def benchmarkCPU(accel: TwoLevelBVH, path: CameraPath, width: int, height: int, workers: int) -> dict:
+    from Renderers.cpu      import CPURenderer
+    from Renderers.parallel import ParallelCPURenderer
+
+    camera   = createCamera(width, height)
+    # No Instancing on the CPU, Every Instance Is Flattened into World Space
+    renderer = CPURenderer(*accel.bake(), width, height)
+
+    frameTimes, triangleTests = [], []
+    with ParallelCPURenderer(renderer, workers) as parallel:
+        path.apply(camera, 0)
+        parallel.render(camera)  # Warm Up the Pool
+
+        for frame in range(len(path)):
+            path.apply(camera, frame)
+
+            startTime = time.perf_counter()
+            parallel.render(camera)
+            frameTimes.append(time.perf_counter() - startTime)
+            triangleTests.append(parallel.triangleTests)
+
+        workers = parallel.workers
+
+    return {"backend": "CPU", "workers": workers, **summarize(frameTimes, width * height, triangleTests)}
+
+def benchmarkGL(scene: ScenePacker, accel: TwoLevelBVH, path: CameraPath, width: int, height: int, backend: str = "GL", layout: str = "indexed", lod: bool = Settings.LOD.ENABLED) -> dict:
+    from OpenGL.GL import glFinish, glViewport
+
+    from Buffers.FBO       import FBO
+    from Renderers.gl      import GLRenderer
+    from Renderers.compute import ComputeRenderer
+
+    context = HeadlessContext()
+    camera  = createCamera(width, height)
+
+    # Runs Share accel, Each Starts at Full Detail Whatever Level the Last One Ended On
+    accel.resetLevels()
+
+    framebuffer = FBO(width, height)
+    quantized, soup = layout == "quantized", layout == "soup"
+    renderer    = ComputeRenderer(scene, accel, quantized=quantized, triangleSoup=soup) if backend == "COMPUTE" else GLRenderer(scene, accel, quantized, soup)
+
+    framebuffer.bind()
+    glViewport(0, 0, width, height)
+
+    path.apply(camera, 0)
+    renderer.render(camera, 0.0, width, height)  # Warm Up Shader Compilation
+    glFinish()
+
+    frameTimes, triangles = [], []
+    for frame in range(len(path)):
+        path.apply(camera, frame)
+
+        # Level Selection Is Part of the Frame, Like in main.py
+        startTime = time.perf_counter()
+        if lod:  renderer.updateLOD(camera)
+        triangles.append(accel.activeTriangles)
+
+        renderer.render(camera, frame / Settings.Screen.FPS, width, height)
+        glFinish()
+        frameTimes.append(time.perf_counter() - startTime)
+
+    framebuffer.unbind()
+
+    renderer.delete()
+    framebuffer.delete()
+    context.delete()
+
+    # Traversal Runs on the GPU, Triangle Tests Are Not Counted There
+    extra = {"workgroupSize": list(renderer.workgroupSize)} if backend == "COMPUTE" else {}
+    if renderer.geometry is not None:  extra["geometryBytes"] = sum(renderer.geometry.memoryUsage()[layout].values())
+    extra["lodTriangles"] = float(np.mean(triangles))
+    return {"backend": backend, "renderer": context.renderer, "layout": layout, "lod": lod, **extra, **summarize(frameTimes, width * height, None)}
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Raycast Engine frame benchmark")
+    parser.add_argument("--scenes",   nargs="+", default=["monkey", "teapot", "teapot-grid-4"])
+    parser.add_argument("--backends", nargs="+", type=str.upper, choices=("CPU", "GL", "COMPUTE"), default=["CPU", "GL", "COMPUTE"])
+    parser.add_argument("--frames",   type=int, default=10)
+    parser.add_argument("--width",    type=int, default=Settings.Screen.WIDTH  // 4)
+    parser.add_argument("--height",   type=int, default=Settings.Screen.HEIGHT // 4)
+    parser.add_argument("--workers",  type=int, default=Settings.Renderer.WORKERS)
+    parser.add_argument("--path",     help="Recorded camera path (main.py --record) replayed instead of the default orbit")
+    parser.add_argument("--output",   help="Also write the JSON report to this file")
+    parser.add_argument("--meshes",   nargs="+", type=str.lower, choices=("raw", "optimized"), default=["optimized"], help="Compare geometry as exported against MeshOptimizer output")
+    parser.add_argument("--no-lod",   dest="lod", action="store_false", default=Settings.LOD.ENABLED, help="Keep every instance at full detail on the GL backends")
+    parser.add_argument("--layouts",  nargs="+", type=str.lower, choices=("indexed", "quantized", "soup"), default=["indexed"], help="GPU geometry layouts to compare on the GL backends")
+    args = parser.parse_args()
+
+    cache = MeshCache()
+    recordedPath = CameraPath.load(args.path) if args.path else None
+
+    report = {
+        "environment": {
+            "python":   platform.python_version(),
+            "numpy":    np.__version__,
+            "platform": platform.platform(),
+            "cpus":     os.cpu_count(),
+        },
+        "settings": {"width": args.width, "height": args.height, "frames": args.frames},
+        "results":  [],
+    }
+
+    for sceneName, meshes in [(sceneName, meshes) for sceneName in args.scenes for meshes in args.meshes]:
+        scene, accel = loadBenchmarkScene(sceneName, cache, meshes == "optimized")
+        path = recordedPath or defaultPath(accel, args.frames)
+
+        for backend in args.backends:
+            if backend == "CPU":
+                results = [benchmarkCPU(accel, path, args.width, args.height, args.workers)]
+            elif not HEADLESS_GL:
+                results = [{"backend": backend, "skipped": "No headless software GL on this platform"}]
+            else:
+                results = []
+                for layout in args.layouts:
+                    try:
+                        results.append(benchmarkGL(scene, accel, path, args.width, args.height, backend, layout, args.lod))
+                    except Exception as e:
+                        results.append({"backend": backend, "layout": layout, "skipped": f"Software GL context unavailable: {e}"})
+
+            triangles = sum(accel.scene.rangeOf(instance.mesh).triangleCount for instance in accel.instances)
+            for result in results:
+                report["results"].append({"scene": sceneName, "meshes": meshes, "vertices": scene.vertexCount, "triangles": triangles, "levelTriangles": [mesh.levelTriangles for mesh in scene.meshes], "instances": accel.instanceCount, **result})
+
+    output = json.dumps(report, indent=2)
+    print(output)
+
+    if args.output:
+        with open(args.output, "w") as f:  f.write(output)
+
+if __name__ == "__main__":
+    main()
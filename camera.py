@@ -1,5 +1,6 @@
 import glfw
 import glm
+import json
 from typing import Union
 
 from settings import Settings
@@ -15,7 +16,7 @@ class Camera:
             FOV:         number | None = 60,
             NEAR:        number | None = 0.1,
             FAR:         number | None = 100.0,
-            speed:       number | None = 0.05,
+            speed:       number | None = 3.0,  # Units per Second
             sensitivity: number | None = 50.0
         ) -> None:
         
@@ -29,7 +30,8 @@ class Camera:
         self.speed       = speed
         self.sensitivity = sensitivity
         
-        self.mousePosition    = glm.vec2(glfw.get_cursor_pos(window))
+        # No Window When Rendering Headless, Input Is Then Ignored
+        self.mousePosition    = glm.vec2(glfw.get_cursor_pos(window)) if window is not None else glm.vec2(0.0)
         self.oldMousePosition = self.mousePosition
         
         self.window = window
@@ -37,6 +39,17 @@ class Camera:
         
         self.PM = self.getPM()
         self.invPM = glm.inverse(self.PM)
+        
+        # Bumped Whenever Anything the Shader Reads Changes, Consumers Compare Against Their Last Seen Value
+        self.version = 0
+
+    def markChanged(self):
+        self.version += 1
+
+    def setAspectRatio(self, aspectRatio: number):
+        self.PM = glm.perspective(glm.radians(self.FOV), aspectRatio, self.NEAR, self.FAR)
+        self.invPM = glm.inverse(self.PM)
+        self.markChanged()
 
     def updateVectors(self):
         yaw   = glm.radians(self.rotation.y)
@@ -59,7 +72,7 @@ class Camera:
             self.rightVector = glm.vec3(rollMat * glm.vec4(self.rightVector, 0.0))
             self.upVector    = glm.vec3(rollMat * glm.vec4(self.upVector, 0.0))
 
-    def updatePosition(self):
+    def updatePosition(self, dt: number):
         moveX = (glfw.get_key(self.window, glfw.KEY_D) == glfw.PRESS) - (glfw.get_key(self.window, glfw.KEY_A) == glfw.PRESS)
         moveY = (glfw.get_key(self.window, glfw.KEY_Q) == glfw.PRESS) - (glfw.get_key(self.window, glfw.KEY_E) == glfw.PRESS)
         moveZ = (glfw.get_key(self.window, glfw.KEY_W) == glfw.PRESS) - (glfw.get_key(self.window, glfw.KEY_S) == glfw.PRESS)
@@ -73,9 +86,9 @@ class Camera:
 
         if glm.length(moveVector) > 0:
             moveVector = glm.normalize(moveVector)
-            self.position += moveVector * self.speed
+            self.position += moveVector * self.speed * dt
 
-    def updateRotation(self, constrainPitch=True):
+    def updateRotation(self, dt: number, constrainPitch=True):
         self.mousePosition = glm.vec2(glfw.get_cursor_pos(self.window))
 
         if glfw.get_mouse_button(self.window, glfw.MOUSE_BUTTON_LEFT) == glfw.PRESS:
@@ -88,7 +101,7 @@ class Camera:
 
             dx *= self.sensitivity / width
             dy *= self.sensitivity / height
-            dz *= self.sensitivity / height
+            dz *= self.sensitivity / height * dt * Settings.Screen.FPS  # Roll Is Held, Tuned per Frame at the Target FPS
             
             self.rotation.z += dz
             
@@ -107,9 +120,20 @@ class Camera:
 
         self.oldMousePosition = self.mousePosition
 
-    def update(self):
-        self.updateRotation()
-        self.updatePosition()
+    def update(self, dt: number = Settings.Simulation.TIMESTEP) -> bool:
+        # One Simulation Step of dt Seconds, Returns Whether Position or Rotation Actually Changed
+        if self.window is None:  return False
+
+        oldPosition = glm.vec3(self.position)
+        oldRotation = glm.vec3(self.rotation)
+
+        self.updateRotation(dt)
+        self.updatePosition(dt)
+
+        changed = self.position != oldPosition or self.rotation != oldRotation
+        if changed:  self.markChanged()
+
+        return changed
 
     def getVM(self):
         return glm.lookAt(self.position, self.position + self.frontVector, self.upVector)
@@ -122,3 +146,70 @@ class Camera:
     
     def getInversePM(self):
         return glm.inverse(self.getPM())
+
+    def pickingRay(self, x: number, y: number, width: number, height: number) -> tuple[glm.vec3, glm.vec3]:
+        # World Space Ray Through a Window Position, Top Left Origin Like Cursor Coordinates
+        #   Same Math as PrimaryRay in Shaders/scene.glsl, so It Passes Through What That Pixel Shows
+        clipPosition = glm.vec4(x / width * 2.0 - 1.0, 1.0 - y / height * 2.0, -1.0, 1.0)
+        viewPosition = self.invPM * clipPosition
+
+        direction = glm.normalize(glm.vec3(viewPosition) / viewPosition.w)
+        direction = glm.normalize(glm.vec3(self.getInverseVM() * glm.vec4(direction, 0.0)))
+
+        return glm.vec3(self.position), direction
+
+    def cursorRay(self) -> tuple[glm.vec3, glm.vec3]:
+        # Picking Ray Under the Mouse, Straight Ahead When Headless
+        if self.window is None:  return self.pickingRay(0.5, 0.5, 1.0, 1.0)
+
+        x, y = glfw.get_cursor_pos(self.window)
+        width, height = glfw.get_window_size(self.window)
+
+        return self.pickingRay(x, y, max(1, width), max(1, height))
+
+# Recorded Position/Rotation Keyframes, Replayed One per Frame Without Any Input
+class CameraPath:
+    def __init__(self, keyframes: list[tuple[tuple[number, number, number], tuple[number, number, number]]] | None = None) -> None:
+        self.keyframes = list(keyframes) if keyframes is not None else []
+
+    def __len__(self) -> int:  return len(self.keyframes)
+
+    def record(self, camera: Camera) -> None:
+        self.keyframes.append((tuple(camera.position), tuple(camera.rotation)))
+
+    def apply(self, camera: Camera, frame: int) -> None:
+        position, rotation = self.keyframes[frame % len(self.keyframes)]
+
+        camera.position = glm.vec3(position)
+        camera.rotation = glm.vec3(rotation)
+        camera.updateVectors()
+        camera.markChanged()
+
+    def save(self, filename: str) -> None:
+        with open(filename, "w") as f:
+            json.dump({"keyframes": [[list(position), list(rotation)] for position, rotation in self.keyframes]}, f, indent=1)
+
+    @staticmethod
+    def load(filename: str) -> "CameraPath":
+        with open(filename, "r") as f:
+            data = json.load(f)
+
+        return CameraPath([(tuple(position), tuple(rotation)) for position, rotation in data["keyframes"]])
+
+    @staticmethod
+    def orbit(center: tuple[number, number, number], radius: number, frames: int, height: number = 0.0) -> "CameraPath":
+        # Deterministic Circle Around center, Always Looking at It
+        center = glm.vec3(center)
+        keyframes = []
+
+        for frame in range(frames):
+            angle = 2.0 * glm.pi() * frame / frames
+            position  = center + glm.vec3(glm.cos(angle) * radius, height, glm.sin(angle) * radius)
+            direction = glm.normalize(center - position)
+
+            pitch = glm.degrees(glm.asin(direction.y))
+            yaw   = glm.degrees(glm.atan(direction.z, direction.x))
+
+            keyframes.append((tuple(position), (pitch, yaw, 0.0)))
+
+        return CameraPath(keyframes)
@@ -0,0 +1,49 @@
+import glm
+from typing import Union
+
+from mesh import Mesh
+
+number = Union[int, float]
+
+# One Placement of a Mesh, Moving or Copying It Only Touches the Transform, Never the Geometry
+class Instance:
+    def __init__(
+            self,
+            mesh: Mesh,
+            position: tuple[number, number, number] = (0.0, 0.0, 0.0),
+            rotation: tuple[number, number, number] = (0.0, 0.0, 0.0),
+            scale:    tuple[number, number, number] = (1.0, 1.0, 1.0)
+        ) -> None:
+
+        self.mesh = mesh
+
+        self.position = glm.vec3(position)
+        self.rotation = glm.vec3(rotation)  # Degrees Around X, Y, Z
+        self.scale    = glm.vec3(scale)
+
+        # Bumped on Every Transform Change, the Top Level Structure Rebuilds When Any Version Moved
+        self.version = 0
+        self.transform = self.getTransform()
+
+    def markChanged(self) -> None:
+        self.transform = self.getTransform()
+        self.version += 1
+
+    def setTransform(
+            self,
+            position: tuple[number, number, number] | None = None,
+            rotation: tuple[number, number, number] | None = None,
+            scale:    tuple[number, number, number] | None = None
+        ) -> None:
+
+        if position is not None:  self.position = glm.vec3(position)
+        if rotation is not None:  self.rotation = glm.vec3(rotation)
+        if scale    is not None:  self.scale    = glm.vec3(scale)
+
+        self.markChanged()
+
+    def getTransform(self) -> glm.mat4:
+        return Mesh.composeTransform(self.position, self.rotation, self.scale)
+
+    def getInverseTransform(self) -> glm.mat4:
+        return glm.inverse(self.transform)
@@ -1,18 +1,140 @@
+import argparse
 import glfw
 import numpy as np
+import time
+
+from os import path as ospath
 
 from OpenGL.GL import *
 
-from Buffers.chunk   import Chunk
-from Buffers.texture import Texture
-from Buffers.SSBO    import SSBO
+from Buffers.packer   import ScenePacker
+from Buffers.quantize import QuantizedGeometry
+
+from Acceleration.query    import RayQuery
+from Acceleration.twolevel import TwoLevelBVH
+from MeshLoaders.cache  import MeshCache
+from MeshLoaders.loader import AssetLoader
+from programcache import ProgramCache
+from Renderers.compute  import ComputeRenderer
+from Renderers.cpu      import CPURenderer
+from Renderers.gl       import GLRenderer
+from Renderers.parallel import ParallelCPURenderer
+from Renderers.resolution import ResolutionController
+from Renderers.stream     import SceneStreamer
 
-from camera import Camera
-from mesh   import Mesh
-from shader import Shader
+from camera import Camera, CameraPath
+from profiler import Profiler
+from scheduler import FrameScheduler
 from settings import Settings
 
-def main() -> None:
+SCENE_FILES = [ospath.join("Meshes", "monkey.glb")]
+
+def loadScene(cache: MeshCache) -> tuple[ScenePacker, TwoLevelBVH]:
+    # Blocking Load, Meshes Build Side by Side on the Loader's Workers and Each Texture Decodes While Its Geometry Is Converted
+    with AssetLoader(cache) as loader:
+        loader.submit(SCENE_FILES)
+        loaded = {asset.filename: asset for asset in loader.wait()}
+    
+    # Nothing to Fall Back On Without Streaming, a Failed Asset Stops the Load
+    assets = [loaded[filename] for filename in SCENE_FILES]
+    for asset in assets:
+        if asset.failed:  raise asset.error
+    
+    scene = ScenePacker([asset.mesh for asset in assets])
+    
+    # One Instance per Mesh, Placed Through Its Transform
+    return scene, TwoLevelBVH(scene, [asset.blas for asset in assets], lodBlases=[asset.lodBlases for asset in assets])
+
+def reportScene(renderer: GLRenderer, filenames: list[str]) -> None:
+    scene, accel = renderer.accel.scene, renderer.accel
+    
+    for filename, mesh in zip(filenames, scene.meshes):
+        print(f"Mesh {filename}: {mesh.nbytes / 1024:.1f} KiB (" + ", ".join(f"{key}={value / 1024:.1f}" for key, value in mesh.memoryUsage().items()) + ")")
+        
+        # Optimizer Counts Only Exist for Assets Decoded This Run, Not for Cache Hits
+        if mesh.optimizeStats is not None:
+            before, after = mesh.optimizeStats["before"], mesh.optimizeStats["after"]
+            print(
+                f"Optimized {filename}: vertices {before['vertices']} -> {after['vertices']}, indices {before['indices']} -> {after['indices']}, "
+                f"vertex span {before['span']:.1f} -> {after['span']:.1f}"
+            )
+        
+        if mesh.levelCount > 1:  print(f"LOD {filename}: " + " -> ".join(str(count) for count in mesh.levelTriangles) + " triangles")
+    
+    for name, stats in [("TLAS", accel.stats)] + [(f"BLAS {i}", blas.stats) for i, blas in enumerate(accel.blases)]:
+        print(f"{name}: " + ", ".join(f"{key}={value:.2f}" if isinstance(value, float) else f"{key}={value}" for key, value in stats.items()))
+    
+    maxDepth = max([accel.top.maxDepth] + [blas.maxDepth for blas in accel.blases])
+    if maxDepth >= Settings.BVH.STACK_SIZE:
+        print(f"Warning: BVH depth {maxDepth} exceeds the shader traversal stack ({Settings.BVH.STACK_SIZE}), far subtrees past it are skipped.")
+    
+    if renderer.geometry is not None:
+        layout = renderer.geometry.LAYOUT
+        usage  = renderer.geometry.memoryUsage()
+        print(f"Geometry ({layout}): {sum(usage[layout].values()) / 1024:.1f} KiB (float {sum(usage['float'].values()) / 1024:.1f} KiB, " + ", ".join(f"{key}={value / 1024:.1f}" for key, value in usage[layout].items()) + ")")
+    
+    if isinstance(renderer.geometry, QuantizedGeometry):
+        for filename, row in zip(filenames, renderer.geometry.errorReport()):
+            print(f"Mesh {filename}: " + ", ".join(f"{key}={value:.3g}" if isinstance(value, float) else f"{key}={value}" for key, value in row.items()))
+    
+    for row in renderer.textureManager.report():
+        print(f"Texture {row['key']}: {row['size']}, {row['bytes'] / 1024:.1f} KiB resident, {row['refs']} refs")
+
+def reportPick(query: RayQuery, camera: Camera, filenames: list[str]) -> None:
+    # What the Cursor Is Over, Through the Same Queries Game Code Would Use
+    #   filenames Follow the Scene's Mesh Order, Which Is Arrival Order When Streaming
+    hits = query.raycast(*camera.cursorRay(), Settings.Camera.FAR)
+    if not hits.hit[0]:
+        print("Pick: nothing")
+        return
+    
+    print(
+        f"Pick: {filenames[hits.mesh[0]]} instance {hits.instance[0]}, triangle {hits.triangle[0]} at {hits.distance[0]:.3f}, "
+        f"barycentrics {np.round(hits.barycentrics[0], 3).tolist()}, normal {np.round(hits.normal[0], 3).tolist()}"
+    )
+
+def createCamera(window) -> Camera:
+    return Camera(
+        window, (0, 0, 0), (0, -90, 0),
+        Settings.Camera.FOV, Settings.Camera.NEAR, Settings.Camera.FAR,
+        Settings.Camera.SPEED, Settings.Camera.SENSITIVITY
+    )
+
+def mainCPU(output: str, workers: int = Settings.Renderer.WORKERS, scaling: bool = False, cache: MeshCache | None = None) -> None:
+    # Headless, No GLFW Window or GL Context Needed
+    camera     = createCamera(None)
+    scene, accel = loadScene(cache or MeshCache())
+    
+    # No Instancing on the CPU, Every Instance Is Flattened into World Space
+    renderer = CPURenderer(*accel.bake())
+    
+    if scaling:
+        for entry in ParallelCPURenderer.scalingReport(renderer, camera, workers or None):
+            print(f"Workers {entry['workers']:>3}: {entry['frameMs']:9.1f} ms, {entry['raysPerSec'] / 1e6:7.2f} MRays/s, {entry['speedup']:5.2f}x")
+        return
+    
+    with ParallelCPURenderer(renderer, workers) as parallel:
+        startTime = time.perf_counter()
+        framebuffer = parallel.render(camera)
+        print(f"CPU Frame: {(time.perf_counter() - startTime) * 1000.0:.1f} ms ({renderer.width}x{renderer.height}, {len(renderer.v0)} triangles, {parallel.workers} workers)")
+        
+        CPURenderer.saveImage(framebuffer, output)
+
+def main(
+        cache:    MeshCache | None = None,
+        record:   str | None       = None,
+        onDemand: bool             = Settings.Renderer.ON_DEMAND,
+        adaptive: bool             = Settings.Resolution.ADAPTIVE,
+        backend:  str              = Settings.Renderer.BACKEND,
+        profile:  bool             = Settings.Profiler.ENABLED,
+        trace:    str | None       = None,
+        vsync:    bool             = Settings.Screen.VSYNC,
+        quantized: bool            = Settings.Renderer.QUANTIZED,
+        soup:     bool             = Settings.Renderer.TRIANGLE_SOUP,
+        stream:   bool             = Settings.Streaming.ENABLED,
+        programCache: ProgramCache | None = None
+    ) -> None:
+
     if not glfw.init():  return
     
     glfw.window_hint(glfw.CONTEXT_VERSION_MAJOR, 4)
@@ -29,125 +151,152 @@ def main() -> None:
 
     glViewport(0, 0, Settings.Screen.WIDTH, Settings.Screen.HEIGHT)
 
-    shader = Shader("Shaders\\default.vsh", "Shaders\\default.fsh")
-
-    screenVertices = np.array([
-         1.0,  1.0,  0.0,
-        -1.0,  1.0,  0.0,
-         1.0, -1.0,  0.0,
-        -1.0, -1.0,  0.0
-    ], dtype=np.float32)
-
-    screenIndices = np.array([
-        0, 1, 2,
-        1, 3, 2
-    ], dtype=np.uint32)
-    
     # Initialize Camera and Meshes
-    camera = Camera(window, (0, 0, 0), (0, -90, 0), Settings.Camera.FOV, Settings.Camera.SPEED, Settings.Camera.SENSITIVITY)
-    meshes: set[Mesh] = set()
+    camera = createCamera(window)
     
-    meshes.add(Mesh.create("Meshes\\monkey.glb"))
+    # Streaming Opens on an Empty Scene, Meshes Join It as Workers Finish Them
+    if stream:
+        scene = ScenePacker([])
+        accel = TwoLevelBVH(scene)
+    else:
+        scene, accel = loadScene(cache or MeshCache())
     
-    meshVertices = []
-    meshIndices  = []
-    meshNormals  = []
-    meshUVs      = []
-    meshTextures = []
+    if backend == "COMPUTE":  renderer = ComputeRenderer(scene, accel, quantized=quantized, triangleSoup=soup, programCache=programCache)
+    else:                     renderer = GLRenderer(scene, accel, quantized, soup, programCache)
     
-    indicesOffset = 0
-    for obj in meshes:
-        for x, y, z in obj.vertices:  meshVertices.append((x, y, z, 0))  # Vec4 for Padding
-        for index in obj.indices:     meshIndices.append(index + indicesOffset)
-        
-        if obj.normals is not None:
-            for x, y, z in obj.normals:  meshNormals.append((x, y, z, 0))  # Vec4 for Padding
-        if obj.uvs is not None:
-            for x, y    in obj.uvs:  meshUVs.append((x, y))
-        if obj.textures is not None:
-            for texture in obj.textures:  meshTextures.append(texture)
-        
-        indicesOffset += len(obj.vertices)
-    
-    meshVertices = np.array(meshVertices, dtype=np.float32)
-    meshIndices  = np.array(meshIndices,  dtype=np.uint32 )
-    meshNormals  = np.array(meshNormals,  dtype=np.float32)
-    meshUVs      = np.array(meshUVs    ,  dtype=np.float32)
-
-    # Screen Buffer
-    if len(meshTextures) == 0:  meshTextures = None
-    screenChunk = Chunk(screenVertices, screenIndices, 0, 3, GL_FLOAT, meshTextures)
-    screenChunk.sendData()
-    screenChunk.bindTextureData(shader.program, GL_TEXTURE0)
-    
-    # Upload Mesh Data
-    ssboVert   = SSBO.sendData(meshVertices, 0)
-    ssboIndex  = SSBO.sendData(meshIndices,  1)
-    ssboNormal = SSBO.sendData(meshNormals,  2)
-    ssboUV     = SSBO.sendData(meshUVs,      3)
-
-    # Constant Uniforms
-    glUseProgram(shader.program)
-    Shader.createUniform(shader.program, "CAM_PROJ_MAT", tuple(np.array(camera.PM   ).flatten('F')))
-    Shader.createUniform(shader.program, "CAM_INV_PROJ", tuple(np.array(camera.invPM).flatten('F')))
-            
-    Shader.createUniform(shader.program, "CAM_FOV",  camera.FOV)
-    Shader.createUniform(shader.program, "CAM_NEAR", camera.NEAR)
-    Shader.createUniform(shader.program, "CAM_FAR",  camera.FAR)
+    # Workers Wake an Idle Loop Whenever an Asset Is Ready
+    loader   = AssetLoader(cache or MeshCache(), notify=glfw.post_empty_event) if stream else None
+    streamer = SceneStreamer(renderer, loader) if stream else None
+    
+    if stream:  loader.submit(SCENE_FILES)
+    else:       reportScene(renderer, SCENE_FILES)
     
-    Shader.createUniform(shader.program, "numTriangles", len(meshIndices) // 3)
+    # Lowers the Raycast Resolution While Moving to Hold the Target FPS
+    resolution = ResolutionController() if adaptive else None
+    frameTime  = 0.0
     
-    lastTime = 0
-    elapsedTime = 0
-    inverseFPS = 1 / Settings.Screen.FPS
+    # Phase Timings, a Trace Implies Profiling
+    profiler = Profiler(enabled=profile or trace is not None)
+    
+    # Camera Path for benchmark.py --path
+    recordedPath = CameraPath() if record else None
+    
+    # Exposed or Resized Windows Lose Their Contents
+    glfw.set_window_refresh_callback(window, lambda window: renderer.markDirty())
+    
+    # Right Click Reports What Is Under the Cursor
+    glfw.set_mouse_button_callback(window, lambda window, button, action, mods: reportPick(RayQuery(renderer.accel), camera, [asset.filename for asset in streamer.assets] if streamer is not None else SCENE_FILES) if button == glfw.MOUSE_BUTTON_RIGHT and action == glfw.PRESS else None)
+    
+    # Paces Frames and Runs the Camera on a Fixed Timestep, Independent of How Fast Frames Render
+    scheduler = FrameScheduler(vsync=vsync)
+    scheduler.applySwapInterval()
+    idle = False
+    
+    # Edited Shaders Are Picked Up While Running
+    lastShaderCheck = glfw.get_time()
 
     while not glfw.window_should_close(window):
         
         if glfw.get_key(window, glfw.KEY_ESCAPE): glfw.set_window_should_close(window, True)
         
-        glfw.poll_events()
-        time = glfw.get_time()
+        # Nothing Changed Last Frame, Sleep Until Input Arrives, Otherwise Until the Next Deadline
+        if idle:  scheduler.idle(Settings.Renderer.IDLE_TIMEOUT)
+        else:     scheduler.wait()
         
-        if elapsedTime >= inverseFPS:
-            camera.update()
-            
-            glClearColor(0, 0, 0, 1.0)
-            glClear(GL_COLOR_BUFFER_BIT)
-            
-            glUseProgram(shader.program)
+        currentTime = glfw.get_time()
+        
+        profiler.beginFrame()
+        
+        with profiler.phase("update"):
+            moving = False
+            for _ in range(scheduler.steps()):  moving = camera.update(scheduler.timestep) or moving
+            if recordedPath is not None:  recordedPath.record(camera)
+        
+        # Moved Instances Re-Upload Their Records and Top Level, Never the Geometry
+        with profiler.phase("upload"):
+            if streamer is not None and streamer.update():
+                progress = streamer.progress
+                print(f"Streamed {progress['resident']}/{progress['requested']} meshes at {streamer.loader.elapsed * 1000.0:.0f} ms ({progress['bytesUploaded'] / 1024:.1f} KiB over {progress['framesUsed']} frames)")
+                if streamer.idle:  reportScene(renderer, [asset.filename for asset in streamer.assets])
+                if not profiler.enabled:  glfw.set_window_title(window, "Raycasting" if streamer.idle else f"Raycasting | {streamer.summary()}")
             
-            # Uniforms
-            Shader.createUniform(shader.program, "CAM_POS", tuple(camera.position))
-            Shader.createUniform(shader.program, "CAM_ROT", tuple(camera.rotation))
+            moving = renderer.updateInstances() or moving
+            renderer.updateLOD(camera)
+            renderer.streamTextures()
             
-            Shader.createUniform(shader.program, "CAM_VIEW_MAT", tuple(np.array(camera.getVM()       ).flatten('F')))
-            Shader.createUniform(shader.program, "CAM_INV_VIEW", tuple(np.array(camera.getInverseVM()).flatten('F')))
+            if Settings.Renderer.SHADER_RELOAD_INTERVAL and currentTime - lastShaderCheck >= Settings.Renderer.SHADER_RELOAD_INTERVAL:
+                lastShaderCheck = currentTime
+                if renderer.reloadShaders():  print("Reloaded shaders")
+        
+        width, height = Settings.Screen.WIDTH, Settings.Screen.HEIGHT
+        if resolution is not None:
+            resolution.update(frameTime, moving)
+            width, height = resolution.resolution(width, height)
+        
+        if onDemand and not renderer.needsRender(camera, width, height):
+            renderer.skipFrame()
+            scheduler.resetFrameClock()
+            idle = renderer.uploader.idle and (streamer is None or streamer.idle)  # Keep Pumping Until Every Texture and Mesh Is Resident
+        else:
+            frameStart = time.perf_counter()
             
-            Shader.createUniform(shader.program, "iResolution", (Settings.Screen.WIDTH, Settings.Screen.HEIGHT))
-            Shader.createUniform(shader.program, "iTime", time)
+            # Done Here so the Upload Is Timed on Its Own, the Render Call Then Finds It Current
+            with profiler.phase("uniforms"):
+                renderer.updateCameraBlock(camera, width, height)
             
-            screenChunk.bind()
-            glDrawElements(GL_TRIANGLES, len(screenIndices), GL_UNSIGNED_INT, None)
-            screenChunk.unbind()
+            with profiler.phase("render"):
+                glClearColor(0, 0, 0, 1.0)
+                glClear(GL_COLOR_BUFFER_BIT)
+                
+                renderer.renderScaled(camera, currentTime, width, height, Settings.Screen.WIDTH, Settings.Screen.HEIGHT)
 
-            glfw.swap_buffers(window)
-            elapsedTime = 0
-        else:
-            elapsedTime += time - lastTime
+            with profiler.phase("swap"):
+                glfw.swap_buffers(window)
+            idle = False
             
-        lastTime = time
+            # Includes the Swap, Which Blocks Once the GPU Falls Behind
+            frameTime = time.perf_counter() - frameStart
+            scheduler.frameDone()
+        
+        profiler.endFrame()
+        if profiler.report():  glfw.set_window_title(window, f"Raycasting | {profiler.title()} | {scheduler.summary()}")
 
-    screenChunk.unbindTextureData()
-    screenChunk.delete()
+    print(f"Frames: {renderer.framesRendered} rendered, {renderer.framesSkipped} skipped")
+    print(f"Pacing: {scheduler.summary()}")
+    
+    if trace is not None:  profiler.saveTrace(trace)
+    profiler.delete()
     
-    ssboVert.delete()
-    ssboIndex.delete()
-    ssboNormal.delete()
-    ssboUV.delete()
+    if stream:
+        loader.close()
+        streamer.delete()
     
-    glDeleteProgram(shader.program)
+    renderer.delete()
+    
+    if recordedPath is not None:  recordedPath.save(record)
 
     glfw.terminate()
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Raycast Engine")
+    parser.add_argument("--backend", type=str.upper, choices=("GL", "COMPUTE", "CPU"), default=Settings.Renderer.BACKEND)
+    parser.add_argument("--output",  default="frame.png", help="Image written by the CPU backend")
+    parser.add_argument("--workers", type=int, default=Settings.Renderer.WORKERS, help="CPU backend processes, 0 uses every core")
+    parser.add_argument("--scaling", action="store_true", help="Report CPU backend throughput at 1..workers processes")
+    parser.add_argument("--no-cache", dest="cache", action="store_false", default=Settings.Cache.ENABLED, help="Bypass the preprocessed mesh and linked shader program caches")
+    parser.add_argument("--record",   help="Save the camera path to this file for benchmark.py --path")
+    parser.add_argument("--on-demand", dest="onDemand", action="store_true", default=Settings.Renderer.ON_DEMAND, help="Only redraw when the camera or scene changed")
+    parser.add_argument("--adaptive", action="store_true", default=Settings.Resolution.ADAPTIVE, help="Scale the raycast resolution to hold Settings.Screen.FPS while moving")
+    parser.add_argument("--profile", action="store_true", default=Settings.Profiler.ENABLED, help="Time each frame phase on the CPU and GPU, summarized every second")
+    parser.add_argument("--trace",   help="Write the profiled phases to this file as Chrome trace-event JSON")
+    parser.add_argument("--vsync",   action="store_true", default=Settings.Screen.VSYNC, help="Pace frames with the buffer swap instead of sleeping to Settings.Screen.FPS")
+    parser.add_argument("--quantized", action="store_true", default=Settings.Renderer.QUANTIZED, help="Store geometry as 16 bit positions, octahedral normals and half float UVs on the GPU")
+    parser.add_argument("--soup",      action="store_true", default=Settings.Renderer.TRIANGLE_SOUP, help="Store each triangle as v0, edges and normal on the GPU instead of indexed vertices")
+    parser.add_argument("--no-stream", dest="stream", action="store_false", default=Settings.Streaming.ENABLED, help="Load every mesh before opening the window instead of streaming them in")
+    args = parser.parse_args()
+    
+    cache = MeshCache(enabled=args.cache)
+    programCache = ProgramCache(enabled=args.cache)
+    
+    if args.backend == "CPU":  mainCPU(args.output, args.workers, args.scaling, cache)
+    else:                      main(cache, args.record, args.onDemand, args.adaptive, args.backend, args.profile, args.trace, args.vsync, args.quantized, args.soup, args.stream, programCache)
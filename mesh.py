@@ -1,34 +1,212 @@
 import glm
+import numpy as np
 from typing import Union
 
-from MeshLoaders.glb import GLB
+from MeshLoaders.glb   import GLB
+from MeshLoaders.cache import MeshCache
+from MeshLoaders.image import ImageDecoder
+from MeshLoaders.optimize import MeshOptimizer
+from MeshLoaders.simplify import MeshSimplifier
+from settings import Settings
 
 number = Union[int, float]
 
 class Mesh:
+    # No Per Instance __dict__, Geometry Lives in a Handful of Contiguous Arrays
+    __slots__ = (
+        "localVertices", "indices", "localNormals", "uvs", "textures", "lodIndices", "optimizeStats",
+        "position", "rotation", "scale", "version",
+        "transformedVertices", "transformedNormals", "transformedVersion",
+    )
+
     def __init__(
             self,
-            vertices: list[tuple[number, number, number]],
-            indices:  list[tuple[int, int, int]],
-            normals:  list[tuple[number, number, number]] | None = None,
-            uvs:      list[tuple[number, number]]         | None = None,
-            textures: list[str]                           | None = None
+            vertices: np.ndarray,
+            indices:  np.ndarray,
+            normals:  np.ndarray | None = None,
+            uvs:      np.ndarray | None = None,
+            textures: list[np.ndarray] | None = None, # RGBA8 (Height, Width, 4), Top Row First
+            lodIndices: list[np.ndarray] | None = None # Coarser Levels, Indexing the Same Vertices
+        ) -> None:
+        
+        # Untransformed Geometry, Never Modified
+        self.localVertices = np.ascontiguousarray(vertices, dtype=np.float32)
+        self.indices       = np.ascontiguousarray(indices,  dtype=np.uint32).reshape(-1)
+        self.localNormals  = np.ascontiguousarray(normals,  dtype=np.float32) if normals  is not None else None
+        self.uvs           = np.ascontiguousarray(uvs,      dtype=np.float32) if uvs      is not None else None
+        self.textures      = list(textures)                                   if textures is not None else None
+        self.lodIndices    = [np.ascontiguousarray(lod, dtype=np.uint32).reshape(-1) for lod in lodIndices or []]
+        
+        # MeshOptimizer Before/After Counts, Only Known When the Asset Was Decoded Rather Than Read From the Cache
+        self.optimizeStats: dict | None = None
+        
+        self.position = glm.vec3(0.0)
+        self.rotation = glm.vec3(0.0)  # Degrees Around X, Y, Z
+        self.scale    = glm.vec3(1.0)
+        
+        # Transformed Copies Are Built on First Access and Kept Until the Transform Changes
+        self.version = 0
+        self.transformedVertices = None
+        self.transformedNormals  = None
+        self.transformedVersion  = -1
+        
+    def setTransform(
+            self,
+            position: tuple[number, number, number] | None = None,
+            rotation: tuple[number, number, number] | None = None,
+            scale:    number | tuple[number, number, number] | None = None
         ) -> None:
         
-        self.vertices = list(vertices)
-        self.indices  = list(indices)
-        self.normals  = list(normals)  if normals  is not None else None
-        self.uvs      = list(uvs)      if uvs      is not None else None
-        self.textures = list(textures) if textures is not None else None
+        if position is not None:  self.position = glm.vec3(position)
+        if rotation is not None:  self.rotation = glm.vec3(rotation)
+        if scale    is not None:  self.scale    = glm.vec3(scale)
         
-        self.scale = 1
+        self.update()
         
     def update(self) -> None:
-        self.vertices = [(x * self.scale, y * self.scale, z * self.scale) for x, y, z in self.vertices]
+        # Call After Assigning position, rotation or scale Directly, Nothing Is Recomputed Until Geometry Is Read
+        self.version += 1
         
-    @staticmethod
-    def create(filename: str) -> "Mesh":
-        if filename.endswith(".glb"):
-            return Mesh(*GLB.load(filename))
+    @property
+    def isIdentity(self) -> bool:
+        return self.position == glm.vec3(0.0) and self.rotation == glm.vec3(0.0) and self.scale == glm.vec3(1.0)
+    
+    @property
+    def vertices(self) -> np.ndarray:
+        self.applyTransform()
+        return self.transformedVertices
+    
+    @property
+    def normals(self) -> np.ndarray | None:
+        self.applyTransform()
+        return self.transformedNormals
+    
+    def applyTransform(self) -> None:
+        if self.transformedVersion == self.version:  return
+        
+        if self.isIdentity:
+            # Untransformed Meshes Share Their Local Arrays, No Copy
+            self.transformedVertices = self.localVertices
+            self.transformedNormals  = self.localNormals
         else:
+            transform = np.array(Mesh.composeTransform(self.position, self.rotation, self.scale), dtype=np.float32)
+            linear    = transform[:3, :3]
+            
+            self.transformedVertices = self.localVertices @ linear.T + transform[:3, 3]
+            
+            if self.localNormals is not None:
+                # Inverse Transpose Keeps Normals Perpendicular Under Non Uniform Scale
+                normals = self.localNormals @ np.linalg.inv(linear).astype(np.float32)
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    self.transformedNormals = normals / np.linalg.norm(normals, axis=1, keepdims=True)
+            else:
+                self.transformedNormals = None
+        
+        self.transformedVersion = self.version
+        
+    @staticmethod
+    def composeTransform(position: glm.vec3, rotation: glm.vec3, scale: glm.vec3) -> glm.mat4:
+        # Object to World: Scale, Then Rotate X, Y, Z, Then Translate
+        transform = glm.translate(glm.mat4(1.0), position)
+        transform = glm.rotate(transform, glm.radians(rotation.z), glm.vec3(0.0, 0.0, 1.0))
+        transform = glm.rotate(transform, glm.radians(rotation.y), glm.vec3(0.0, 1.0, 0.0))
+        transform = glm.rotate(transform, glm.radians(rotation.x), glm.vec3(1.0, 0.0, 0.0))
+        
+        return glm.scale(transform, scale)
+        
+    def memoryUsage(self) -> dict[str, int]:
+        # Bytes Held per Array, Transformed Copies Only Count When They Are Not Shared
+        usage = {
+            "vertices": self.localVertices.nbytes,
+            "indices":  self.indices.nbytes,
+            "normals":  self.localNormals.nbytes if self.localNormals is not None else 0,
+            "uvs":      self.uvs.nbytes          if self.uvs          is not None else 0,
+            "textures": sum(texture.nbytes for texture in self.textures or []),
+            "lods":     sum(lod.nbytes for lod in self.lodIndices),
+            "transformed": 0,
+        }
+        
+        if self.transformedVertices is not None and self.transformedVertices is not self.localVertices:
+            usage["transformed"] += self.transformedVertices.nbytes
+        if self.transformedNormals is not None and self.transformedNormals is not self.localNormals:
+            usage["transformed"] += self.transformedNormals.nbytes
+            
+        return usage
+    
+    @property
+    def nbytes(self) -> int:  return sum(self.memoryUsage().values())
+
+    @property
+    def levelCount(self) -> int:  return 1 + len(self.lodIndices)
+
+    @property
+    def levelTriangles(self) -> list[int]:  return [len(indices) // 3 for indices in [self.indices] + self.lodIndices]
+        
+    @staticmethod
+    def create(
+            filename: str,
+            cache:    MeshCache | None    = None,
+            decoder:  ImageDecoder | None = None,
+            optimize: bool                = Settings.Optimize.ENABLED,
+            lod:      bool                = Settings.LOD.ENABLED
+        ) -> "Mesh":
+
+        if not filename.endswith(".glb"):
             raise NotImplementedError(f"Unsupported Mesh Format: {filename.split('.')[-1]}")
+
+        if cache is None:  cache = MeshCache()
+
+        optimizeStats = {}
+        arrays = cache.fetch(cache.key(filename), Mesh.cacheName(optimize, lod), lambda: Mesh.decode(filename, decoder, optimize, lod, optimizeStats))
+        textures = [arrays["texture"]] if "texture" in arrays else None
+
+        lodIndices = []
+        while f"lod{len(lodIndices) + 1}" in arrays:  lodIndices.append(arrays[f"lod{len(lodIndices) + 1}"])
+
+        mesh = Mesh(arrays["vertices"], arrays["indices"], arrays.get("normals"), arrays.get("uvs"), textures, lodIndices)
+        mesh.optimizeStats = optimizeStats or None
+        return mesh
+
+    @staticmethod
+    def cacheName(optimize: bool = Settings.Optimize.ENABLED, lod: bool = Settings.LOD.ENABLED) -> str:
+        # Optimized and Raw Geometry Are Cached Side by Side, Anything Built From the Triangle Order Must Key on This Too
+        name = f"mesh-opt{MeshOptimizer.VERSION}" if optimize else "mesh"
+        if lod:  name += f"-lod{MeshSimplifier.VERSION}-" + "-".join(f"{ratio:g}" for ratio in Settings.LOD.RATIOS)
+
+        return name
+
+    @staticmethod
+    def decode(
+            filename: str,
+            decoder:  ImageDecoder | None = None,
+            optimize: bool                = Settings.Optimize.ENABLED,
+            lod:      bool                = Settings.LOD.ENABLED,
+            optimizeStats: dict | None    = None  # Filled With MeshOptimizer's Before/After Counts
+        ) -> dict[str, np.ndarray]:
+
+        # Everything the Cache Stores for One Asset, Textures as Decoded RGBA Bytes
+        positions, indices, normals, uvs, texture = GLB.load(filename)
+
+        # The Texture Decodes on the Pool While the Geometry Is Converted Here
+        pending = decoder.submit(texture) if decoder is not None and texture is not None else None
+
+        arrays = {
+            "vertices": np.asarray(positions, dtype=np.float32),
+            "indices":  np.asarray(indices,   dtype=np.uint32)  if indices is not None else np.arange(len(positions), dtype=np.uint32),
+            "normals":  np.asarray(normals,   dtype=np.float32) if normals is not None else None,
+            "uvs":      np.asarray(uvs,       dtype=np.float32) if uvs     is not None else None,
+        }
+
+        if optimize:
+            arrays, stats = MeshOptimizer.optimize(arrays)
+            if optimizeStats is not None:  optimizeStats.update(stats)
+
+        if lod:
+            # Levels Share the Vertex Array, Only Their Index Buffers Are Stored
+            levels = MeshSimplifier.levels(arrays["vertices"], arrays["indices"])
+            for level, lodIndices in enumerate(levels, start=1):  arrays[f"lod{level}"] = lodIndices
+
+        if   pending is not None:  arrays["texture"] = pending.result()
+        elif texture is not None:  arrays["texture"] = ImageDecoder.decode(texture)
+
+        return arrays
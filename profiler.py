@@ -0,0 +1,197 @@
+import ctypes
+import json
+import numpy as np
+import time
+
+from OpenGL.GL import *
+from OpenGL.raw.GL.VERSION.GL_3_3 import glGetQueryObjectui64v as rawGetQueryObjectui64v
+from contextlib import contextmanager, nullcontext
+
+from settings import Settings
+
+# Rolling Per Phase Timings, the Last history Frames Kept in a Fixed Ring
+class PhaseStats:
+    def __init__(self, history: int) -> None:
+        self.cpu = np.full(history, np.nan)
+        self.gpu = np.full(history, np.nan)
+
+    def summary(self, values: np.ndarray) -> dict[str, float]:
+        values = values[~np.isnan(values)]
+        if len(values) == 0:  return {"mean": 0.0, "p95": 0.0, "max": 0.0}
+
+        return {"mean": float(values.mean()), "p95": float(np.percentile(values, 95)), "max": float(values.max())}
+
+# CPU Timers and GL_TIME_ELAPSED Queries Around Each Phase of the Frame
+#   Queries Alternate Between QUERY_SLOTS Sets and Are Only Read Once Available, So Results Lag a Frame
+#   and Reading Them Never Waits on the GPU. Elapsed Queries Can't Nest, Inner Phases Get CPU Time Only
+class Profiler:
+    QUERY_SLOTS = 2
+
+    CPU_THREAD = 0
+    GPU_THREAD = 1
+
+    def __init__(
+            self,
+            enabled:    bool = Settings.Profiler.ENABLED,
+            gpu:        bool = Settings.Profiler.GPU_QUERIES,
+            history:    int  = Settings.Profiler.HISTORY,
+            maxEvents:  int  = Settings.Profiler.MAX_TRACE_EVENTS
+        ) -> None:
+
+        self.enabled   = enabled
+        self.gpu       = gpu and enabled
+        self.history   = history
+        self.maxEvents = maxEvents
+
+        self.frame = 0
+        self.slot  = 0
+        self.depth = 0  # Open Phases, GPU Queries Only Wrap the Outermost
+
+        self.phases: dict[str, PhaseStats] = {}
+
+        # Per Slot: phase -> (Query ID, CPU Start in Trace Microseconds, Frame)
+        self.queries: list[dict[str, tuple[int, float, int]]] = [{} for _ in range(Profiler.QUERY_SLOTS)]
+        self.freeQueries: list[int] = []
+        self.droppedQueries = 0  # Phases Skipped Because Their Last Query in This Slot Is Still Pending
+
+        self.events: list[dict] = []
+        self.startTime = time.perf_counter()
+        self.frameStart = self.startTime
+        self.lastReport = self.startTime
+
+    def microseconds(self, t: float) -> float:  return (t - self.startTime) * 1e6
+
+    def stats(self, name: str) -> PhaseStats:
+        if name not in self.phases:  self.phases[name] = PhaseStats(self.history)
+        return self.phases[name]
+
+    def record(self, name: str, thread: int, start: float, duration: float) -> None:
+        if len(self.events) >= self.maxEvents:  return
+
+        self.events.append({"name": name, "ph": "X", "pid": 0, "tid": thread, "ts": start, "dur": duration})
+
+    def phase(self, name: str):
+        # with profiler.phase("render"): ...  Costs Nothing When Disabled
+        if not self.enabled:  return nullcontext()
+        return self.timePhase(name)
+
+    @contextmanager
+    def timePhase(self, name: str):
+        useQuery = self.gpu and self.depth == 0
+        if useQuery and name in self.queries[self.slot]:
+            useQuery = False
+            self.droppedQueries += 1
+        if useQuery:
+            query = self.freeQueries.pop() if self.freeQueries else int(glGenQueries(1)[0])
+            glBeginQuery(GL_TIME_ELAPSED, query)
+
+        self.depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.depth -= 1
+
+            if useQuery:
+                glEndQuery(GL_TIME_ELAPSED)
+                self.queries[self.slot][name] = (query, self.microseconds(start), self.frame)
+
+            self.stats(name).cpu[self.frame % self.history] = (end - start) * 1000.0
+            self.record(name, Profiler.CPU_THREAD, self.microseconds(start), (end - start) * 1e6)
+
+    def beginFrame(self) -> None:
+        if not self.enabled:  return
+
+        self.frameStart = time.perf_counter()
+
+        # Clear This Frame's Row so Phases That Didn't Run Don't Show Stale Times
+        for stats in self.phases.values():
+            stats.cpu[self.frame % self.history] = np.nan
+            stats.gpu[self.frame % self.history] = np.nan
+
+    def endFrame(self) -> None:
+        if not self.enabled:  return
+
+        end = time.perf_counter()
+        self.stats("frame").cpu[self.frame % self.history] = (end - self.frameStart) * 1000.0
+
+        # Collect the Other Slot, Written Last Frame, Before It Is Reused Next Frame
+        self.slot = (self.slot + 1) % Profiler.QUERY_SLOTS
+        if self.gpu:  self.collect(self.slot)
+
+        self.frame += 1
+
+    def collect(self, slot: int) -> None:
+        for name, (query, start, frame) in list(self.queries[slot].items()):
+            # Left Pending Rather Than Stall, the Phase Skips Its Query Until It Lands
+            if not glGetQueryObjectiv(query, GL_QUERY_RESULT_AVAILABLE):  continue
+
+            # The Wrapped 64 Bit Getter Has No NumPy Type Mapping in PyOpenGL, the Raw Entry Point Takes a Pointer
+            result = ctypes.c_uint64()
+            rawGetQueryObjectui64v(query, GL_QUERY_RESULT, ctypes.byref(result))
+            elapsed = result.value / 1e6  # ns -> ms
+            del self.queries[slot][name]
+            self.freeQueries.append(query)
+
+            # The Ring Row May Have Moved On, Only Fill It While It Still Belongs to That Frame
+            if self.frame - frame < self.history:  self.stats(name).gpu[frame % self.history] = elapsed
+
+            # Elapsed Queries Have No Start Time, GPU Events Are Placed at the Matching CPU Start
+            self.record(name, Profiler.GPU_THREAD, start, elapsed * 1000.0)
+
+    def summary(self) -> dict[str, dict[str, dict[str, float]]]:
+        return {
+            name: {"cpu": stats.summary(stats.cpu), "gpu": stats.summary(stats.gpu)}
+            for name, stats in self.phases.items()
+        }
+
+    def summaryLines(self) -> list[str]:
+        lines = []
+        for name, times in self.summary().items():
+            cpu, gpu = times["cpu"], times["gpu"]
+            line = f"{name:>10}: CPU {cpu['mean']:7.3f} ms (p95 {cpu['p95']:7.3f}, max {cpu['max']:7.3f})"
+            if gpu["max"] > 0.0:  line += f" | GPU {gpu['mean']:7.3f} ms (p95 {gpu['p95']:7.3f})"
+            lines.append(line)
+
+        return lines
+
+    def title(self) -> str:
+        # Short Form for the Window Title
+        summary = self.summary()
+        frame = summary.get("frame", {}).get("cpu", {}).get("mean", 0.0)
+        parts = [f"{frame:.2f} ms"] + [
+            f"{name} {times['gpu']['mean']:.2f}" for name, times in summary.items() if times["gpu"]["max"] > 0.0
+        ]
+
+        return " | ".join(parts)
+
+    def report(self, interval: float = Settings.Profiler.REPORT_INTERVAL) -> bool:
+        # Prints the Summary at Most Every interval Seconds, Returns Whether It Printed
+        if not self.enabled:  return False
+
+        now = time.perf_counter()
+        if now - self.lastReport < interval:  return False
+
+        self.lastReport = now
+        print(f"Profile over {min(self.frame, self.history)} frames:")
+        for line in self.summaryLines():  print(line)
+
+        return True
+
+    def saveTrace(self, filename: str) -> None:
+        # Chrome Trace Event Format, Open in chrome://tracing or ui.perfetto.dev
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": 0, "tid": Profiler.CPU_THREAD, "args": {"name": "CPU"}},
+            {"name": "thread_name", "ph": "M", "pid": 0, "tid": Profiler.GPU_THREAD, "args": {"name": "GPU"}},
+        ]
+
+        with open(filename, "w") as f:
+            json.dump({"traceEvents": metadata + self.events, "displayTimeUnit": "ms"}, f)
+
+    def delete(self) -> None:
+        queries = self.freeQueries + [query for slot in self.queries for query, _, _ in slot.values()]
+        if queries:  glDeleteQueries(len(queries), queries)
+
+        self.freeQueries = []
+        self.queries = [{} for _ in range(Profiler.QUERY_SLOTS)]
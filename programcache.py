@@ -0,0 +1,134 @@
+import ctypes
+import hashlib
+import os
+import struct
+
+from OpenGL.GL import *
+from typing import Callable
+from os import path
+
+from settings import Settings
+
+# Linked Program Binaries, Keyed by the Preprocessed Sources and the Driver That Built Them
+#   Layout: MAGIC | u32 Binary Format | Driver Binary
+#   Only the Newest Binary per Program Name Is Kept, Edited Shaders Replace Their Old Entry
+class ProgramCache:
+    MAGIC     = b"RCPB"
+    EXTENSION = ".program"
+
+    def __init__(self, directory: str = Settings.Cache.DIRECTORY, enabled: bool = Settings.Cache.ENABLED) -> None:
+        self.directory = directory
+        self.enabled   = enabled
+
+        self.hits   = 0
+        self.misses = 0
+
+        self.driver = None
+
+    def available(self) -> bool:
+        # Drivers May Expose No Binary Formats at All, Then Everything Compiles From Source
+        return self.enabled and glGetIntegerv(GL_NUM_PROGRAM_BINARY_FORMATS) > 0
+
+    def driverString(self) -> bytes:
+        if self.driver is None:
+            self.driver = b"|".join(glGetString(name) or b"" for name in (GL_VENDOR, GL_RENDERER, GL_VERSION, GL_SHADING_LANGUAGE_VERSION))
+
+        return self.driver
+
+    def key(self, sources: list[str]) -> str:
+        digest = hashlib.sha256(self.driverString())
+        for source in sources:
+            digest.update(b"\0")
+            digest.update(source.encode("utf-8"))
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def safeName(name: str) -> str:  return "".join(c if c.isalnum() or c in "-_." else "_" for c in name)
+
+    def entryPath(self, name: str, key: str) -> str:
+        return path.join(self.directory, f"{ProgramCache.safeName(name)}-{key}{ProgramCache.EXTENSION}")
+
+    def load(self, name: str, key: str) -> int | None:
+        entryPath = self.entryPath(name, key)
+        if not path.exists(entryPath):  return None
+
+        try:
+            with open(entryPath, "rb") as f:
+                data = f.read()
+
+            magic, binaryFormat = struct.unpack_from("<4sI", data, 0)
+            if magic != ProgramCache.MAGIC:  raise ValueError("Invalid program binary")
+
+        except (OSError, ValueError, struct.error) as e:
+            print(f"Warning: discarding unreadable program binary '{entryPath}': {e}")
+            self.remove(entryPath)
+            return None
+
+        binary  = data[8:]
+        program = glCreateProgram()
+        glProgramBinary(program, binaryFormat, binary, len(binary))
+
+        # Rejected After a Driver Update the Key Did Not Catch, Rebuild From Source
+        if not glGetProgramiv(program, GL_LINK_STATUS):
+            glDeleteProgram(program)
+            self.remove(entryPath)
+            return None
+
+        return program
+
+    def store(self, name: str, key: str, program: int) -> None:
+        length = int(glGetProgramiv(program, GL_PROGRAM_BINARY_LENGTH))
+        if length == 0:  return
+
+        binaryLength = GLsizei()
+        binaryFormat = GLenum()
+        binary = (ctypes.c_ubyte * length)()
+        glGetProgramBinary(program, length, binaryLength, binaryFormat, binary)
+
+        os.makedirs(self.directory, exist_ok=True)
+
+        # Older Builds of the Same Program Can Never Match Again
+        for entryPath in self.entries(name):  self.remove(entryPath)
+
+        entryPath = self.entryPath(name, key)
+        tempPath  = f"{entryPath}.{os.getpid()}.tmp"
+
+        with open(tempPath, "wb") as f:
+            f.write(struct.pack("<4sI", ProgramCache.MAGIC, binaryFormat.value))
+            f.write(bytes(binary)[:binaryLength.value])
+
+        os.replace(tempPath, entryPath)
+
+    def fetch(self, name: str, sources: list[str], build: Callable[[], int]) -> int:
+        if not self.available():  return build()
+
+        key = self.key(sources)
+
+        program = self.load(name, key)
+        if program is not None:
+            self.hits += 1
+            return program
+
+        self.misses += 1
+        program = build()
+        self.store(name, key, program)
+
+        return program
+
+    def entries(self, name: str | None = None) -> list[str]:
+        if not path.isdir(self.directory):  return []
+
+        # Entry Names Are {name}-{key}, the Key Never Contains a Dash
+        return [
+            path.join(self.directory, filename)
+            for filename in os.listdir(self.directory)
+            if filename.endswith(ProgramCache.EXTENSION)
+            and (name is None or filename[:-len(ProgramCache.EXTENSION)].rsplit("-", 1)[0] == ProgramCache.safeName(name))
+        ]
+
+    def remove(self, entryPath: str) -> None:
+        try:
+            os.remove(entryPath)
+        except OSError:
+            pass
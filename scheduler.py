@@ -0,0 +1,116 @@
+import glfw
+import numpy as np
+import time
+
+from typing import Union
+
+from settings import Settings
+
+number = Union[int, float]
+
+# Paces Frames Against Absolute Deadlines and Hands Out Fixed Simulation Steps
+#   Deadlines Advance by Exactly One Interval, so Late Frames Don't Accumulate Drift,
+#   and Waiting Blocks in glfw.wait_events_timeout so Input Still Wakes the Loop Without Spinning
+class FrameScheduler:
+    HISTORY = 240  # Frame Intervals Kept for the FPS and Jitter Report
+
+    def __init__(
+            self,
+            targetFPS: number = Settings.Screen.FPS,
+            vsync:     bool   = Settings.Screen.VSYNC,
+            timestep:  number = Settings.Simulation.TIMESTEP,
+            maxSteps:  int    = Settings.Simulation.MAX_STEPS
+        ) -> None:
+
+        self.vsync    = vsync
+        self.timestep = timestep
+        self.maxSteps = maxSteps
+
+        # With Vsync the Swap Blocks, Waiting Here Too Would Only Add Latency
+        self.frameInterval = 0.0 if vsync or not targetFPS else 1.0 / targetFPS
+
+        self.deadline    = None
+        self.accumulator = 0.0
+        self.lastStep    = None
+        self.droppedTime = 0.0  # Simulation Seconds Skipped Past maxSteps
+
+        self.lastFrame = None
+        self.intervals = np.full(FrameScheduler.HISTORY, np.nan)
+        self.frames    = 0
+
+    def applySwapInterval(self) -> None:
+        # Needs a Current Context
+        glfw.swap_interval(1 if self.vsync else 0)
+
+    def wait(self) -> None:
+        # Blocks Until the Next Frame Is Due, Processing Window Events Meanwhile
+        if self.frameInterval == 0.0:
+            glfw.poll_events()
+            return
+
+        now = time.perf_counter()
+
+        # More Than a Frame Behind, Start Over From Now Instead of Rendering a Burst
+        if self.deadline is None or now - self.deadline > self.frameInterval:  self.deadline = now
+
+        remaining = self.deadline - now
+        if remaining <= 0.0:  glfw.poll_events()
+        while remaining > 0.0:
+            glfw.wait_events_timeout(remaining)
+            remaining = self.deadline - time.perf_counter()
+
+        self.deadline += self.frameInterval
+
+    def idle(self, timeout: number) -> None:
+        # On Demand Rendering With Nothing to Draw: Sleep Until Input or timeout, Then Pace From Scratch
+        glfw.wait_events_timeout(timeout)
+        self.deadline = None
+
+    def steps(self) -> int:
+        # Simulation Steps Owed Since the Last Call, Each Worth timestep Seconds
+        now = time.perf_counter()
+        if self.lastStep is None:  self.lastStep = now - self.timestep
+
+        self.accumulator += now - self.lastStep
+        self.lastStep = now
+
+        steps = int(self.accumulator // self.timestep)
+        if steps > self.maxSteps:
+            # A Long Stall (Window Drag, Breakpoint) Would Otherwise Fast Forward the Camera
+            self.droppedTime += (steps - self.maxSteps) * self.timestep
+            steps = self.maxSteps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.timestep
+
+        return steps
+
+    def frameDone(self) -> None:
+        # Call After Presenting, Records the Interval Since the Previous Frame
+        now = time.perf_counter()
+        if self.lastFrame is not None:
+            self.intervals[self.frames % FrameScheduler.HISTORY] = now - self.lastFrame
+            self.frames += 1
+
+        self.lastFrame = now
+
+    def resetFrameClock(self) -> None:
+        # Idle Gaps Aren't Frame Intervals, the Next Frame Starts a New One
+        self.lastFrame = None
+
+    @property
+    def stats(self) -> dict:
+        intervals = self.intervals[~np.isnan(self.intervals)] * 1000.0
+        if len(intervals) == 0:  return {"fps": 0.0, "frameMs": 0.0, "jitterMs": 0.0, "worstMs": 0.0, "droppedSimSeconds": self.droppedTime}
+
+        return {
+            "fps":      1000.0 / intervals.mean(),
+            "frameMs":  float(intervals.mean()),
+            "jitterMs": float(intervals.std()),  # Standard Deviation of the Frame Interval
+            "worstMs":  float(intervals.max()),
+            "droppedSimSeconds": self.droppedTime,
+        }
+
+    def summary(self) -> str:
+        stats = self.stats
+        return f"{stats['fps']:.1f} FPS, {stats['frameMs']:.2f} ms/frame, jitter {stats['jitterMs']:.2f} ms, worst {stats['worstMs']:.2f} ms"
@@ -4,13 +4,94 @@ class Settings:
         WIDTH  = 960
         HEIGHT = 540
         FPS    = 60
+        VSYNC  = False  # Let the Swap Pace Frames Instead of the Scheduler
         
         ASPECT_RATIO = WIDTH / HEIGHT
         
+    class Resolution:
+        ADAPTIVE  = False
+        MIN_SCALE = 0.25  # Smallest Fraction of the Window Resolution the Raycast Runs At
+        MAX_STEP  = 0.05  # Largest Scale Change per Frame
+        SMOOTHING = 0.1   # Weight of the Newest Frame Time in the Running Average
+        DEADBAND  = 0.05  # Frame Time Error Tolerated Before the Scale Moves
+        
     class Camera:
         FOV  = 60
         NEAR = 0.1
         FAR  = 100
         
-        SPEED       = 0.01
+        SPEED       = 0.6  # Units per Second
         SENSITIVITY = 50.0
+
+    class Simulation:
+        TIMESTEP  = 1 / 120  # Seconds per Camera and Input Step, Independent of the Frame Rate
+        MAX_STEPS = 8        # Steps per Frame Before Simulation Time Is Dropped Instead of Caught Up
+
+    class BVH:
+        BINS          = 16
+        MAX_LEAF_SIZE = 4
+        STACK_SIZE    = 64  # Must Match BVH_STACK_SIZE in Shaders/common.glsl
+        
+        TOP_LEVEL_LEAF_SIZE = 1  # Instances per Top Level Leaf
+
+    class Query:
+        BATCH_SIZE = 8192  # Rays RayQuery Traverses Together, Bounds the (Ray, Node) Pairs in Flight
+
+    class Renderer:
+        BACKEND      = "GL"     # "GL" (Fragment Pass), "COMPUTE" (Tiled Compute Pass) or "CPU"
+        TILE_BUDGET  = 1 << 18  # Ray/Triangle Pairs per CPU Intersection Batch
+        CLUSTER_SIZE = 64       # Triangles per Bounding Box in the CPU Backend
+        
+        TILE_SIZE = 64  # Screen Tile Edge in Pixels for the Parallel CPU Backend
+        WORKERS   = 0   # Render Processes, 0 Uses Every Core
+        
+        WORKGROUP_SIZE = (8, 8)  # Compute Backend Tile in Pixels, One Invocation per Pixel
+        QUANTIZED      = False   # 16 Bit Positions and Indices, Octahedral Normals and Half UVs in the GPU Buffers
+        TRIANGLE_SOUP  = False   # v0, Edges and Normal per Triangle Instead of Indexed Vertices, Exclusive With QUANTIZED
+        
+        ON_DEMAND    = False  # Skip Frames When Neither the Camera Nor the Scene Changed
+        IDLE_TIMEOUT = 0.1    # Seconds to Wait for Input While Idle
+        
+        SHADER_RELOAD_INTERVAL = 1.0  # Seconds Between Checks for Edited Shader Files, 0 Disables Hot Reloading
+
+    class Buffers:
+        RING_REGIONS = 3     # Frames a Streamed Buffer Can Be Ahead of the GPU
+        PERSISTENT   = True  # Persistently Mapped Rings When glBufferStorage Is Available
+
+    class Streaming:
+        ENABLED       = True
+        WORKERS       = 2        # Asset Loading Threads, 0 Uses Every Core, Kept Low so the Render Loop Keeps the GIL Often Enough
+        UPLOAD_BUDGET = 0.002    # Seconds of Geometry Upload per Frame on the GL Thread
+        CHUNK_BYTES   = 1 << 20  # Largest Single Buffer Write, the Budget Is Checked Between Writes
+
+    class Textures:
+        DECODE_WORKERS = 0          # Image Decoding Threads, 0 Uses Every Core
+        UPLOAD_BUDGET  = 8 << 20    # Texel Bytes Streamed to the GPU per Frame
+        VRAM_BUDGET    = 512 << 20  # Resident Texture Bytes Before Unused Textures Are Evicted
+
+    class Profiler:
+        ENABLED          = False
+        GPU_QUERIES      = True    # GL_TIME_ELAPSED per Phase, Read a Frame Late
+        HISTORY          = 240     # Frames of Rolling Statistics
+        REPORT_INTERVAL  = 1.0     # Seconds Between Printed Summaries
+        MAX_TRACE_EVENTS = 200000  # Trace Events Kept for saveTrace, Later Ones Are Dropped
+
+    class Optimize:
+        ENABLED      = True
+        WELD_EPSILON = 1e-6  # Attribute Difference Below Which Two Vertices Are Welded, 0 Welds Exact Duplicates Only
+        MORTON_BITS  = 10    # Grid Resolution per Axis for the Triangle Sort
+
+    class LOD:
+        ENABLED        = True
+        RATIOS         = (0.5, 0.25, 0.125)  # Triangle Count per Coarser Level, Relative to the Full Mesh
+        MIN_TRIANGLES  = 64                  # No Level Goes Below This
+        MIN_REDUCTION  = 0.9                 # A Level Keeping More Than This Share of the Previous One Ends the Chain
+        BORDER_WEIGHT  = 10.0                # Quadric Weight Holding Open Edges and UV Seams in Place
+        MIN_NORMAL_DOT = 0.2                 # Collapses Turning a Face Further Than This Are Skipped
+        DETAIL_SIZE    = 0.25                # Projected Radius, as a Share of Half the Screen Height, Drawn at Full Detail
+                                             # Every Halving Below It Drops One Level
+
+    class Cache:
+        ENABLED   = True
+        DIRECTORY = ".cache"
+        MAX_BYTES = 1 << 30  # Least Recently Used Entries Are Evicted Past This
@@ -1,14 +1,101 @@
 import numpy as np
+import os
+import re
 from OpenGL.GL import *
-from OpenGL.GL.shaders import compileShader, compileProgram
 from os import path as ospath
 
+from programcache import ProgramCache
+
 class Shader:
-    def __init__(self, vertexPath: str, fragmentPath: str) -> None:
-        vertexSource = self.loadShaderSource(vertexPath)
-        fragmentSource = self.loadShaderSource(fragmentPath)
+    def __init__(self, vertexPath: str, fragmentPath: str, cache: ProgramCache | None = None, defines: dict | None = None) -> None:
+        vertexSource,   vertexFiles   = Shader.preprocess(vertexPath)
+        fragmentSource, fragmentFiles = Shader.preprocess(fragmentPath)
+        fragmentSource = Shader.addDefines(fragmentSource, defines or {})
+
+        self.trackDependencies(vertexFiles + fragmentFiles)
+
+        if cache is None:  cache = ProgramCache()
+
+        self.program = cache.fetch(
+            Shader.programName([vertexPath, fragmentPath], defines),
+            [vertexSource, fragmentSource],
+            lambda: Shader.compileProgramWithLog(vertexSource, fragmentSource, vertexFiles, fragmentFiles)
+        )
+
+        # Resolved Once at Link Time, name -> (location, GL type)
+        self.uniforms = Shader.getActiveUniforms(self.program)
+
+    def trackDependencies(self, files: list[str]) -> None:
+        # Every File the Program Was Built From, With the mtime It Had
+        self.dependencies = {filename: os.stat(filename).st_mtime for filename in dict.fromkeys(files)}
+
+    def isStale(self) -> bool:
+        # True Once Any Source or Include Changed on Disk, for Hot Reloading
+        for filename, mtime in self.dependencies.items():
+            try:
+                if os.stat(filename).st_mtime != mtime:  return True
+            except OSError:
+                return True
+
+        return False
 
-        self.program = Shader.compileProgramWithLog(vertexSource, fragmentSource)
+    @staticmethod
+    def programName(paths: list[str], defines: dict | None) -> str:
+        # Defines Are Part of the Name, Each Variant Keeps Its Own Cached Binary
+        return "-".join(["+".join(ospath.basename(path) for path in paths)] + [f"{key}={value}" for key, value in (defines or {}).items()])
+
+    @staticmethod
+    def addDefines(source: str, defines: dict) -> str:
+        # Right After #version, Which Has to Stay the First Line, Then Line Numbers Resume at 2 of File 0
+        if not defines:  return source
+
+        version, _, body = source.partition("\n")
+        return version + "\n" + "".join(f"#define {name} {value}\n" for name, value in defines.items()) + "#line 2 0\n" + body
+
+    @staticmethod
+    def getActiveUniforms(shaderProgram) -> dict[str, tuple[int, int]]:
+        uniforms = {}
+
+        for index in range(glGetProgramiv(shaderProgram, GL_ACTIVE_UNIFORMS)):
+            name, size, uniformType = glGetActiveUniform(shaderProgram, index)
+            name = name.decode() if isinstance(name, bytes) else name
+            name = name.split("[")[0]
+
+            # Uniform Block Members Have No Location, They Live in Buffers
+            location = glGetUniformLocation(shaderProgram, name)
+            if location != -1:  uniforms[name] = (location, uniformType)
+
+        return uniforms
+
+    def setUniform(self, name, value) -> None:
+        # Inactive Uniforms Were Optimized Out by the Compiler, Setting Them Is a No-Op
+        uniform = self.uniforms.get(name)
+        if uniform is None:  return
+
+        location, uniformType = uniform
+        Shader.UNIFORM_SETTERS.get(uniformType, Shader.setInt)(location, value)
+
+    @staticmethod
+    def setInt(location, value)   -> None:  glUniform1i(location, int(value))
+    @staticmethod
+    def setFloat(location, value) -> None:  glUniform1f(location, float(value))
+    @staticmethod
+    def setVec2(location, value)  -> None:  glUniform2f(location, *value)
+    @staticmethod
+    def setVec3(location, value)  -> None:  glUniform3f(location, *value)
+    @staticmethod
+    def setVec4(location, value)  -> None:  glUniform4f(location, *value)
+    @staticmethod
+    def setMat4(location, value)  -> None:  glUniformMatrix4fv(location, 1, GL_FALSE, np.asarray(value, dtype=np.float32))  # Column Major
+
+    # Any Other Type (int, bool, Samplers) Goes Through setInt
+    UNIFORM_SETTERS = {
+        GL_FLOAT:      setFloat,
+        GL_FLOAT_VEC2: setVec2,
+        GL_FLOAT_VEC3: setVec3,
+        GL_FLOAT_VEC4: setVec4,
+        GL_FLOAT_MAT4: setMat4,
+    }
 
     @staticmethod
     def createUniform(shaderProgram, name, value, warnings=False):
@@ -37,43 +124,97 @@ class Shader:
             print(f"Unsupported uniform type for '{name}': {type(value)}")
 
     @staticmethod
-    def loadShaderSource(path):
-        dirPath = ospath.dirname(path)
-        with open(path, 'r') as file:
-            lines = file.readlines()
+    def preprocess(path: str) -> tuple[str, list[str]]:
+        # Expands #include Once per File, Returns the Source and the Files Behind Each #line Source Number
+        files: list[str] = []
+        lines: list[str] = []
+        Shader.expandIncludes(ospath.normpath(path), files, lines)
 
-        processedSource = ""
-        for line in lines:
-            if line.strip().startswith("#include"):
-                includeFile = line.strip().split()[1].replace('"', '')
-                includeFilePath = ospath.join(dirPath, includeFile)
-                processedSource += Shader.loadShaderSource(includeFilePath) + '\n'
-            else:
-                processedSource += line
+        return "".join(lines), files
+
+    @staticmethod
+    def expandIncludes(path: str, files: list[str], lines: list[str]) -> None:
+        fileIndex = len(files)
+        files.append(path)
+
+        with open(path, "r") as file:
+            source = file.readlines()
 
-        return processedSource
+        for lineNumber, line in enumerate(source, 1):
+            stripped = line.strip()
+            if not stripped.startswith("#include"):
+                lines.append(line if line.endswith("\n") else line + "\n")
+                continue
+
+            includePath = ospath.normpath(ospath.join(ospath.dirname(path), stripped.split()[1].strip('"<>')))
+
+            # Include Guard: Anything Already Expanded (Including Cycles) Is Skipped
+            if includePath not in files:
+                lines.append(f"#line 1 {len(files)}\n")
+                Shader.expandIncludes(includePath, files, lines)
+
+            lines.append(f"#line {lineNumber + 1} {fileIndex}\n")
 
     @staticmethod
-    def compileShaderWithLog(source, shaderType):
-        try:
-            shader = compileShader(source, shaderType)
-        except RuntimeError as e:
-            print(f"Shader compile failed:\n{e}")
-            raise
+    def loadShaderSource(path) -> str:  return Shader.preprocess(path)[0]
+
+    # "0:12(3): error" (Mesa) or "0(12) : error" (NVIDIA), the Leading Number Is the #line Source Number
+    LOG_LOCATION = re.compile(r"^(\d+)([:(])(\d+)", re.MULTILINE)
+
+    @staticmethod
+    def mapLog(log: str, files: list[str] | None) -> str:
+        if not files:  return log
+
+        def replace(match: re.Match) -> str:
+            fileIndex = int(match.group(1))
+            if fileIndex >= len(files):  return match.group(0)
+            return f"{files[fileIndex]}{match.group(2)}{match.group(3)}"
+
+        return Shader.LOG_LOCATION.sub(replace, log)
+
+    @staticmethod
+    def compileShaderWithLog(source, shaderType, files: list[str] | None = None):
+        shader = glCreateShader(shaderType)
+        glShaderSource(shader, source)
+        glCompileShader(shader)
+
+        if not glGetShaderiv(shader, GL_COMPILE_STATUS):
+            log = glGetShaderInfoLog(shader)
+            log = Shader.mapLog(log.decode() if isinstance(log, bytes) else log, files)
+            glDeleteShader(shader)
+
+            print(f"Shader compile failed:\n{log}")
+            raise RuntimeError(f"Shader compile failed: {log}")
         
         return shader
 
     @staticmethod
-    def compileProgramWithLog(vertexSource, fragmentSource):
-        vertexShader = Shader.compileShaderWithLog(vertexSource, GL_VERTEX_SHADER)
-        fragmentShader = Shader.compileShaderWithLog(fragmentSource, GL_FRAGMENT_SHADER)
+    def linkProgram(*shaders) -> int:
+        program = glCreateProgram()
+        for shader in shaders:  glAttachShader(program, shader)
+
+        # Lets ProgramCache Read the Linked Binary Back
+        glProgramParameteri(program, GL_PROGRAM_BINARY_RETRIEVABLE_HINT, GL_TRUE)
+        glLinkProgram(program)
+
+        for shader in shaders:
+            glDetachShader(program, shader)
+            glDeleteShader(shader)
+
+        if not glGetProgramiv(program, GL_LINK_STATUS):
+            log = glGetProgramInfoLog(program)
+            print("Program link failed:\n" + (log.decode() if isinstance(log, bytes) else log))
+            glDeleteProgram(program)
+            raise RuntimeError("Shader link failed")
+
+        return program
+
+    @staticmethod
+    def compileProgramWithLog(vertexSource, fragmentSource, vertexFiles: list[str] | None = None, fragmentFiles: list[str] | None = None):
+        vertexShader = Shader.compileShaderWithLog(vertexSource, GL_VERTEX_SHADER, vertexFiles)
+        fragmentShader = Shader.compileShaderWithLog(fragmentSource, GL_FRAGMENT_SHADER, fragmentFiles)
         try:
-            program = compileProgram(vertexShader, fragmentShader)
-            
-            linkStatus = glGetProgramiv(program, GL_LINK_STATUS)
-            if not linkStatus:
-                print("Program link failed:\n" + glGetProgramInfoLog(program).decode())
-                raise RuntimeError("Shader link failed")
+            program = Shader.linkProgram(vertexShader, fragmentShader)
 
             glValidateProgram(program)
             validateStatus = glGetProgramiv(program, GL_VALIDATE_STATUS)
@@ -85,3 +226,30 @@ class Shader:
         
         except Exception as e:
             raise RuntimeError(f"Error compiling/linking shader program: {e}")
+
+class ComputeShader(Shader):
+    def __init__(self, computePath: str, defines: dict | None = None, cache: ProgramCache | None = None) -> None:
+        computeSource, computeFiles = Shader.preprocess(computePath)
+        computeSource = Shader.addDefines(computeSource, defines or {})
+
+        self.trackDependencies(computeFiles)
+
+        if cache is None:  cache = ProgramCache()
+
+        self.program = cache.fetch(Shader.programName([computePath], defines), [computeSource], lambda: ComputeShader.compileComputeWithLog(computeSource, computeFiles))
+
+        self.uniforms = Shader.getActiveUniforms(self.program)
+
+        # As Compiled, PyOpenGL Assumes One Value so the Output Array Is Passed Explicitly
+        workgroupSize = np.zeros(3, dtype=np.int32)
+        glGetProgramiv(self.program, GL_COMPUTE_WORK_GROUP_SIZE, workgroupSize)
+        self.workgroupSize = tuple(int(size) for size in workgroupSize)
+
+    @staticmethod
+    def compileComputeWithLog(computeSource, computeFiles: list[str] | None = None):
+        computeShader = Shader.compileShaderWithLog(computeSource, GL_COMPUTE_SHADER, computeFiles)
+        try:
+            return Shader.linkProgram(computeShader)
+        
+        except Exception as e:
+            raise RuntimeError(f"Error compiling/linking compute program: {e}")
@@ -0,0 +1,6 @@
+import sys
+from os import path
+
+# Modules Import Each Other From the Repository Root, the Same as When main.py Runs There
+ROOT = path.dirname(path.dirname(path.abspath(__file__)))
+if ROOT not in sys.path:  sys.path.insert(0, ROOT)
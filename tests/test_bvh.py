@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from os import path
+
+from Acceleration.bvh import BVH
+from MeshLoaders.cache import MeshCache
+from mesh import Mesh
+from settings import Settings
+
+MESHES = path.join(path.dirname(path.dirname(path.abspath(__file__))), "Meshes")
+
+def randomRays(boundsMin: np.ndarray, boundsMax: np.ndarray, count: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    # Origins Around and Inside the Box, Aimed at Points Inside It so Most Rays Reach Geometry
+    rng = np.random.default_rng(seed)
+    margin = (boundsMax - boundsMin) * 0.5
+
+    origins = rng.uniform(boundsMin - margin, boundsMax + margin, (count, 3)).astype(np.float32)
+    targets = rng.uniform(boundsMin, boundsMax, (count, 3)).astype(np.float32)
+
+    directions = targets - origins
+    directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+    return origins, directions
+
+def loadMesh(name: str) -> Mesh:
+    return Mesh.create(path.join(MESHES, name), MeshCache(enabled=False))
+
+@pytest.mark.parametrize("name", ["monkey.glb", "teapot.glb"])
+def testTraversalMatchesBruteForce(name: str) -> None:
+    mesh = loadMesh(name)
+    bvh  = BVH(mesh.vertices, mesh.indices)
+
+    origins, directions = randomRays(mesh.vertices.min(axis=0), mesh.vertices.max(axis=0), 500, seed=3)
+    assert bvh.verify(mesh.vertices, mesh.indices, origins, directions) == 0
+
+def testTraversalRespectsMaxDistance() -> None:
+    mesh = loadMesh("monkey.glb")
+    bvh  = BVH(mesh.vertices, mesh.indices)
+
+    origins, directions = randomRays(mesh.vertices.min(axis=0), mesh.vertices.max(axis=0), 300, seed=5)
+    assert bvh.verify(mesh.vertices, mesh.indices, origins, directions, tMax=1.0) == 0
+
+def testCachedArraysTraverseTheSame() -> None:
+    mesh = loadMesh("monkey.glb")
+    bvh  = BVH.fromArrays(BVH(mesh.vertices, mesh.indices).toArrays())
+
+    origins, directions = randomRays(mesh.vertices.min(axis=0), mesh.vertices.max(axis=0), 200, seed=7)
+    assert bvh.verify(mesh.vertices, mesh.indices, origins, directions) == 0
+
+@pytest.mark.parametrize("name", ["monkey.glb", "teapot.glb"])
+def testDepthFitsTheShaderStack(name: str) -> None:
+    mesh = loadMesh(name)
+    assert BVH(mesh.vertices, mesh.indices).maxDepth < Settings.BVH.STACK_SIZE
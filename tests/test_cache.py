@@ -0,0 +1,72 @@
+import numpy as np
+import os
+
+from concurrent.futures import ThreadPoolExecutor
+
+from MeshLoaders.cache import MeshCache
+
+def storeEntries(cache: MeshCache, *filenames: str) -> None:
+    for filename in filenames:
+        for name in ("mesh", "bvh"):  cache.fetch(cache.key(filename), name, lambda: {"values": np.arange(4)})
+
+def writeAsset(filename, content: bytes) -> str:
+    filename.write_bytes(content)
+    return str(filename)
+
+def testInvalidateDropsOnlyTheGivenAsset(tmp_path) -> None:
+    cache = MeshCache(directory=str(tmp_path / "cache"))
+    a, b  = writeAsset(tmp_path / "a.glb", b"a"), writeAsset(tmp_path / "b.glb", b"b")
+    storeEntries(cache, a, b)
+
+    cache.invalidate(a)
+    assert len(cache.entries()) == 2
+    assert cache.load(cache.key(b), "mesh") is not None
+
+def testInvalidateMatchesEditedAndDeletedAssets(tmp_path) -> None:
+    cache = MeshCache(directory=str(tmp_path / "cache"))
+    a, b  = writeAsset(tmp_path / "a.glb", b"a"), writeAsset(tmp_path / "b.glb", b"b")
+    storeEntries(cache, a, b)
+
+    writeAsset(tmp_path / "a.glb", b"edited")
+    (tmp_path / "b.glb").unlink()
+
+    MeshCache(directory=cache.directory).invalidate(a, b)
+    assert cache.entries() == []
+
+def testDisabledCacheNeverInvalidates(tmp_path) -> None:
+    cache = MeshCache(directory=str(tmp_path / "cache"))
+    storeEntries(cache, writeAsset(tmp_path / "a.glb", b"a"))
+
+    MeshCache(directory=cache.directory, enabled=False).invalidate()
+    assert len(cache.entries()) == 2
+
+def testStaleEntriesArePrunedOnStore(tmp_path) -> None:
+    cache = MeshCache(directory=str(tmp_path / "cache"))
+    a = writeAsset(tmp_path / "a.glb", b"a")
+    storeEntries(cache, a)
+
+    writeAsset(tmp_path / "a.glb", b"edited")
+    cache = MeshCache(directory=cache.directory)
+    cache.fetch(cache.key(a), "mesh", lambda: {"values": np.arange(5)})
+
+    assert len(cache.entries()) == 1
+    assert len(cache.load(cache.key(a), "mesh")["values"]) == 5
+
+def testEntriesSkipFilesRemovedAfterListing(tmp_path, monkeypatch) -> None:
+    cache = MeshCache(directory=str(tmp_path / "cache"))
+    storeEntries(cache, writeAsset(tmp_path / "a.glb", b"a"))
+
+    listdir = os.listdir
+    monkeypatch.setattr(os, "listdir", lambda directory: listdir(directory) + ["removed" + MeshCache.EXTENSION])
+
+    assert len(cache.entries()) == 2
+
+def testConcurrentStoresSurviveEviction(tmp_path) -> None:
+    # Loader Threads Storing and Evicting Side by Side Under a Cap That Keeps Removing Entries
+    cache  = MeshCache(directory=str(tmp_path / "cache"), maxBytes=2048)
+    assets = [writeAsset(tmp_path / f"{i}.glb", bytes([i])) for i in range(16)]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda asset: storeEntries(cache, asset), assets))
+
+    assert cache.size <= cache.maxBytes
@@ -0,0 +1,151 @@
+import json
+import numpy as np
+import pytest
+import struct
+
+from MeshLoaders.glb import GLB
+from mesh import Mesh
+
+COMPONENT_TYPES = {dtype: componentType for componentType, dtype in GLB.COMPONENT_TYPES.items()}
+ACCESSOR_TYPES  = {count: typeString for typeString, count in GLB.COMPONENT_COUNTS.items()}
+
+def writeGLB(filename, binary: bytes, bufferViews: list[dict], accessors: list[dict], attributes: dict[str, int], indices: int | None = None) -> str:
+    # Single Mesh, Single Primitive, Chunks Padded to 4 Bytes as the Spec Asks
+    primitive = {"attributes": attributes}
+    if indices is not None:  primitive["indices"] = indices
+
+    document = {
+        "asset":       {"version": "2.0"},
+        "buffers":     [{"byteLength": len(binary)}],
+        "bufferViews": bufferViews,
+        "accessors":   accessors,
+        "meshes":      [{"primitives": [primitive]}],
+    }
+
+    jsonBytes = json.dumps(document).encode("utf-8")
+    jsonBytes += b" " * (-len(jsonBytes) % 4)
+    binary    += b"\0" * (-len(binary) % 4)
+
+    content  = struct.pack("<4sII", b"glTF", 2, 12 + 8 + len(jsonBytes) + 8 + len(binary))
+    content += struct.pack("<I4s", len(jsonBytes), b"JSON") + jsonBytes
+    content += struct.pack("<I4s", len(binary), b"BIN\0") + binary
+
+    filename.write_bytes(content)
+    return str(filename)
+
+def packedGLB(filename, attributes: dict[str, np.ndarray], indices: np.ndarray | None = None, normalized: tuple[str, ...] = ()) -> str:
+    # Every Array in Its Own Tightly Packed View
+    binary, bufferViews, accessors, slots = b"", [], [], {}
+    for name, array in list(attributes.items()) + ([("indices", indices)] if indices is not None else []):
+        array = np.ascontiguousarray(array)
+        binary += b"\0" * (-len(binary) % 4)
+
+        bufferViews.append({"buffer": 0, "byteOffset": len(binary), "byteLength": array.nbytes})
+        accessors.append({
+            "bufferView":    len(bufferViews) - 1,
+            "componentType": COMPONENT_TYPES[array.dtype.newbyteorder("<")],
+            "count":         len(array),
+            "type":          ACCESSOR_TYPES[array.shape[1] if array.ndim == 2 else 1],
+            "normalized":    name in normalized,
+        })
+
+        binary += array.tobytes()
+        slots[name] = len(accessors) - 1
+
+    return writeGLB(filename, binary, bufferViews, accessors, {name: slots[name] for name in attributes}, slots.get("indices"))
+
+def triangles(count: int) -> np.ndarray:
+    # Separate Unit Triangles Side by Side in z = 0
+    corners = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], dtype=np.float32)
+    return np.concatenate([corners + [2.0 * i, 0.0, 0.0] for i in range(count)]).astype(np.float32)
+
+def testDecodeWithoutIndices(tmp_path) -> None:
+    # Non Indexed Primitives Draw Every Three Vertices as a Triangle
+    positions = triangles(3)
+    filename  = packedGLB(tmp_path / "soup.glb", {"POSITION": positions})
+
+    arrays = Mesh.decode(filename, optimize=False, lod=False)
+    assert np.array_equal(arrays["indices"], np.arange(9, dtype=np.uint32))
+    assert np.array_equal(arrays["vertices"], positions)
+
+    optimized = Mesh.decode(filename)
+    assert len(optimized["indices"]) == 9
+
+def testIndexComponentTypes(tmp_path) -> None:
+    positions = triangles(2)
+    for dtype in ("<u1", "<u2", "<u4"):
+        indices  = np.array([0, 1, 2, 3, 4, 5, 5, 4, 3], dtype=dtype)
+        filename = packedGLB(tmp_path / f"indices-{dtype[1:]}.glb", {"POSITION": positions}, indices)
+
+        loaded, loadedIndices, normals, uvs, texture = GLB.load(filename)
+        assert loadedIndices.dtype == np.dtype(dtype) and np.array_equal(loadedIndices, indices)
+        assert np.array_equal(loaded, positions) and normals is None and uvs is None and texture is None
+
+def testSignedIndicesAreRejected(tmp_path) -> None:
+    filename = packedGLB(tmp_path / "signed.glb", {"POSITION": triangles(1)}, np.array([0, 1, 2], dtype="<i2"))
+
+    with pytest.raises(NotImplementedError):  GLB.load(filename)
+
+def testMissingIndicesLoadAsNone(tmp_path) -> None:
+    _, indices, _, _, _ = GLB.load(packedGLB(tmp_path / "soup.glb", {"POSITION": triangles(2)}))
+    assert indices is None
+
+@pytest.mark.parametrize("dtype", ["<i1", "<u1", "<i2", "<u2"])
+def testNormalizedIntegersScale(tmp_path, dtype: str) -> None:
+    info = np.iinfo(np.dtype(dtype))
+    uvs  = np.array([[info.min, info.max], [0, info.max // 2], [info.min + 1, 1]], dtype=dtype)
+
+    filename = packedGLB(tmp_path / "normalized.glb", {"POSITION": triangles(1), "TEXCOORD_0": uvs}, normalized=("TEXCOORD_0",))
+    _, _, _, loaded, _ = GLB.load(filename)
+
+    # c / MAX, Clamped at -1 so Both the Minimum and Minimum + 1 of a Signed Type Map to -1
+    expected = np.maximum(uvs.astype(np.float32) / np.float32(info.max), -1.0)
+    assert loaded.dtype == np.float32 and np.allclose(loaded, expected)
+    assert loaded.min() >= -1.0 and loaded.max() == 1.0
+
+def testUnnormalizedIntegersKeepTheirValues(tmp_path) -> None:
+    uvs = np.array([[0, 1], [2, 3], [4, 5]], dtype="<u2")
+
+    _, _, _, loaded, _ = GLB.load(packedGLB(tmp_path / "integers.glb", {"POSITION": triangles(1), "TEXCOORD_0": uvs}))
+    assert loaded.dtype == np.uint16 and np.array_equal(loaded, uvs)
+
+def testInterleavedViewWithByteStride(tmp_path) -> None:
+    # Position and Normalized UV Side by Side in One View, Each Vertex Padded to 20 Bytes
+    vertex = np.dtype({"names": ["position", "uv"], "formats": [("<f4", 3), ("<u2", 2)], "offsets": [0, 12], "itemsize": 20})
+
+    records = np.zeros(6, dtype=vertex)
+    records["position"] = triangles(2)
+    records["uv"]       = np.arange(12, dtype=np.uint16).reshape(6, 2) * 5000
+
+    accessors = [
+        {"bufferView": 0, "byteOffset": 0,  "componentType": 5126, "count": 6, "type": "VEC3"},
+        {"bufferView": 0, "byteOffset": 12, "componentType": 5123, "count": 6, "type": "VEC2", "normalized": True},
+    ]
+    bufferViews = [{"buffer": 0, "byteOffset": 0, "byteLength": records.nbytes, "byteStride": vertex.itemsize}]
+
+    filename = writeGLB(tmp_path / "interleaved.glb", records.tobytes(), bufferViews, accessors, {"POSITION": 0, "TEXCOORD_0": 1})
+    positions, _, _, uvs, _ = GLB.load(filename)
+
+    assert np.array_equal(positions, records["position"])
+    assert np.allclose(uvs, records["uv"] / 65535.0)
+
+def testAccessorWithoutBufferViewIsZeros(tmp_path) -> None:
+    positions = triangles(1)
+    accessors = [
+        {"bufferView": 0, "componentType": 5126, "count": 3, "type": "VEC3"},
+        {"componentType": 5126, "count": 3, "type": "VEC3"},
+    ]
+    bufferViews = [{"buffer": 0, "byteOffset": 0, "byteLength": positions.nbytes}]
+
+    filename = writeGLB(tmp_path / "zeros.glb", positions.tobytes(), bufferViews, accessors, {"POSITION": 0, "NORMAL": 1})
+    _, _, normals, _, _ = GLB.load(filename)
+
+    assert normals.shape == (3, 3) and not normals.any()
+
+def testSparseAccessorsAreRejected(tmp_path) -> None:
+    positions = triangles(1)
+    accessors = [{"bufferView": 0, "componentType": 5126, "count": 3, "type": "VEC3", "sparse": {"count": 0}}]
+    bufferViews = [{"buffer": 0, "byteOffset": 0, "byteLength": positions.nbytes}]
+
+    filename = writeGLB(tmp_path / "sparse.glb", positions.tobytes(), bufferViews, accessors, {"POSITION": 0})
+    with pytest.raises(NotImplementedError):  GLB.load(filename)
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+from os import path
+
+from MeshLoaders.cache    import MeshCache
+from MeshLoaders.optimize import MeshOptimizer
+from mesh import Mesh
+from settings import Settings
+
+MESHES = path.join(path.dirname(path.dirname(path.abspath(__file__))), "Meshes")
+
+def unweldedArrays(name: str) -> tuple[Mesh, dict[str, np.ndarray]]:
+    # Every Triangle Corner Its Own Vertex, as Some Exporters Write Them
+    mesh    = Mesh.create(path.join(MESHES, name), MeshCache(enabled=False), optimize=False, lod=False)
+    corners = mesh.indices.astype(np.int64)
+
+    arrays = {"vertices": mesh.vertices[corners], "indices": np.arange(len(corners), dtype=np.uint32)}
+    if mesh.normals is not None:  arrays["normals"] = mesh.normals[corners]
+    if mesh.uvs     is not None:  arrays["uvs"]     = mesh.uvs[corners]
+
+    return mesh, arrays
+
+def triangleRows(indices: np.ndarray, *attributes: np.ndarray) -> np.ndarray:
+    # One Row of Corner Attributes per Triangle, in a Fixed Order so Two Meshes Compare as Sets
+    corners = np.concatenate([attribute.reshape(len(attribute), -1) for attribute in attributes], axis=1)
+    rows    = corners[np.asarray(indices, dtype=np.int64).reshape(-1, 3)].reshape(-1, 3 * corners.shape[1])
+
+    return rows[np.lexsort(rows.T[::-1])]
+
+@pytest.mark.parametrize("name", ["monkey.glb", "teapot.glb"])
+def testWeldKeepsTriangles(name: str) -> None:
+    mesh, arrays = unweldedArrays(name)
+    remap, kept = MeshOptimizer.weld(arrays["vertices"], arrays.get("normals"), arrays.get("uvs"), Settings.Optimize.WELD_EPSILON)
+
+    assert len(kept) <= len(mesh.vertices) < len(arrays["vertices"])
+
+    welded = arrays["vertices"][kept][remap[arrays["indices"]]]
+    assert np.allclose(welded, arrays["vertices"], atol=Settings.Optimize.WELD_EPSILON)
+
+def testDropDegenerateRemovesOnlyCollapsedTriangles() -> None:
+    indices    = np.array([0, 1, 2,  3, 3, 4,  2, 1, 3,  5, 6, 5,  7, 8, 8,  4, 5, 6], dtype=np.int64)
+    remaining  = MeshOptimizer.dropDegenerate(indices)
+
+    assert np.array_equal(remaining, [0, 1, 2,  2, 1, 3,  4, 5, 6])
+
+@pytest.mark.parametrize("name", ["monkey.glb", "teapot.glb"])
+def testFirstUseOrderKeepsTriangles(name: str) -> None:
+    mesh = Mesh.create(path.join(MESHES, name), MeshCache(enabled=False), optimize=False, lod=False)
+
+    # Reversed Triangles Reach Their Vertices in a Different Order Than They Are Stored
+    indices = mesh.indices.astype(np.int64).reshape(-1, 3)[::-1].reshape(-1)
+    order, renumbered = MeshOptimizer.firstUseOrder(indices)
+
+    assert np.array_equal(mesh.vertices[order][renumbered], mesh.vertices[indices])
+
+    _, firstUse = np.unique(renumbered, return_index=True)
+    assert np.all(np.diff(firstUse) > 0) and len(order) == len(np.unique(indices))
+
+@pytest.mark.parametrize("name", ["monkey.glb", "teapot.glb"])
+def testOptimizeKeepsTrianglesWithFewerVertices(name: str) -> None:
+    mesh, arrays = unweldedArrays(name)
+    optimized, stats = MeshOptimizer.optimize(arrays)
+
+    assert len(optimized["vertices"]) <= len(mesh.vertices) < len(arrays["vertices"])
+    assert stats["after"]["vertices"] == len(optimized["vertices"]) and stats["before"]["vertices"] == len(arrays["vertices"])
+
+    # Same Triangles, Each Corner Still Carrying Its Own Normal and UV
+    names = [attribute for attribute in ("vertices", "normals", "uvs") if attribute in arrays]
+    expected = triangleRows(arrays["indices"], *(arrays[attribute] for attribute in names))
+    actual   = triangleRows(optimized["indices"], *(optimized[attribute] for attribute in names))
+
+    assert np.allclose(actual, expected, atol=Settings.Optimize.WELD_EPSILON)
@@ -0,0 +1,65 @@
+import numpy as np
+
+from Acceleration.intersect import Intersection
+from Acceleration.query     import RayQuery
+from Acceleration.twolevel  import TwoLevelBVH
+from Buffers.packer import ScenePacker
+
+from test_twolevel import instancedScene, randomRays
+
+def testBatchMatchesBruteForce() -> None:
+    accel = instancedScene()
+    origins, directions = randomRays(accel, 3000, seed=17)
+
+    hits = RayQuery(accel).raycast(origins, directions)
+
+    vertices, indices = accel.bake()
+    v0, edge1, edge2 = Intersection.triangleEdges(vertices, indices)
+    bruteT, bruteTriangle = Intersection.nearest(origins, directions, v0, edge1, edge2)
+
+    hit = hits.hit
+    assert np.array_equal(hit, bruteTriangle >= 0)
+    assert np.allclose(hits.distance[hit], bruteT[hit], rtol=1e-4, atol=1e-5)
+
+    # Baked Triangles Run Instance by Instance in Each Mesh's Own Index Order
+    counts  = np.array([accel.scene.rangeOf(instance.mesh).triangleCount for instance in accel.instances])
+    offsets = np.concatenate(([0], np.cumsum(counts)))
+    bakedInstance = np.searchsorted(offsets, bruteTriangle[hit], side="right") - 1
+
+    assert np.array_equal(hits.instance[hit], bakedInstance)
+    assert np.array_equal(hits.triangle[hit], bruteTriangle[hit] - offsets[bakedInstance])
+
+def testSingleRayMatchesBatch() -> None:
+    accel = instancedScene()
+    origins, directions = randomRays(accel, 200, seed=19)
+
+    query = RayQuery(accel)
+    hits  = query.raycast(origins, directions)
+
+    for i in range(len(origins)):
+        single = query.raycast(origins[i], directions[i])
+        assert single.instance[0] == hits.instance[i] and single.triangle[0] == hits.triangle[i]
+
+def testBarycentricsRebuildTheHitPoint() -> None:
+    accel = instancedScene()
+    origins, directions = randomRays(accel, 500, seed=23)
+
+    hits = RayQuery(accel).raycast(origins, directions)
+    hit  = hits.hit
+
+    corners = []
+    for instance, triangle in zip(hits.instance[hit], hits.triangle[hit]):
+        mesh  = accel.instances[instance].mesh
+        local = mesh.vertices[mesh.indices.reshape(-1, 3)[triangle]]
+        world = np.c_[local, np.ones(3)] @ np.array(accel.instances[instance].transform, dtype=np.float32).T
+        corners.append(world[:, :3])
+
+    rebuilt = np.einsum("nk,nki->ni", hits.barycentrics[hit], np.array(corners))
+    assert np.allclose(rebuilt, hits.points(origins, directions)[hit], atol=1e-3)
+    assert np.allclose(np.linalg.norm(hits.normal[hit], axis=1), 1.0, atol=1e-5)
+
+def testEmptySceneMissesEveryRay() -> None:
+    accel = TwoLevelBVH(ScenePacker([]))
+
+    hits = RayQuery(accel).raycast(np.zeros(3), np.eye(3))
+    assert not hits.hit.any() and np.all(np.isinf(hits.distance))
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from os import path
+
+from MeshLoaders.cache    import MeshCache
+from MeshLoaders.simplify import MeshSimplifier
+from mesh import Mesh
+from settings import Settings
+
+MESHES = path.join(path.dirname(path.dirname(path.abspath(__file__))), "Meshes")
+
+def loadMesh(name: str) -> Mesh:
+    return Mesh.create(path.join(MESHES, name), MeshCache(enabled=False), lod=False)
+
+@pytest.mark.parametrize("name", ["monkey.glb", "teapot.glb"])
+def testLevelsGetCoarser(name: str) -> None:
+    mesh   = loadMesh(name)
+    levels = MeshSimplifier.levels(mesh.vertices, mesh.indices)
+    assert levels
+
+    counts = [len(mesh.indices) // 3] + [len(level) // 3 for level in levels]
+    for previous, current in zip(counts, counts[1:]):
+        assert current <= previous * Settings.LOD.MIN_REDUCTION
+
+    # Every Level Indexes the Original Vertex Array and Keeps No Collapsed Triangle
+    for level in levels:
+        triangles = level.reshape(-1, 3)
+        assert level.max() < len(mesh.vertices)
+        assert np.all((triangles[:, 0] != triangles[:, 1]) & (triangles[:, 1] != triangles[:, 2]) & (triangles[:, 0] != triangles[:, 2]))
+
+@pytest.mark.parametrize("name", ["monkey.glb", "teapot.glb"])
+def testLevelsStopAtMinTriangles(name: str) -> None:
+    mesh = loadMesh(name)
+    minTriangles = 200
+
+    # The Last Ratio Alone Would Ask for Fewer Than minTriangles
+    levels = MeshSimplifier.levels(mesh.vertices, mesh.indices, (0.5, 0.1, 0.01), minTriangles)
+    assert levels and all(len(level) // 3 >= minTriangles for level in levels)
+
+    defaults = MeshSimplifier.levels(mesh.vertices, mesh.indices)
+    assert all(len(level) // 3 >= Settings.LOD.MIN_TRIANGLES for level in defaults)
+
+@pytest.mark.parametrize("name", ["monkey.glb", "teapot.glb"])
+def testCollapsesNeverFlipFaces(name: str, monkeypatch) -> None:
+    # Applies Each Pass's Accepted Collapses and Checks No Surviving Triangle Turned Further Than MIN_NORMAL_DOT
+    mesh = loadMesh(name)
+    rejectFlips = MeshSimplifier.rejectFlips
+    turns = []
+
+    def checkedRejectFlips(vertices: np.ndarray, triangles: np.ndarray, keep: np.ndarray, remove: np.ndarray, chosen: np.ndarray) -> np.ndarray:
+        accepted = rejectFlips(vertices, triangles, keep, remove, chosen)
+        applied  = np.isin(chosen, accepted)
+
+        remap = np.arange(len(vertices))
+        remap[remove[applied]] = keep[applied]
+
+        moved   = remap[triangles]
+        changed = np.any(moved != triangles, axis=1)
+        changed &= (moved[:, 0] != moved[:, 1]) & (moved[:, 1] != moved[:, 2]) & (moved[:, 0] != moved[:, 2])
+
+        before, _ = MeshSimplifier.planes(vertices, triangles[changed])
+        after,  _ = MeshSimplifier.planes(vertices, moved[changed])
+        turns.append(np.sum(before[:, :3] * after[:, :3], axis=1))
+
+        return accepted
+
+    monkeypatch.setattr(MeshSimplifier, "rejectFlips", staticmethod(checkedRejectFlips))
+    assert MeshSimplifier.levels(mesh.vertices, mesh.indices)
+
+    turns = np.concatenate(turns)
+    assert len(turns) and turns.min() >= Settings.LOD.MIN_NORMAL_DOT
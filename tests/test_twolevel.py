@@ -0,0 +1,90 @@
+import numpy as np
+from os import path
+
+from Acceleration.twolevel import TwoLevelBVH
+from Buffers.packer import ScenePacker
+from MeshLoaders.cache import MeshCache
+from instance import Instance
+from mesh import Mesh
+
+MESHES = path.join(path.dirname(path.dirname(path.abspath(__file__))), "Meshes")
+
+def randomRays(accel: TwoLevelBVH, count: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    # Origins Around and Inside the Scene Bounds, Aimed at Points Inside Them
+    rng = np.random.default_rng(seed)
+    boundsMin, boundsMax = accel.top.nodes[0]["boundsMin"], accel.top.nodes[0]["boundsMax"]
+    margin = (boundsMax - boundsMin) * 0.25
+
+    origins = rng.uniform(boundsMin - margin, boundsMax + margin, (count, 3)).astype(np.float32)
+    targets = rng.uniform(boundsMin, boundsMax, (count, 3)).astype(np.float32)
+
+    directions = targets - origins
+    directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+    return origins, directions
+
+def instancedScene() -> TwoLevelBVH:
+    # Both Meshes Several Times Over, Rotated and Non-Uniformly Scaled
+    cache  = MeshCache(enabled=False)
+    meshes = [Mesh.create(path.join(MESHES, name), cache) for name in ("monkey.glb", "teapot.glb")]
+
+    instances = []
+    for i in range(8):
+        mesh = meshes[i % 2]
+        instances.append(Instance(mesh, ((i % 4) * 3.0 - 4.5, (i // 4) * 2.5, 0.5 * i), (i * 17.0, i * 31.0, i * 7.0), (1.0 + 0.1 * i, 1.0, 0.8)))
+
+    return TwoLevelBVH(ScenePacker(meshes), instances=instances)
+
+def testInstancedTraversalMatchesBruteForce() -> None:
+    accel = instancedScene()
+
+    origins, directions = randomRays(accel, 400, seed=11)
+    assert accel.verify(origins, directions) == 0
+
+def testMovedInstancesMatchBruteForce() -> None:
+    accel = instancedScene()
+
+    for i, instance in enumerate(accel.instances):
+        instance.setTransform(position=(i * 1.5, -i * 0.5, i * 2.0), rotation=(90.0, i * 45.0, 0.0), scale=(0.5, 2.0, 1.0))
+    accel.removeInstance(accel.instances[3])
+
+    assert accel.update()
+
+    origins, directions = randomRays(accel, 300, seed=13)
+    assert accel.verify(origins, directions) == 0
+
+def testExtendedKeepsEarlierDataAndTraverses() -> None:
+    # What Streaming Relies On: Appending a Batch Never Moves or Changes What Was Already Packed
+    accel = instancedScene()
+    first = TwoLevelBVH(ScenePacker(accel.scene.meshes[:1]), accel.blases[:1], lodBlases=accel.lodBlases[:1])
+
+    scene    = first.scene.extended(accel.scene.meshes[1:])
+    extended = first.extended(scene, accel.blases[1:], accel.lodBlases[1:])
+
+    assert len(first.scene.meshes) == 1 and len(first.blases) == 1
+    for before, after in ((first.scene.vertices, scene.vertices), (first.nodes, extended.nodes), (first.indices, extended.indices)):
+        assert after[:len(before)].tobytes() == before.tobytes()
+
+    for instance in accel.instances:  extended.addInstance(instance)
+    assert extended.update()
+
+    origins, directions = randomRays(extended, 300, seed=29)
+    assert extended.verify(origins, directions) == 0
+
+def testEmptySceneMisses() -> None:
+    accel = TwoLevelBVH(ScenePacker([]))
+
+    t, instance, triangle = accel.intersect(np.zeros(3, dtype=np.float32), np.array([0.0, 0.0, -1.0], dtype=np.float32))
+    assert accel.empty and triangle == -1 and not np.isfinite(t)
+
+def testResetLevelsReturnsToFullDetail() -> None:
+    accel = instancedScene()
+    fullTriangles = accel.activeTriangles
+
+    # Far Enough Away That Every Instance Drops to a Coarser Level
+    assert accel.selectLOD((0.0, 0.0, 1000.0), 60.0)
+    assert accel.activeTriangles < fullTriangles
+
+    accel.resetLevels()
+    assert accel.activeTriangles == fullTriangles
+    assert not any(accel.levels.values())
+    assert np.array_equal(accel.instanceData["rootNode"][:accel.instanceCount], accel.rootNodes[accel.instanceData["meshIndex"][:accel.instanceCount]])